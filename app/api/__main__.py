@@ -0,0 +1,35 @@
+"""Run the read-only JSON API.
+
+From the project root:
+    python -m app.api [--host 127.0.0.1] [--port 8600]
+"""
+
+import argparse
+import asyncio
+
+from streamlit import config as st_config
+from streamlit import logger as st_logger
+
+# the cached repositories warn on every call that no Streamlit runtime is
+# running; reading the config first stops it resetting the level later
+st_config.set_option("logger.level", "error")
+st_logger.set_log_level("error")
+
+from app.api.asgi import app
+from app.api.server import serve
+
+
+def main():
+    parser = argparse.ArgumentParser(description="FrayerStore read-only JSON API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8600)
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(serve(app, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,351 @@
+"""Read-only JSON API as an ASGI application.
+
+Routes:
+    GET /api/courses
+    GET /api/search?q=<text>[&subject=<slug>][&level=<slug>]
+    GET /api/subjects/<subject>/words/<word>
+    GET /api/words?w=<subject>/<word>&w=<subject>/<word>...
+    GET /api/subjects/<subject>/courses/<course>/glossary
+        [?letter=<A-Z or #>][&offset=<n>][&limit=<n>]
+    GET /api/subjects/<subject>/courses/<course>/topics/<code>/glossary
+
+Every response is derived from the database alone, so the database version
+(see get_db_version) is the ETag of every URL. The handlers therefore call
+the repositories without their st.cache_data layer (via __wrapped__), whose
+entries outlive an import by up to an hour. A request whose If-None-Match
+matches gets a 304 before any repository is called, and a repeat request
+after a miss is served from ResponseCache as ready-made JSON bytes. Both are
+invalidated by the next import, since that changes the version.
+
+Serve it with the stdlib server in app.api.server (`python -m app.api`) or
+with any ASGI server, e.g. `uvicorn app.api.asgi:app`.
+"""
+
+import asyncio
+import json
+import logging
+import re
+import threading
+from collections import OrderedDict
+from urllib.parse import parse_qs, unquote
+
+from app.api import serializers
+from app.core.db import get_db_version
+from app.core.repositories.courses_repo import get_courses
+from app.core.repositories.levels_repo import get_all_levels
+from app.core.repositories.subjects_repo import get_all_subjects
+from app.core.repositories.topics_repo import get_topics_for_course
+from app.core.repositories.words_repo import (
+    get_course_letter_counts,
+    get_word_versions_for_course,
+    get_word_versions_for_topic,
+    get_words_full_bulk,
+)
+from app.services.search.search_models import SearchFilters
+from app.services.search.search_service import search_words
+
+# Rendered responses kept in memory
+RESPONSE_CACHE_SIZE = 1024
+# Words one /api/words request may ask for
+MAX_BATCH_WORDS = 200
+CACHE_CONTROL = "public, no-cache"
+
+log = logging.getLogger(__name__)
+
+
+class HTTPError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+# ================================================================
+# Handlers
+# ================================================================
+# Each takes the path parameters and the parsed query string and returns
+# something json.dumps can encode. They run in a worker thread.
+
+
+def _find_course(subject_slug: str, course_slug: str):
+    for course in get_courses.__wrapped__():
+        if course.subject.slug == subject_slug and course.slug == course_slug:
+            return course
+    raise HTTPError(404, f"No course '{course_slug}' in subject '{subject_slug}'")
+
+
+def list_courses(params, query):
+    return [serializers.course_to_dict(c) for c in get_courses.__wrapped__()]
+
+
+def search(params, query):
+    text = query.get("q", [""])[0].strip()
+    if not text:
+        raise HTTPError(400, "Missing search text: ?q=")
+
+    filters = SearchFilters()
+    if "subject" in query:
+        slug = query["subject"][0]
+        filters.subject = next((s for s in get_all_subjects() if s.slug == slug), None)
+        if filters.subject is None:
+            raise HTTPError(404, f"No subject '{slug}'")
+    if "level" in query:
+        slug = query["level"][0].lower()
+        filters.level = next((l for l in get_all_levels() if l.slug == slug), None)
+        if filters.level is None:
+            raise HTTPError(404, f"No level '{slug}'")
+
+    hits = search_words(text, filters)
+    return {
+        "query": text,
+        "results": [serializers.search_hit_to_dict(h) for h in hits],
+    }
+
+
+def word_by_slug(params, query):
+    key = (params["subject"], params["word"])
+    word = get_words_full_bulk([key]).get(key)
+    if word is None:
+        raise HTTPError(
+            404, f"No word '{params['word']}' in subject '{params['subject']}'"
+        )
+    return serializers.word_to_dict(word)
+
+
+def words_batch(params, query):
+    requested = query.get("w", [])
+    if not requested:
+        raise HTTPError(400, "Missing words: ?w=<subject>/<word>&w=...")
+    if len(requested) > MAX_BATCH_WORDS:
+        raise HTTPError(400, f"At most {MAX_BATCH_WORDS} words per request")
+
+    slugs = []
+    for item in requested:
+        subject_slug, _, word_slug = item.partition("/")
+        if not subject_slug or not word_slug:
+            raise HTTPError(400, f"Expected <subject>/<word>, got '{item}'")
+        slugs.append((subject_slug, word_slug))
+
+    words = get_words_full_bulk(slugs)
+    return {
+        "words": [serializers.word_to_dict(words[s]) for s in slugs if s in words],
+        "missing": [f"{s[0]}/{s[1]}" for s in slugs if s not in words],
+    }
+
+
+def _int_param(query, name: str, default: int | None) -> int | None:
+    if name not in query:
+        return default
+    value = query[name][0]
+    if not value.isdigit():
+        raise HTTPError(400, f"'{name}' must be a non-negative integer")
+    return int(value)
+
+
+def course_glossary(params, query):
+    course = _find_course(params["subject"], params["course"])
+    counts = get_course_letter_counts(course)
+
+    letter = query.get("letter", [None])[0]
+    if letter is not None:
+        letter = letter.upper()
+        if letter != "#" and not (len(letter) == 1 and "A" <= letter <= "Z"):
+            raise HTTPError(400, "'letter' must be one of A-Z or #")
+    offset = _int_param(query, "offset", 0)
+    limit = _int_param(query, "limit", None)
+
+    versions = get_word_versions_for_course(course, letter, offset, limit)
+    return {
+        "course": serializers.course_to_dict(course),
+        "letters": counts,
+        "words": [serializers.word_version_to_dict(v) for v in sorted(versions)],
+    }
+
+
+def topic_glossary(params, query):
+    course = _find_course(params["subject"], params["course"])
+    topic = next(
+        (
+            t
+            for t in get_topics_for_course.__wrapped__(course)
+            if t.code == params["code"]
+        ),
+        None,
+    )
+    if topic is None:
+        raise HTTPError(404, f"No topic '{params['code']}' in course '{course.slug}'")
+    versions = sorted(get_word_versions_for_topic(topic))
+    return {
+        "course": serializers.course_to_dict(course),
+        "topic": serializers.topic_to_dict(topic),
+        "words": [serializers.word_version_to_dict(v) for v in versions],
+    }
+
+
+ROUTES = [
+    (re.compile(r"^/api/courses/?$"), list_courses),
+    (re.compile(r"^/api/search/?$"), search),
+    (re.compile(r"^/api/words/?$"), words_batch),
+    (
+        re.compile(r"^/api/subjects/(?P<subject>[^/]+)/words/(?P<word>[^/]+)/?$"),
+        word_by_slug,
+    ),
+    (
+        re.compile(
+            r"^/api/subjects/(?P<subject>[^/]+)/courses/(?P<course>[^/]+)/glossary/?$"
+        ),
+        course_glossary,
+    ),
+    (
+        re.compile(
+            r"^/api/subjects/(?P<subject>[^/]+)/courses/(?P<course>[^/]+)"
+            r"/topics/(?P<code>[^/]+)/glossary/?$"
+        ),
+        topic_glossary,
+    ),
+]
+
+
+def resolve(path: str):
+    for pattern, handler in ROUTES:
+        match = pattern.match(path)
+        if match:
+            return handler, {k: unquote(v) for k, v in match.groupdict().items()}
+    raise HTTPError(404, f"No route for {path}")
+
+
+# ================================================================
+# Response cache
+# ================================================================
+
+
+class ResponseCache:
+    """Encoded JSON bodies per URL, valid for one database version."""
+
+    def __init__(self, max_entries: int = RESPONSE_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[str, bytes]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str, db_version: str) -> bytes | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != db_version:
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, key: str, db_version: str, body: bytes) -> None:
+        with self._lock:
+            self._entries[key] = (db_version, body)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+response_cache = ResponseCache()
+
+
+def _encode(data) -> bytes:
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def _etag(db_version: str) -> str:
+    return f'"{db_version}"'
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    tags = [t.strip() for t in if_none_match.split(",")]
+    # weak validators compare equal for GET
+    return "*" in tags or etag in tags or f"W/{etag}" in tags
+
+
+async def handle(
+    method: str, path: str, query_string: str, if_none_match: str | None
+):
+    """Answer one request.
+
+    Revalidations and cached responses are answered on the event loop; only a
+    miss runs the (synchronous) repositories, in a worker thread.
+
+    Returns:
+        (status, headers, body)
+    """
+    if method not in ("GET", "HEAD"):
+        raise HTTPError(405, f"{method} is not allowed; the API is read-only")
+
+    handler, params = resolve(path)
+    db_version = get_db_version()
+    etag = _etag(db_version)
+    headers = [("etag", etag), ("cache-control", CACHE_CONTROL)]
+
+    if _etag_matches(if_none_match, etag):
+        return 304, headers, b""
+
+    key = f"{path}?{query_string}"
+    body = response_cache.get(key, db_version)
+    if body is None:
+        data = await asyncio.to_thread(handler, params, parse_qs(query_string))
+        body = _encode(data)
+        response_cache.put(key, db_version, body)
+    return 200, headers, body
+
+
+# ================================================================
+# ASGI
+# ================================================================
+
+
+async def app(scope, receive, send):
+    if scope["type"] == "lifespan":
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+    if scope["type"] != "http":
+        return
+
+    request_headers = {k.decode().lower(): v.decode() for k, v in scope["headers"]}
+    method = scope["method"]
+    try:
+        status, headers, body = await handle(
+            method,
+            scope["path"],
+            scope.get("query_string", b"").decode(),
+            request_headers.get("if-none-match"),
+        )
+    except HTTPError as e:
+        status, headers, body = e.status, [], _encode({"error": e.message})
+        if e.status == 405:
+            headers.append(("allow", "GET, HEAD"))
+    except Exception:
+        # e.g. sqlite3.OperationalError while `importer build` swaps the file;
+        # the client still gets a response rather than a dropped connection
+        log.exception("Error handling %s %s", method, scope["path"])
+        status, headers, body = 500, [], _encode({"error": "Internal server error"})
+
+    headers = [("content-type", "application/json; charset=utf-8"), *headers]
+    if status != 304:
+        headers.append(("content-length", str(len(body))))
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status,
+            "headers": [(k.encode(), v.encode()) for k, v in headers],
+        }
+    )
+    await send(
+        {
+            "type": "http.response.body",
+            "body": b"" if method == "HEAD" or status == 304 else body,
+        }
+    )
@@ -0,0 +1,84 @@
+"""Convert the core models to plain JSON-ready dicts for the API."""
+
+from app.core.models.course_model import Course
+from app.core.models.level_model import Level
+from app.core.models.subject_model import Subject
+from app.core.models.topic_model import Topic
+from app.core.models.word_models import RelatedWord, Word, WordVersion
+from app.services.search.search_models import SearchHit
+
+
+def subject_to_dict(subject: Subject) -> dict:
+    return {"name": subject.name, "slug": subject.slug}
+
+
+def level_to_dict(level: Level) -> dict:
+    return {"name": level.name, "slug": level.slug, "description": level.description}
+
+
+def course_to_dict(course: Course) -> dict:
+    return {
+        "name": course.name,
+        "slug": course.slug,
+        "subject": subject_to_dict(course.subject),
+        "level": level_to_dict(course.level) if course.level else None,
+    }
+
+
+def topic_to_dict(topic: Topic) -> dict:
+    return {
+        "code": topic.code,
+        "name": topic.name,
+        "course": topic.course.slug,
+        "subject": topic.course.subject.slug,
+    }
+
+
+def word_version_to_dict(version: WordVersion) -> dict:
+    return {
+        "id": version.pk,
+        "word": version.word,
+        "word_slug": version.word_slug,
+        "subject": version.subject_slug,
+        "levels": [level.name for level in version.levels],
+        "definition": version.definition,
+        "characteristics": version.characteristics,
+        "examples": version.examples,
+        "non_examples": version.non_examples,
+        "topics": [topic_to_dict(topic) for topic in version.topics],
+        "url": version.url,
+    }
+
+
+def related_word_to_dict(related: RelatedWord) -> dict:
+    return {
+        "word": related.word,
+        "slug": related.slug,
+        "subject": related.subject_slug,
+    }
+
+
+def word_to_dict(word: Word) -> dict:
+    return {
+        "id": word.pk,
+        "word": word.word,
+        "slug": word.slug,
+        "subject": subject_to_dict(word.subject),
+        "synonyms": sorted(word.synonyms),
+        "versions": [word_version_to_dict(v) for v in word.versions],
+        "related_words": [related_word_to_dict(r) for r in word.related_words],
+        "url": word.url,
+    }
+
+
+def search_hit_to_dict(hit: SearchHit) -> dict:
+    return {
+        "word": hit.word,
+        "word_slug": hit.word_slug,
+        "subject": hit.subject_slug,
+        "version_id": hit.version_id,
+        "definition": hit.version_definition,
+        "levels": hit.level_names,
+        "synonyms": hit.synonyms,
+        "matched_token": hit.matched_token,
+    }
@@ -0,0 +1,112 @@
+"""A small HTTP/1.1 server on asyncio streams that drives an ASGI app.
+
+It exists so the API runs with the standard library alone. It handles what
+a read-only JSON API needs (GET/HEAD, keep-alive, no request bodies) and
+nothing more; put a reverse proxy in front of it for TLS and compression.
+"""
+
+import asyncio
+import logging
+from http import HTTPStatus
+from urllib.parse import unquote
+
+log = logging.getLogger(__name__)
+
+# Limits on what a client may send
+MAX_REQUEST_LINE = 8192
+MAX_HEADERS = 100
+KEEP_ALIVE_TIMEOUT = 15
+
+
+async def _read_request(reader: asyncio.StreamReader):
+    """Parse one request head. Returns None when the client has gone."""
+    try:
+        line = await asyncio.wait_for(reader.readline(), KEEP_ALIVE_TIMEOUT)
+    except asyncio.TimeoutError:
+        return None
+    if not line:
+        return None
+    if len(line) > MAX_REQUEST_LINE:
+        raise ValueError("request line too long")
+
+    method, target, version = line.decode("latin-1").split()
+    headers = []
+    while True:
+        header = await reader.readline()
+        if header in (b"\r\n", b"\n", b""):
+            break
+        if len(headers) >= MAX_HEADERS:
+            raise ValueError("too many headers")
+        name, _, value = header.decode("latin-1").partition(":")
+        headers.append((name.strip().lower().encode(), value.strip().encode()))
+
+    path, _, query = target.partition("?")
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0", "spec_version": "2.3"},
+        "http_version": version.removeprefix("HTTP/"),
+        "method": method.upper(),
+        "scheme": "http",
+        "path": unquote(path),
+        "raw_path": path.encode(),
+        "query_string": query.encode(),
+        "headers": headers,
+    }
+
+
+def _keep_alive(scope) -> bool:
+    connection = dict(scope["headers"]).get(b"connection", b"").lower()
+    if scope["http_version"] == "1.0":
+        return connection == b"keep-alive"
+    return connection != b"close"
+
+
+async def _respond(app, scope, writer: asyncio.StreamWriter, keep_alive: bool):
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            status = message["status"]
+            head = [f"HTTP/1.1 {status} {HTTPStatus(status).phrase}"]
+            for name, value in message.get("headers", []):
+                head.append(f"{name.decode()}: {value.decode()}")
+            head.append(f"connection: {'keep-alive' if keep_alive else 'close'}")
+            writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1"))
+        elif message["type"] == "http.response.body":
+            writer.write(message.get("body", b""))
+            await writer.drain()
+
+    await app(scope, receive, send)
+
+
+async def _serve_connection(app, reader, writer) -> None:
+    try:
+        while True:
+            try:
+                scope = await _read_request(reader)
+            except ValueError:
+                writer.write(b"HTTP/1.1 400 Bad Request\r\nconnection: close\r\n\r\n")
+                break
+            if scope is None:
+                break
+            keep_alive = _keep_alive(scope)
+            await _respond(app, scope, writer, keep_alive)
+            if not keep_alive:
+                break
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    except Exception:
+        log.exception("Error while serving a request")
+    finally:
+        writer.close()
+
+
+async def serve(app, host: str, port: int) -> None:
+    server = await asyncio.start_server(
+        lambda r, w: _serve_connection(app, r, w), host, port
+    )
+    address = ", ".join(str(s.getsockname()) for s in server.sockets)
+    print(f"✓ FrayerStore API listening on {address}")
+    async with server:
+        await server.serve_forever()
@@ -6,6 +6,9 @@ import os
 # Add the parent directory of 'app' to the Python path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
+from app.core.page_timing import time_page_run
+from app.core.profiling import capture, render_profile, requested_profiler
+
 # Base directory for all Streamlit pages
 # Always relative to this file’s directory
 PAGES_DIR = Path(__file__).resolve().parent / "ui/pages"
@@ -39,9 +42,25 @@ pages = {
     ],
     "Utilities": [
         st.Page(PAGES_DIR / "model_maker.py", title="Model Maker", icon="🛠️"),
+        # reachable at /diagnostics but not listed in the navigation
+        st.Page(
+            PAGES_DIR / "diagnostics.py",
+            title="Diagnostics",
+            icon="🩺",
+            url_path="diagnostics",
+            visibility="hidden",
+        ),
     ],
 }
 
 pg = st.navigation(pages)
 st.set_page_config(page_title="FrayerStore", layout="wide", page_icon="📖")
-pg.run()
+
+profiler = requested_profiler()
+with time_page_run(pg.title):
+    if profiler is None:
+        pg.run()
+    else:
+        with capture(profiler) as profile:
+            pg.run()
+        render_profile(profile)
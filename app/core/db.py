@@ -3,21 +3,69 @@ import sqlite3
 import streamlit as st
 import datetime
 
-# Resolve path to app/db/Words.db
-DB_PATH = os.path.join(
+from app.core import page_timing, sql_stats
+from importer.migrate import apply_migrations
+
+DB_PATH_ENV_VAR = "FRAYERSTORE_DB_PATH"
+
+# Resolve path to app/db/Words.db, unless another database is given (e.g. by
+# the benchmarks)
+DB_PATH = os.environ.get(DB_PATH_ENV_VAR) or os.path.join(
     os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
     "db",
     "Words.db",
 )
 
 
-@st.cache_resource(ttl=datetime.timedelta(hours=1))
+@st.cache_resource(max_entries=2)
+def _ensure_schema(db_version: str) -> None:
+    """Apply pending migrations once per database version."""
+    conn = sqlite3.connect(DB_PATH)
+    try:
+        apply_migrations(conn)
+    except sqlite3.OperationalError:
+        # e.g. a read-only deployment: serve the schema as it is
+        pass
+    finally:
+        conn.close()
+
+
+@st.cache_resource(ttl=datetime.timedelta(hours=1), max_entries=2)
+def _connect(db_version: str) -> sqlite3.Connection:
+    # page timing needs the SQL share of each run, so it instruments too
+    instrumented = sql_stats.is_enabled() or page_timing.is_enabled()
+    factory = (
+        sql_stats.InstrumentedConnection if instrumented else sqlite3.Connection
+    )
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False, factory=factory)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
 def get_db() -> sqlite3.Connection:
     """Open a cached connection to the database
 
+    The connection is cached per database version, so once `importer build`
+    has swapped a new file into place the next call opens that file rather
+    than reading the replaced one. Migrating changes the version too, so the
+    schema is brought up to date before the version is read for the
+    connection.
+
     Returns:
         A connection object to the application's SQLite database.
     """
-    conn = sqlite3.connect(DB_PATH, check_same_thread=False)
-    conn.row_factory = sqlite3.Row
-    return conn
+    _ensure_schema(get_db_version())
+    return _connect(get_db_version())
+
+
+def get_db_version() -> str:
+    """Return a token that changes whenever the database file is rewritten
+
+    Pass this to cached functions as an argument so their results are
+    invalidated by an import rather than by a timer.
+
+    Returns:
+        The database file's modification time and size.
+    """
+    stat = os.stat(DB_PATH)
+    return f"{stat.st_mtime_ns}-{stat.st_size}"
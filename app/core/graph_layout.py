@@ -0,0 +1,284 @@
+"""Graph algorithms behind the Relationship Graph, free of any UI imports.
+
+The page builds and draws graphs with these; the importer uses the same
+functions to precompute each course's layout (importer.graph_layouts).
+"""
+
+import math
+
+import numpy as np
+
+# Ideal distance between connected words, in vis.js canvas pixels
+EDGE_LENGTH = 150
+# Gap left between packed components
+COMPONENT_GAP = 1.5 * EDGE_LENGTH
+# Rows of the repulsion matrix processed at once, bounding memory per step
+CHUNK_SIZE = 512
+# Components larger than this use grid-approximated repulsion
+EXACT_REPULSION_LIMIT = 400
+# Average number of nodes per grid cell for the approximation
+NODES_PER_CELL = 8
+
+
+def edge_ordinals(word_ids: np.ndarray, a: np.ndarray, b: np.ndarray):
+    """Map edge endpoints to dense node ordinals.
+
+    Returns:
+        (a_idx, b_idx) for the edges whose endpoints are both in word_ids.
+    """
+    if len(word_ids) == 0:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty
+
+    order = np.argsort(word_ids, kind="stable")
+    sorted_ids = word_ids[order]
+
+    def lookup(ids):
+        pos = np.minimum(np.searchsorted(sorted_ids, ids), len(sorted_ids) - 1)
+        return order[pos], sorted_ids[pos] == ids
+
+    a_idx, a_found = lookup(a)
+    b_idx, b_found = lookup(b)
+    keep = a_found & b_found
+    return a_idx[keep], b_idx[keep]
+
+
+def connected_components(n: int, a_idx: np.ndarray, b_idx: np.ndarray) -> np.ndarray:
+    """Label connected components with a vectorised union-find.
+
+    Each node starts as its own root; roots are repeatedly hooked onto the
+    smaller root across every edge, then paths are compressed by pointer
+    jumping until nothing changes.
+
+    Returns:
+        Array of component ids (0..k-1), numbered by each component's first node.
+    """
+    parent = np.arange(n)
+    if len(a_idx) == 0:
+        return parent
+
+    while True:
+        ra = parent[a_idx]
+        rb = parent[b_idx]
+        lo = np.minimum(ra, rb)
+        hi = np.maximum(ra, rb)
+        merging = lo != hi
+        if not merging.any():
+            break
+        np.minimum.at(parent, hi[merging], lo[merging])
+        # pointer jumping until every node points directly at its root
+        while True:
+            grand = parent[parent]
+            if np.array_equal(grand, parent):
+                break
+            parent = grand
+
+    _, comp_ids = np.unique(parent, return_inverse=True)
+    return comp_ids
+
+
+def _repulsion(pos: np.ndarray, k: float) -> np.ndarray:
+    """Fruchterman-Reingold repulsive displacement for every node."""
+    disp = np.zeros_like(pos)
+    for start in range(0, len(pos), CHUNK_SIZE):
+        block = pos[start : start + CHUNK_SIZE]
+        delta = block[:, None, :] - pos[None, :, :]
+        dist2 = np.maximum((delta**2).sum(axis=-1), 1e-4)
+        # a node does not repel itself
+        rows = np.arange(len(block))
+        dist2[rows, rows + start] = np.inf
+        disp[start : start + len(block)] = (delta * (k * k / dist2)[..., None]).sum(
+            axis=1
+        )
+    return disp
+
+
+def _grid_repulsion(pos: np.ndarray, k: float) -> np.ndarray:
+    """Approximate repulsion by treating distant grid cells as one heavy node.
+
+    Nodes are binned into a grid whose row and column boundaries are
+    quantiles of the positions, so outliers cannot squeeze most nodes into
+    one cell. Nodes in the same or an adjacent cell repel each other
+    exactly; more distant cells act through their centre of mass, weighted
+    by how many nodes they hold. Cost is O(n + cells²) rather than O(n²).
+    """
+    n = len(pos)
+    side = max(1, math.ceil(math.sqrt(n / NODES_PER_CELL)))
+    quantiles = np.linspace(0, 1, side + 1)[1:-1]
+    cell_xy = np.column_stack(
+        [
+            np.searchsorted(np.quantile(pos[:, axis], quantiles), pos[:, axis])
+            for axis in (0, 1)
+        ]
+    )
+    cell = cell_xy[:, 0] * side + cell_xy[:, 1]
+
+    mass = np.bincount(cell, minlength=side * side)
+    sums = np.column_stack(
+        [
+            np.bincount(cell, weights=pos[:, 0], minlength=side * side),
+            np.bincount(cell, weights=pos[:, 1], minlength=side * side),
+        ]
+    )
+    centres = sums / np.maximum(mass, 1)[:, None]
+
+    def push(delta, weight):
+        dist2 = np.maximum((delta**2).sum(axis=-1), 1e-4)
+        return delta * (weight * k * k / dist2)[..., None]
+
+    # far field, computed once per cell: every other occupied cell acts as
+    # a single weighted node on the cell's centre of mass
+    occupied = np.flatnonzero(mass)
+    far = np.zeros((side * side, 2))
+    for start in range(0, len(occupied), CHUNK_SIZE):
+        block = occupied[start : start + CHUNK_SIZE]
+        delta = centres[block][:, None, :] - centres[occupied][None, :, :]
+        far[block] = push(delta, mass[occupied][None, :]).sum(axis=1)
+
+    # near field: swap the 3x3 neighbourhood's approximation for exact pairs
+    occupied_xy = np.column_stack(np.divmod(occupied, side))
+    order = np.argsort(cell, kind="stable")
+    first = np.searchsorted(cell[order], np.arange(side * side))
+    exact = np.zeros_like(pos)
+    for dx in (-1, 0, 1):
+        for dy in (-1, 0, 1):
+            nxy = occupied_xy + (dx, dy)
+            valid = ((nxy >= 0) & (nxy < side)).all(axis=1)
+            src = occupied[valid]
+            nb = nxy[valid, 0] * side + nxy[valid, 1]
+            far[src] -= push(centres[src] - centres[nb], mass[nb])
+
+            nxy = cell_xy + (dx, dy)
+            valid = ((nxy >= 0) & (nxy < side)).all(axis=1)
+            i = np.flatnonzero(valid)
+            nb = nxy[i, 0] * side + nxy[i, 1]
+            counts = mass[nb]
+            ii = np.repeat(i, counts)
+            within = np.arange(counts.sum()) - np.repeat(
+                np.cumsum(counts) - counts, counts
+            )
+            jj = order[np.repeat(first[nb], counts) + within]
+            keep = ii != jj
+            force = push(pos[ii[keep]] - pos[jj[keep]], 1.0)
+            exact[:, 0] += np.bincount(ii[keep], weights=force[:, 0], minlength=n)
+            exact[:, 1] += np.bincount(ii[keep], weights=force[:, 1], minlength=n)
+
+    disp = far[cell] + exact
+    return disp
+
+
+def force_layout(
+    n: int, a_idx: np.ndarray, b_idx: np.ndarray, iterations: int = 60
+) -> np.ndarray:
+    """Lay out a single connected component.
+
+    A vectorised Fruchterman-Reingold simulation started from a fixed
+    sunflower spiral, so the same component always produces the same
+    positions.
+
+    Returns:
+        (n, 2) array of positions with unit ideal edge length.
+    """
+    if n == 1:
+        return np.zeros((1, 2))
+
+    # evenly filled disc: keeps grid cells balanced for _grid_repulsion
+    golden_angle = math.pi * (3 - math.sqrt(5))
+    idx = np.arange(n)
+    r = np.sqrt(idx + 0.5)
+    pos = np.column_stack([np.cos(idx * golden_angle), np.sin(idx * golden_angle)])
+    pos *= r[:, None]
+    radius = math.sqrt(n)
+
+    k = 1.0
+    temperature = radius / 2
+    cooling = temperature / (iterations + 1)
+
+    repulsion = _repulsion if n <= EXACT_REPULSION_LIMIT else _grid_repulsion
+
+    for _ in range(iterations):
+        disp = repulsion(pos, k)
+
+        delta = pos[a_idx] - pos[b_idx]
+        dist = np.maximum(np.linalg.norm(delta, axis=1), 1e-2)
+        pull = delta * (dist / k)[:, None]
+        np.add.at(disp, a_idx, -pull)
+        np.add.at(disp, b_idx, pull)
+
+        length = np.maximum(np.linalg.norm(disp, axis=1), 1e-9)
+        step = np.minimum(length, temperature)
+        pos += disp / length[:, None] * step[:, None]
+        temperature -= cooling
+
+    return pos - pos.mean(axis=0)
+
+
+def grid_layout(n: int) -> np.ndarray:
+    """Place n unconnected nodes on a square grid with unit spacing."""
+    cols = max(1, math.ceil(math.sqrt(n)))
+    idx = np.arange(n)
+    return np.column_stack([idx % cols, idx // cols]).astype(float)
+
+
+def layout_graph(
+    n: int, a_idx: np.ndarray, b_idx: np.ndarray, components: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Compute fixed x/y canvas positions for every node.
+
+    Each connected component is laid out on its own, then the components
+    are packed into rows (largest first) with unconnected words gathered in
+    a grid at the end.
+
+    Returns:
+        (x, y) integer pixel coordinates indexed by node ordinal.
+    """
+    positions = np.zeros((n, 2))
+    if n == 0:
+        return positions[:, 0].astype(int), positions[:, 1].astype(int)
+
+    # local ordinals within each component
+    order = np.argsort(components, kind="stable")
+    counts = np.bincount(components)
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    local = np.empty(n, dtype=np.int64)
+    local[order] = np.arange(n) - np.repeat(starts, counts)
+    edge_comp = components[a_idx]
+
+    blocks = []  # (members, positions) in canvas units
+    for comp in np.argsort(-counts, kind="stable"):
+        if counts[comp] == 1:
+            continue
+        members = order[starts[comp] : starts[comp] + counts[comp]]
+        in_comp = edge_comp == comp
+        pos = force_layout(
+            counts[comp], local[a_idx[in_comp]], local[b_idx[in_comp]]
+        )
+        blocks.append((members, pos * EDGE_LENGTH))
+
+    singletons = np.flatnonzero(counts[components] == 1)
+    if len(singletons):
+        blocks.append((singletons, grid_layout(len(singletons)) * EDGE_LENGTH))
+
+    # shelf-pack blocks into rows roughly as wide as the whole layout is tall
+    total_area = sum(
+        np.ptp(pos[:, 0]) * np.ptp(pos[:, 1]) + EDGE_LENGTH**2 for _, pos in blocks
+    )
+    row_width = max(math.sqrt(total_area) * 1.5, EDGE_LENGTH)
+
+    cursor_x = cursor_y = row_height = 0.0
+    for members, pos in blocks:
+        pos = pos - pos.min(axis=0)
+        width, height = pos.max(axis=0)
+        if cursor_x > 0 and cursor_x + width > row_width:
+            cursor_x = 0.0
+            cursor_y += row_height + COMPONENT_GAP
+            row_height = 0.0
+        positions[members] = pos + (cursor_x, cursor_y)
+        cursor_x += width + COMPONENT_GAP
+        row_height = max(row_height, height)
+
+    positions -= positions.mean(axis=0)
+    return (
+        np.rint(positions[:, 0]).astype(int),
+        np.rint(positions[:, 1]).astype(int),
+    )
@@ -110,6 +110,20 @@ class WordVersion:
             return []
 
 
+@dataclass
+class GlossaryEntry:
+    """One line of a glossary: enough to label it and load the version later."""
+
+    word_version_id: int
+    word: str
+
+    @property
+    def letter(self) -> str:
+        """The A–Z heading the entry is listed under, or '#'."""
+        first = self.word[:1].upper()
+        return first if "A" <= first <= "Z" else "#"
+
+
 class WordVersionChoice:
     def __init__(self, version: WordVersion):
         self.version = version
@@ -0,0 +1,163 @@
+"""Opt-in timing of every page run, split into SQL, cache misses and the rest.
+
+Set FRAYERSTORE_PAGE_TIMING=1 and app_main times each pg.run(). During a run:
+
+- SQL time is reported by the instrumented connection (see sql_stats),
+- cache-miss time is measured by timed_cache_miss, which sits *inside*
+  st.cache_data / st.cache_resource so it only runs when the cache misses,
+- everything else (building widgets, rendering, Python work) is "other".
+
+SQL executed inside a cache miss counts towards both SQL and the miss, so
+`other` subtracts it only once.
+"""
+
+import functools
+import os
+import statistics
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+ENV_VAR = "FRAYERSTORE_PAGE_TIMING"
+# Page runs kept for the diagnostics page
+HISTORY_SIZE = 500
+
+
+def is_enabled() -> bool:
+    return os.environ.get(ENV_VAR, "").lower() in ("1", "true", "yes")
+
+
+@dataclass
+class RunTiming:
+    page: str
+    started_at: float
+    total: float = 0.0
+    sql: float = 0.0
+    sql_in_misses: float = 0.0
+    cache_miss: float = 0.0
+    cache_misses: int = 0
+    # nested cached functions only count once, at the outermost miss
+    _miss_depth: int = 0
+
+    @property
+    def other(self) -> float:
+        return max(0.0, self.total - self.sql - (self.cache_miss - self.sql_in_misses))
+
+    def to_dict(self) -> dict:
+        return {
+            "page": self.page,
+            "started_at": self.started_at,
+            "total_ms": round(self.total * 1000, 3),
+            "sql_ms": round(self.sql * 1000, 3),
+            "cache_miss_ms": round(self.cache_miss * 1000, 3),
+            "cache_misses": self.cache_misses,
+            "other_ms": round(self.other * 1000, 3),
+        }
+
+
+# The script thread of each session has its own context, so runs in
+# different sessions never see each other's timings.
+_current: ContextVar[RunTiming | None] = ContextVar("page_run", default=None)
+_history: deque[RunTiming] = deque(maxlen=HISTORY_SIZE)
+_lock = threading.Lock()
+
+
+def add_sql_time(elapsed: float) -> None:
+    run = _current.get()
+    if run is None:
+        return
+    run.sql += elapsed
+    if run._miss_depth:
+        run.sql_in_misses += elapsed
+
+
+def timed_cache_miss(func):
+    """Attribute the body of a cached function to cache-miss time.
+
+    Place it under the caching decorator:
+
+        @st.cache_data
+        @timed_cache_miss
+        def get_courses(): ...
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        run = _current.get()
+        if run is None:
+            return func(*args, **kwargs)
+
+        run._miss_depth += 1
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            run._miss_depth -= 1
+            if run._miss_depth == 0:
+                run.cache_miss += time.perf_counter() - start
+                run.cache_misses += 1
+
+    return wrapper
+
+
+@contextmanager
+def time_page_run(page: str):
+    """Time one page run. Does nothing unless timing is enabled."""
+    if not is_enabled():
+        yield None
+        return
+
+    run = RunTiming(page=page, started_at=time.time())
+    token = _current.set(run)
+    start = time.perf_counter()
+    try:
+        yield run
+    finally:
+        run.total = time.perf_counter() - start
+        _current.reset(token)
+        with _lock:
+            _history.append(run)
+
+
+def recent_runs() -> list[dict]:
+    """Most recent page runs first."""
+    with _lock:
+        runs = list(_history)
+    return [run.to_dict() for run in reversed(runs)]
+
+
+def summary_by_page() -> list[dict]:
+    """Run count, mean and p95 total time, and mean breakdown per page."""
+    by_page: dict[str, list[RunTiming]] = {}
+    with _lock:
+        for run in _history:
+            by_page.setdefault(run.page, []).append(run)
+
+    summary = []
+    for page, runs in by_page.items():
+        totals = [r.total for r in runs]
+        p95 = statistics.quantiles(totals, n=20)[18] if len(totals) > 1 else totals[0]
+        summary.append(
+            {
+                "page": page,
+                "runs": len(runs),
+                "mean_ms": round(statistics.fmean(totals) * 1000, 3),
+                "p95_ms": round(p95 * 1000, 3),
+                "mean_sql_ms": round(statistics.fmean(r.sql for r in runs) * 1000, 3),
+                "mean_cache_miss_ms": round(
+                    statistics.fmean(r.cache_miss for r in runs) * 1000, 3
+                ),
+                "mean_other_ms": round(
+                    statistics.fmean(r.other for r in runs) * 1000, 3
+                ),
+            }
+        )
+    return sorted(summary, key=lambda s: s["mean_ms"], reverse=True)
+
+
+def reset() -> None:
+    with _lock:
+        _history.clear()
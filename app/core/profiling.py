@@ -0,0 +1,107 @@
+"""Profile a single rerun in production, triggered from the URL.
+
+With FRAYERSTORE_PROFILE_TOKEN set on the server, opening a page with
+?profile=<token> profiles that one run with cProfile and shows the report
+under the page. Add &profiler=pyinstrument to use pyinstrument instead, if
+it is installed. The parameter is removed afterwards, so later reruns are
+not profiled.
+"""
+
+import cProfile
+import hmac
+import io
+import marshal
+import os
+import pstats
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+import streamlit as st
+
+TOKEN_ENV_VAR = "FRAYERSTORE_PROFILE_TOKEN"
+PROFILE_PARAM = "profile"
+PROFILER_PARAM = "profiler"
+# Functions listed in the cProfile report
+REPORT_LINES = 40
+
+
+@dataclass
+class ProfileResult:
+    kind: str
+    text: str = ""
+    data: bytes = b""
+    file_name: str = ""
+    mime: str = "application/octet-stream"
+
+
+def requested_profiler() -> str | None:
+    """Return "cprofile" or "pyinstrument" if this run should be profiled.
+
+    The token is compared in constant time, and profiling is impossible when
+    no token is configured.
+    """
+    token = os.environ.get(TOKEN_ENV_VAR)
+    supplied = st.query_params.get(PROFILE_PARAM)
+    if not token or not supplied:
+        return None
+    if not hmac.compare_digest(token.encode(), supplied.encode()):
+        return None
+
+    # only this run is profiled
+    st.query_params.pop(PROFILE_PARAM, None)
+    kind = st.query_params.pop(PROFILER_PARAM, None) or "cprofile"
+    return "pyinstrument" if kind == "pyinstrument" else "cprofile"
+
+
+@contextmanager
+def capture(kind: str):
+    """Profile the enclosed block, filling in the yielded ProfileResult."""
+    result = ProfileResult(kind=kind)
+
+    if kind == "pyinstrument":
+        try:
+            from pyinstrument import Profiler
+        except ImportError:
+            result.kind = "cprofile"
+        else:
+            profiler = Profiler()
+            profiler.start()
+            try:
+                yield result
+            finally:
+                profiler.stop()
+                result.text = profiler.output_text(unicode=True)
+                result.data = profiler.output_html().encode()
+                result.file_name = "profile.html"
+                result.mime = "text/html"
+            return
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield result
+    finally:
+        profiler.disable()
+        out = io.StringIO()
+        stats = pstats.Stats(profiler, stream=out)
+        stats.sort_stats("cumulative").print_stats(REPORT_LINES)
+        result.text = out.getvalue()
+        result.data = _dump_stats(profiler)
+        result.file_name = "profile.prof"
+
+
+def _dump_stats(profiler: cProfile.Profile) -> bytes:
+    """The same bytes Profile.dump_stats() would write, without a temp file."""
+    profiler.create_stats()
+    return marshal.dumps(profiler.stats)
+
+
+def render_profile(result: ProfileResult) -> None:
+    with st.expander(f"Profile of this run ({result.kind})", expanded=True):
+        st.code(result.text, language=None)
+        st.download_button(
+            "Download profile",
+            data=result.data,
+            file_name=result.file_name,
+            mime=result.mime,
+        )
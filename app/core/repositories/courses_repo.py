@@ -4,9 +4,11 @@ from app.core.db import get_db
 from app.core.models.course_model import Course
 from app.core.models.level_model import Level
 from app.core.models.subject_model import Subject
+from app.core.page_timing import timed_cache_miss
 
 
 @st.cache_data(ttl=datetime.timedelta(hours=1))
+@timed_cache_miss
 def get_courses() -> list[Course]:
     """Get all Courses with their Subject and Level objects."""
     db = get_db()
@@ -3,9 +3,11 @@ import datetime
 from app.core.db import get_db
 from app.core.models.topic_model import Topic
 from app.core.models.course_model import Course
+from app.core.page_timing import timed_cache_miss
 
 
 @st.cache_data(ttl=datetime.timedelta(hours=1))
+@timed_cache_miss
 def get_topics_for_course(course: Course, only_with_words: bool = False) -> list[Topic]:
     """Return all topics for a given course.
 
@@ -1,5 +1,32 @@
+import json
+from dataclasses import dataclass
+
 import pandas as pd
+import streamlit as st
+
 from app.core.db import get_db
+from app.core.page_timing import timed_cache_miss
+
+# Compact dtypes for the graph source frames; ids comfortably fit in 32 bits
+ID_DTYPE = "int32"
+LABEL_DTYPE = "category"
+
+
+@dataclass
+class GraphSourceData:
+    """Every table the Relationship Graph filters and draws from."""
+
+    words: pd.DataFrame
+    rels: pd.DataFrame
+    levels: pd.DataFrame
+    courses: pd.DataFrame
+
+    def memory_report(self) -> dict[str, int]:
+        """Bytes held by each frame, including string payloads."""
+        return {
+            name: int(getattr(self, name).memory_usage(deep=True).sum())
+            for name in ("words", "rels", "levels", "courses")
+        }
 
 
 def load_words_and_rels():
@@ -14,24 +41,28 @@ def load_words_and_rels():
         FROM Words w
         """,
         conn,
+        dtype={"word_id": ID_DTYPE, "word": LABEL_DTYPE, "subject_id": ID_DTYPE},
     )
 
     df_rels = pd.read_sql_query(
         "SELECT word_id1 AS a, word_id2 AS b FROM WordRelationships",
         conn,
+        dtype={"a": ID_DTYPE, "b": ID_DTYPE},
     )
     return df_words, df_rels
 
 
 def load_word_levels():
     conn = get_db()
+    # a word has one row per version per level, so collapse the duplicates
     df = pd.read_sql_query(
         """
-        SELECT wv.word_id, wvl.level_id
+        SELECT DISTINCT wv.word_id, wvl.level_id
         FROM WordVersions wv
         JOIN WordVersionLevels wvl ON wvl.word_version_id = wv.id
         """,
         conn,
+        dtype={"word_id": ID_DTYPE, "level_id": ID_DTYPE},
     )
     return df
 
@@ -40,12 +71,127 @@ def load_word_courses():
     conn = get_db()
     df = pd.read_sql_query(
         """
-        SELECT wv.word_id, c.id AS course_id
+        SELECT DISTINCT wv.word_id, t.course_id
         FROM WordVersions wv
         JOIN WordVersionContexts wvc ON wvc.word_version_id = wv.id
         JOIN Topics t ON t.id = wvc.topic_id
-        JOIN Courses c ON c.id = t.course_id
         """,
         conn,
+        dtype={"word_id": ID_DTYPE, "course_id": ID_DTYPE},
     )
     return df
+
+
+@st.cache_data(show_spinner=False, max_entries=1)
+@timed_cache_miss
+def load_graph_source(db_version: str) -> GraphSourceData:
+    """Load the graph source tables once per database version.
+
+    Args:
+        db_version: token from get_db_version(), so an import triggers a reload
+
+    Returns:
+        GraphSourceData with deduplicated, compactly typed frames.
+    """
+    df_words, df_rels = load_words_and_rels()
+    return GraphSourceData(
+        words=df_words,
+        rels=df_rels,
+        levels=load_word_levels(),
+        courses=load_word_courses(),
+    )
+
+
+def get_word_id(subject_slug: str, word_slug: str) -> int | None:
+    conn = get_db()
+    row = conn.execute(
+        """
+        SELECT w.id
+        FROM Words w
+        JOIN Subjects s ON w.subject_id = s.id
+        WHERE s.slug = ? AND w.slug = ?
+        """,
+        (subject_slug, word_slug),
+    ).fetchone()
+    return row["id"] if row else None
+
+
+def load_subject_words(subject_id: int) -> list[tuple[str, str]]:
+    """Return (slug, word) for every word in a subject, alphabetically."""
+    conn = get_db()
+    rows = conn.execute(
+        """
+        SELECT slug, word
+        FROM Words
+        WHERE subject_id = ?
+        ORDER BY word COLLATE NOCASE
+        """,
+        (subject_id,),
+    ).fetchall()
+    return [(r["slug"], r["word"]) for r in rows]
+
+
+def load_ego_network(word_id: int, hops: int):
+    """Load the k-hop neighbourhood of a word.
+
+    Walks WordRelationships outwards from word_id with a recursive CTE,
+    following both columns of each (symmetric) relationship, so only the
+    neighbourhood is read rather than the whole catalogue.
+
+    Returns:
+        (df_words, df_rels) shaped like load_words_and_rels, with an extra
+        depth column on df_words giving each word's distance from word_id.
+    """
+    conn = get_db()
+
+    df_words = pd.read_sql_query(
+        """
+        WITH RECURSIVE reach(word_id, depth) AS (
+            SELECT :word_id, 0
+            UNION
+            SELECT r.word_id2, reach.depth + 1
+            FROM reach
+            JOIN WordRelationships r ON r.word_id1 = reach.word_id
+            WHERE reach.depth < :hops
+            UNION
+            SELECT r.word_id1, reach.depth + 1
+            FROM reach
+            JOIN WordRelationships r ON r.word_id2 = reach.word_id
+            WHERE reach.depth < :hops
+        )
+        SELECT
+            w.id   AS word_id,
+            w.word AS word,
+            w.subject_id,
+            MIN(reach.depth) AS depth
+        FROM reach
+        JOIN Words w ON w.id = reach.word_id
+        GROUP BY w.id
+        ORDER BY depth, w.word COLLATE NOCASE
+        """,
+        conn,
+        params={"word_id": word_id, "hops": hops},
+    )
+
+    ids = json.dumps(df_words["word_id"].tolist())
+    df_rels = pd.read_sql_query(
+        """
+        SELECT word_id1 AS a, word_id2 AS b
+        FROM WordRelationships
+        WHERE word_id1 IN (SELECT value FROM json_each(:ids))
+          AND word_id2 IN (SELECT value FROM json_each(:ids))
+        """,
+        conn,
+        params={"ids": ids},
+    )
+    return df_words, df_rels
+
+
+def load_course_layout(course_id: int) -> dict[int, tuple[int, int]]:
+    """Return the importer's fixed graph position of each word in a course."""
+    conn = get_db()
+    rows = conn.execute(
+        "SELECT word_id, x, y FROM CourseGraphLayouts WHERE course_id = ?",
+        (course_id,),
+    ).fetchall()
+    return {r["word_id"]: (r["x"], r["y"]) for r in rows}
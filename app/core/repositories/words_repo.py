@@ -1,5 +1,6 @@
+import json
 from collections import defaultdict
-from typing import Any
+from typing import Any, Iterator
 
 from app.core.db import get_db
 import datetime
@@ -9,32 +10,38 @@ from app.core.models.course_model import Course
 from app.core.models.topic_model import Topic
 from app.core.models.level_model import Level
 from app.core.models.word_models import (
+    GlossaryEntry,
     Word,
     WordVersion,
     RelatedWord,
 )
 from app.core.models.subject_model import Subject
+from app.core.page_timing import timed_cache_miss
 
 # ============================================================
 # RELATED WORDS
 # ============================================================
 
 
+# Relationships are stored once with word_id1 < word_id2, so a word's
+# neighbours are found by two index lookups, one per column, rather than an
+# OR across both columns.
+RELATED_WORDS_SQL = """
+    SELECT w.id, w.word, w.slug, s.slug AS subject_slug
+    FROM (
+        SELECT word_id2 AS other_id FROM WordRelationships WHERE word_id1 = :word_id
+        UNION ALL
+        SELECT word_id1 AS other_id FROM WordRelationships WHERE word_id2 = :word_id
+    ) r
+    JOIN Words w ON w.id = r.other_id
+    JOIN Subjects s ON w.subject_id = s.id
+    ORDER BY w.word
+"""
+
+
 def get_related_words(word_id: int) -> list[RelatedWord]:
     db = get_db()
-    q = """
-        SELECT w.id, w.word, w.slug, s.slug AS subject_slug
-        FROM WordRelationships r
-        JOIN Words w
-          ON w.id = CASE
-            WHEN r.word_id1 = ? THEN r.word_id2
-            ELSE r.word_id1
-          END
-        JOIN Subjects s ON w.subject_id = s.id
-        WHERE r.word_id1 = ? OR r.word_id2 = ?
-        ORDER BY w.word
-    """
-    rows = db.execute(q, (word_id, word_id, word_id)).fetchall()
+    rows = db.execute(RELATED_WORDS_SQL, {"word_id": word_id}).fetchall()
     return [
         RelatedWord(
             word_id=r["id"],
@@ -241,8 +248,99 @@ def get_synonyms_for_word(word_id: int) -> list[str]:
 # ============================================================
 
 
+# Format of WordDocuments.document; see importer.word_documents
+WORD_DOCUMENT_VERSION = 1
+
+
+def _level_fields(level: dict) -> dict:
+    return {
+        "pk": level["id"],
+        "name": level["name"],
+        "description": level["description"],
+    }
+
+
+def word_from_document(doc: dict) -> Word:
+    """Build a Word from its WordDocuments JSON."""
+    subject = Subject(
+        pk=doc["subject"]["id"], name=doc["subject"]["name"], slug=doc["subject"]["slug"]
+    )
+    versions = []
+    for v in doc["versions"]:
+        topics = []
+        for t in v["topics"]:
+            c = t["course"]
+            course = Course(
+                pk=c["id"],
+                name=c["name"],
+                slug=c["slug"],
+                subject=subject,
+                level=Level(**_level_fields(c["level"])) if c["level"] else None,
+            )
+            topics.append(Topic(t["id"], t["code"], t["name"], course))
+        versions.append(
+            WordVersion(
+                pk=v["id"],
+                word=doc["word"],
+                word_slug=doc["slug"],
+                subject_slug=subject.slug,
+                definition=v["definition"],
+                characteristics=v["characteristics"],
+                examples=v["examples"],
+                non_examples=v["non_examples"],
+                levels=[Level(**_level_fields(l)) for l in v["levels"]],
+                topics=topics,
+            )
+        )
+
+    return Word(
+        pk=doc["id"],
+        word=doc["word"],
+        slug=doc["slug"],
+        subject=subject,
+        versions=versions,
+        related_words=[
+            RelatedWord(
+                word_id=r["id"],
+                word=r["word"],
+                slug=r["slug"],
+                subject_slug=r["subject_slug"],
+            )
+            for r in doc["related_words"]
+        ],
+        synonyms=doc["synonyms"],
+    )
+
+
+def _parse_document(document: str | None) -> Word | None:
+    """A Word from WordDocuments.document, unless missing or an older format."""
+    if document is None:
+        return None
+    doc = json.loads(document)
+    if doc.get("v") != WORD_DOCUMENT_VERSION:
+        return None
+    return word_from_document(doc)
+
+
+def get_word_document(word_id: int) -> Word | None:
+    """Load a word from its precomputed document, if the importer wrote one."""
+    db = get_db()
+    row = db.execute(
+        "SELECT document FROM WordDocuments WHERE word_id = ?", (word_id,)
+    ).fetchone()
+    return _parse_document(row["document"]) if row else None
+
+
 @st.cache_data(ttl=datetime.timedelta(hours=1), max_entries=100)
+@timed_cache_miss
 def get_word_full(word_id: int) -> Word | None:
+    # one primary-key read when the importer has written the document;
+    # otherwise (e.g. a database not re-imported since migrating) assemble it
+    return get_word_document(word_id) or assemble_word_full(word_id)
+
+
+def assemble_word_full(word_id: int) -> Word | None:
+    """Assemble a Word from its tables, one query per part."""
     subject = get_word_subject(word_id)
     if not subject:
         return None
@@ -271,6 +369,208 @@ def get_word_full(word_id: int) -> Word | None:
     )
 
 
+# ============================================================
+# MANY FULL WORD OBJECTS
+# ============================================================
+
+# Slug pairs resolved per statement; two bound parameters each, which keeps
+# every statement under SQLite's historical limit of 999 variables.
+BULK_CHUNK_SIZE = 400
+
+# After resolving, word and version ids are passed as one JSON array and
+# expanded with json_each, so each statement's text is the same however many
+# words are requested.
+BULK_VERSIONS_SQL = """
+    SELECT
+        wv.id AS version_id,
+        wv.word_id,
+        w.word AS word_str,
+        w.slug AS word_slug,
+        s.slug AS subject_slug,
+        wv.definition,
+        wv.characteristics,
+        wv.examples,
+        wv.non_examples,
+        wv.created_at,
+        wv.updated_at,
+        l.id AS level_id,
+        l.name AS level_name,
+        l.description AS level_description
+    FROM WordVersions wv
+    JOIN Words w ON w.id = wv.word_id
+    JOIN Subjects s ON w.subject_id = s.id
+    LEFT JOIN WordVersionLevels wvl ON wvl.word_version_id = wv.id
+    LEFT JOIN Levels l ON wvl.level_id = l.id
+    WHERE wv.word_id IN (SELECT value FROM json_each(:ids))
+    ORDER BY wv.word_id, wv.created_at DESC
+"""
+
+BULK_TOPICS_SQL = """
+    SELECT
+        wvc.word_version_id,
+        t.id AS topic_id,
+        t.code,
+        t.name AS topic_name,
+        c.id AS course_id,
+        c.name AS course_name,
+        c.slug AS course_slug,
+        l.id AS level_id,
+        l.name AS level_name,
+        l.description AS level_description
+    FROM WordVersionContexts wvc
+    JOIN Topics t ON wvc.topic_id = t.id
+    JOIN Courses c ON t.course_id = c.id
+    LEFT JOIN Levels l ON c.level_id = l.id
+    WHERE wvc.word_version_id IN (SELECT value FROM json_each(:ids))
+    ORDER BY t.code
+"""
+
+BULK_RELATED_WORDS_SQL = """
+    SELECT r.word_id, w.id, w.word, w.slug, s.slug AS subject_slug
+    FROM (
+        SELECT word_id1 AS word_id, word_id2 AS other_id
+        FROM WordRelationships
+        WHERE word_id1 IN (SELECT value FROM json_each(:ids))
+        UNION ALL
+        SELECT word_id2 AS word_id, word_id1 AS other_id
+        FROM WordRelationships
+        WHERE word_id2 IN (SELECT value FROM json_each(:ids))
+    ) r
+    JOIN Words w ON w.id = r.other_id
+    JOIN Subjects s ON w.subject_id = s.id
+    ORDER BY w.word
+"""
+
+BULK_SYNONYMS_SQL = """
+    SELECT word_id, synonym
+    FROM Synonyms
+    WHERE word_id IN (SELECT value FROM json_each(:ids))
+    ORDER BY synonym
+"""
+
+
+def _resolve_word_slugs(db, slugs: list[tuple[str, str]]) -> list:
+    """Word and subject rows for (subject_slug, word_slug) pairs that exist."""
+    rows = []
+    for start in range(0, len(slugs), BULK_CHUNK_SIZE):
+        chunk = slugs[start : start + BULK_CHUNK_SIZE]
+        values = ", ".join(["(?, ?)"] * len(chunk))
+        q = f"""
+            WITH wanted(subject_slug, word_slug) AS (VALUES {values})
+            SELECT
+                w.id AS word_id,
+                w.word,
+                w.slug AS word_slug,
+                s.id AS subject_id,
+                s.name AS subject_name,
+                s.slug AS subject_slug
+            FROM wanted
+            JOIN Subjects s ON s.slug = wanted.subject_slug
+            JOIN Words w ON w.subject_id = s.id AND w.slug = wanted.word_slug
+        """
+        params = [value for pair in chunk for value in pair]
+        rows.extend(db.execute(q, params).fetchall())
+    return rows
+
+
+def get_words_full_bulk(
+    slugs: list[tuple[str, str]],
+) -> dict[tuple[str, str], Word]:
+    """Load many full Words at once, as get_word_full does for one.
+
+    The slugs are resolved in chunks of BULK_CHUNK_SIZE, then versions,
+    topics, related words and synonyms are each loaded for every word in one
+    query, so the query count does not grow with the number of words.
+
+    Args:
+        slugs: (subject_slug, word_slug) pairs.
+
+    Returns:
+        Words keyed by (subject_slug, word_slug). Pairs that match no word
+        are left out.
+    """
+    db = get_db()
+    word_rows = _resolve_word_slugs(db, list(dict.fromkeys(slugs)))
+    if not word_rows:
+        return {}
+
+    subjects: dict[int, Subject] = {}
+    word_subject: dict[int, Subject] = {}
+    for r in word_rows:
+        subject = subjects.setdefault(
+            r["subject_id"],
+            Subject(r["subject_id"], r["subject_name"], r["subject_slug"]),
+        )
+        word_subject[r["word_id"]] = subject
+    word_ids = json.dumps(list(word_subject))
+
+    # versions with their levels, grouped per word
+    rows_by_word = defaultdict(list)
+    for r in db.execute(BULK_VERSIONS_SQL, {"ids": word_ids}):
+        rows_by_word[r["word_id"]].append(r)
+    versions_by_word = {
+        word_id: hydrate_word_versions(group_word_version_rows(rows))
+        for word_id, rows in rows_by_word.items()
+    }
+    version_word = {
+        v.pk: word_id
+        for word_id, versions in versions_by_word.items()
+        for v in versions
+    }
+
+    # topics for every version
+    topics_by_version = defaultdict(list)
+    version_ids = json.dumps(list(version_word))
+    for r in db.execute(BULK_TOPICS_SQL, {"ids": version_ids}):
+        level = (
+            Level(r["level_id"], r["level_name"], r["level_description"])
+            if r["level_id"]
+            else None
+        )
+        course = Course(
+            pk=r["course_id"],
+            name=r["course_name"],
+            slug=r["course_slug"],
+            subject=word_subject[version_word[r["word_version_id"]]],
+            level=level,
+        )
+        topics_by_version[r["word_version_id"]].append(
+            Topic(r["topic_id"], r["code"], r["topic_name"], course)
+        )
+    for versions in versions_by_word.values():
+        for version in versions:
+            version.topics = topics_by_version[version.pk]
+
+    related_by_word = defaultdict(list)
+    for r in db.execute(BULK_RELATED_WORDS_SQL, {"ids": word_ids}):
+        related_by_word[r["word_id"]].append(
+            RelatedWord(
+                word_id=r["id"],
+                word=r["word"],
+                slug=r["slug"],
+                subject_slug=r["subject_slug"],
+            )
+        )
+
+    synonyms_by_word = defaultdict(list)
+    for r in db.execute(BULK_SYNONYMS_SQL, {"ids": word_ids}):
+        synonyms_by_word[r["word_id"]].append(r["synonym"])
+
+    words = {}
+    for r in word_rows:
+        word_id = r["word_id"]
+        words[(r["subject_slug"], r["word_slug"])] = Word(
+            pk=word_id,
+            word=r["word"],
+            slug=r["word_slug"],
+            subject=word_subject[word_id],
+            versions=versions_by_word.get(word_id, []),
+            related_words=related_by_word[word_id],
+            synonyms=synonyms_by_word[word_id],
+        )
+    return words
+
+
 # ============================================================
 # GET WORDVERSION BY ID (rarely used now)
 # ============================================================
@@ -399,29 +699,112 @@ def _build_word_version(row, levels, topics) -> WordVersion:
     )
 
 
+@st.cache_data(ttl=datetime.timedelta(hours=1), max_entries=100)
+@timed_cache_miss
 def get_word_by_word_slug_and_subject_slug(word_slug: str, subject_slug: str):
+    # the slug lookup reads the word's document in the same query; only a
+    # word the importer has not written one for is assembled from its tables
     db = get_db()
     q = """
-        SELECT w.id
-        FROM Words w
-        JOIN Subjects s ON w.subject_id = s.id
-        WHERE w.slug = ? AND s.slug = ?
+        SELECT w.id, d.document
+        FROM Subjects s
+        JOIN Words w ON w.subject_id = s.id AND w.slug = ?
+        LEFT JOIN WordDocuments d ON d.word_id = w.id
+        WHERE s.slug = ?
         LIMIT 1;
     """
     row = db.execute(q, (word_slug, subject_slug)).fetchone()
     if not row:
         return None
-    return get_word_full(row["id"])
+    return _parse_document(row["document"]) or assemble_word_full(row["id"])
+
 
+# A word's glossary letter: its upper-cased first letter, or '#' for digits
+# and symbols (as GlossaryEntry.letter). Must stay identical to the
+# idx_Words_initial expression in schema.sql for the index to be used.
+WORD_INITIAL_SQL = """
+    CASE WHEN upper(substr(w.word, 1, 1)) BETWEEN 'A' AND 'Z'
+        THEN upper(substr(w.word, 1, 1)) ELSE '#' END
+"""
 
-def get_word_versions_for_course(course: Course) -> list[WordVersion]:
+
+def get_course_letter_counts(course: Course) -> dict[str, int]:
+    """Number of glossary entries under each letter, A–Z then '#'.
+
+    Letters with no entries are left out.
     """
-    Return all WordVersions that appear in any Topic belonging to the given course.
+    db = get_db()
+    q = f"""
+        SELECT {WORD_INITIAL_SQL} AS letter, COUNT(DISTINCT wv.id) AS n
+        FROM Topics t
+        JOIN WordVersionContexts wvc ON wvc.topic_id = t.id
+        JOIN WordVersions wv ON wvc.word_version_id = wv.id
+        JOIN Words w ON wv.word_id = w.id
+        WHERE t.course_id = :course_id
+        GROUP BY letter
+        ORDER BY letter = '#', letter
+    """
+    return {r["letter"]: r["n"] for r in db.execute(q, {"course_id": course.pk})}
+
+
+def iter_course_glossary(
+    course: Course, letter: str | None = None
+) -> Iterator[tuple[str, list[GlossaryEntry]]]:
+    """Yield the course glossary one letter at a time: A–Z, then '#'.
+
+    The letters come from get_course_letter_counts, and each letter is read
+    by its own query through idx_Words_initial only when the caller asks
+    for it, so the first letter is ready before the rest of the course is
+    touched. Only the word and version id are read; load a version with
+    get_word_version_by_id when it is actually shown.
+
+    Args:
+        course: The course whose glossary to list.
+        letter: Only list this letter (as returned by
+            get_course_letter_counts).
+    """
+    letters = list(get_course_letter_counts(course)) if letter is None else [letter]
+    db = get_db()
+    q = f"""
+        SELECT DISTINCT wv.id AS wv_id, w.word AS word
+        FROM Words w
+        JOIN WordVersions wv ON wv.word_id = w.id
+        JOIN WordVersionContexts wvc ON wvc.word_version_id = wv.id
+        JOIN Topics t ON wvc.topic_id = t.id
+        WHERE t.course_id = :course_id AND {WORD_INITIAL_SQL} = :letter
+        ORDER BY w.word COLLATE NOCASE
+    """
+    for letter in letters:
+        entries = [
+            GlossaryEntry(word_version_id=r["wv_id"], word=r["word"])
+            for r in db.execute(q, {"course_id": course.pk, "letter": letter})
+        ]
+        if entries:
+            yield letter, entries
+
+
+def get_word_versions_for_course(
+    course: Course,
+    letter: str | None = None,
+    offset: int = 0,
+    limit: int | None = None,
+) -> list[WordVersion]:
+    """
+    Return the WordVersions that appear in any Topic belonging to the given
+    course, ordered by word.
+
+    Args:
+        course: The course.
+        letter: Only versions listed under this glossary letter ('A'–'Z' or
+            '#'), read through idx_Words_initial.
+        offset: Skip this many versions.
+        limit: Return at most this many versions; None returns them all.
     """
 
     db = get_db()
 
-    q = """
+    letter_filter = f"AND {WORD_INITIAL_SQL} = :letter" if letter is not None else ""
+    q = f"""
         SELECT DISTINCT
             wv.id AS wv_id,
             w.word AS word,
@@ -436,11 +819,19 @@ def get_word_versions_for_course(course: Course) -> list[WordVersion]:
         JOIN Words w ON wv.word_id = w.id
         JOIN Subjects s ON w.subject_id = s.id
         JOIN Topics t ON wvc.topic_id = t.id
-        WHERE t.course_id = :course_id
-        ORDER BY w.word COLLATE NOCASE
+        WHERE t.course_id = :course_id {letter_filter}
+        ORDER BY w.word COLLATE NOCASE, wv.id
+        LIMIT :limit OFFSET :offset
     """
 
-    rows = db.execute(q, {"course_id": course.pk}).fetchall()
+    params = {
+        "course_id": course.pk,
+        "letter": letter,
+        # a negative LIMIT means no limit
+        "limit": -1 if limit is None else limit,
+        "offset": offset,
+    }
+    rows = db.execute(q, params).fetchall()
 
     results = []
     for r in rows:
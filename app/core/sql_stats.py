@@ -0,0 +1,204 @@
+"""Opt-in SQL instrumentation, grouped by calling repository function.
+
+Set FRAYERSTORE_SQL_STATS=1 before starting the app and get_db() opens an
+InstrumentedConnection. Every statement is then timed from execute() until
+its last row is fetched, and the statistics are kept per (repository
+function, statement) for the lifetime of the process.
+"""
+
+import json
+import os
+import sqlite3
+import statistics
+import sys
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+
+from app.core import page_timing
+
+ENV_VAR = "FRAYERSTORE_SQL_STATS"
+
+REPOSITORY_PACKAGE = "app.core.repositories."
+# Attributed to statements issued outside the repositories (e.g. migrations)
+OTHER_CALLER = "(other)"
+# Latency samples kept per statement for percentiles
+SAMPLE_SIZE = 1000
+
+
+def is_enabled() -> bool:
+    return os.environ.get(ENV_VAR, "").lower() in ("1", "true", "yes")
+
+
+def repository_caller() -> str | None:
+    """Innermost repository function on the stack, as module.function."""
+    frame = sys._getframe(1)
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if module.startswith(REPOSITORY_PACKAGE):
+            return f"{module[len(REPOSITORY_PACKAGE):]}.{frame.f_code.co_name}"
+        frame = frame.f_back
+    return None
+
+
+# ================================================================
+# Statistics
+# ================================================================
+
+
+@dataclass
+class QueryStat:
+    function: str
+    sql: str
+    count: int = 0
+    total: float = 0.0
+    rows: int = 0
+    samples: deque = field(default_factory=lambda: deque(maxlen=SAMPLE_SIZE))
+
+    @property
+    def p95(self) -> float:
+        if len(self.samples) < 2:
+            return self.total
+        return statistics.quantiles(self.samples, n=20)[18]
+
+    def to_dict(self) -> dict:
+        return {
+            "function": self.function,
+            "sql": self.sql,
+            "count": self.count,
+            "total_ms": round(self.total * 1000, 3),
+            "mean_ms": round(self.total / self.count * 1000, 3),
+            "p95_ms": round(self.p95 * 1000, 3),
+            "rows": self.rows,
+        }
+
+
+_stats: dict[tuple[str, str], QueryStat] = {}
+_lock = threading.Lock()
+
+
+def record(function: str, sql: str, elapsed: float, rows: int) -> None:
+    sql = " ".join(sql.split())
+    with _lock:
+        stat = _stats.get((function, sql))
+        if stat is None:
+            stat = _stats[(function, sql)] = QueryStat(function, sql)
+        stat.count += 1
+        stat.total += elapsed
+        stat.rows += rows
+        stat.samples.append(elapsed)
+
+
+def snapshot() -> list[dict]:
+    """Statistics per (function, statement), slowest in total first."""
+    with _lock:
+        rows = [stat.to_dict() for stat in _stats.values()]
+    return sorted(rows, key=lambda r: r["total_ms"], reverse=True)
+
+
+def reset() -> None:
+    with _lock:
+        _stats.clear()
+
+
+def dump_json() -> str:
+    return json.dumps(
+        {"generated_at": time.time(), "queries": snapshot()}, indent=2
+    )
+
+
+# ================================================================
+# Connection wrapper
+# ================================================================
+
+
+class InstrumentedCursor(sqlite3.Cursor):
+    """Times each statement across execute() and the fetches that follow it.
+
+    SQLite does most of the work lazily while rows are stepped through, so
+    timing execute() alone would miss it.
+    """
+
+    _function = None
+    _sql = None
+    _elapsed = 0.0
+    _rows = 0
+
+    def _start(self, sql: str) -> None:
+        self._finish()
+        self._function = repository_caller() or OTHER_CALLER
+        self._sql = sql
+        self._elapsed = 0.0
+        self._rows = 0
+
+    def _finish(self) -> None:
+        if self._sql is not None:
+            record(self._function, self._sql, self._elapsed, self._rows)
+            page_timing.add_sql_time(self._elapsed)
+            self._sql = None
+
+    def _timed(self, method, *args):
+        start = time.perf_counter()
+        try:
+            return method(*args)
+        finally:
+            self._elapsed += time.perf_counter() - start
+
+    def execute(self, sql, parameters=()):
+        self._start(sql)
+        return self._timed(super().execute, sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        self._start(sql)
+        return self._timed(super().executemany, sql, seq_of_parameters)
+
+    def fetchone(self):
+        row = self._timed(super().fetchone)
+        if row is None:
+            self._finish()
+        else:
+            self._rows += 1
+        return row
+
+    def fetchmany(self, size=None):
+        rows = self._timed(super().fetchmany, size or self.arraysize)
+        self._rows += len(rows)
+        if not rows:
+            self._finish()
+        return rows
+
+    def fetchall(self):
+        rows = self._timed(super().fetchall)
+        self._rows += len(rows)
+        self._finish()
+        return rows
+
+    def __next__(self):
+        try:
+            row = self._timed(super().__next__)
+        except StopIteration:
+            self._finish()
+            raise
+        self._rows += 1
+        return row
+
+    def close(self):
+        self._finish()
+        super().close()
+
+    def __del__(self):
+        self._finish()
+
+
+class InstrumentedConnection(sqlite3.Connection):
+    """Connection whose cursors, including those made by execute(), are timed."""
+
+    def cursor(self, factory=InstrumentedCursor):
+        return super().cursor(factory)
+
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
@@ -2,9 +2,11 @@ import streamlit as st
 from app.services.search.search_models import SearchHit, SearchFilters
 from app.core.repositories.search_repo import search_raw
 from app.core.db import get_db
+from app.core.page_timing import timed_cache_miss
 
 
 @st.cache_data
+@timed_cache_miss
 def get_subject_level_map() -> dict[int, set[str]]:
     """
     Returns a mapping: subject_id -> set of level names that actually appear
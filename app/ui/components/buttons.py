@@ -1,8 +1,10 @@
 import streamlit as st
 from app.core.models.word_models import Word, WordVersion
 from app.services.search.search_models import SearchHit
+from app.ui.pages.graphs.graph_config import FOCUS_MODE
 
 VIEW_PAGE = "ui/pages/view.py"
+GRAPH_PAGE = "ui/pages/graphs/relationship_graph.py"
 
 
 def word_details_button(word: Word) -> None:
@@ -13,6 +15,15 @@ def word_details_button(word: Word) -> None:
         st.switch_page(VIEW_PAGE)
 
 
+def word_graph_button(word: Word) -> None:
+    """Create link button to show the given word's neighbourhood in the graph"""
+    if st.button(label="Show in Relationship Graph →", key=f"graph_{word.pk}"):
+        st.session_state["graph_mode"] = FOCUS_MODE
+        st.session_state["global_subject"] = word.subject.slug
+        st.session_state["graph_focus_word"] = word.slug
+        st.switch_page(GRAPH_PAGE)
+
+
 def wordversion_details_button(wv: WordVersion, key_prefix: str = "") -> None:
     """Create link button to view full details of given wordversion"""
     if st.button(label="View full details →", key=f"details_{key_prefix}_{wv.pk}"):
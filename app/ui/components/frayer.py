@@ -1,7 +1,9 @@
+from typing import Callable
+
 import streamlit as st
 import pandas as pd
 
-from app.core.models.word_models import WordVersion, RelatedWord, Word
+from app.core.models.word_models import GlossaryEntry, WordVersion, RelatedWord, Word
 from app.ui.components.buttons import wordversion_details_button
 
 
@@ -11,6 +13,29 @@ def wordversion_expander(wv: WordVersion, key_prefix: str = "") -> None:
         render_frayer_model(wv)
 
 
+def lazy_wordversion_expander(
+    entry: GlossaryEntry,
+    load_version: Callable[[int], WordVersion | None],
+    key_prefix: str = "",
+) -> None:
+    """An expander that only loads and renders its version while open."""
+    expander = st.expander(
+        entry.word,
+        key=f"expander_{key_prefix}_{entry.word_version_id}",
+        on_change="rerun",
+    )
+    if not expander.open:
+        return
+
+    wv = load_version(entry.word_version_id)
+    with expander:
+        if wv is None:
+            st.warning("This word is no longer available.")
+            return
+        wordversion_details_button(wv, key_prefix)
+        render_frayer_model(wv)
+
+
 def render_related_words(related_words: list[RelatedWord]) -> None:
     for rw in related_words:
         if st.button(label=rw.word, key=rw.word_id, width="stretch"):
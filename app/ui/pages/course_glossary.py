@@ -1,10 +1,13 @@
 import streamlit as st
-import string
 from app.ui.components.page_header import page_header
 from app.core.repositories.courses_repo import get_courses
 from app.ui.components.selection_helpers import select_course
-from app.core.repositories.words_repo import get_word_versions_for_course
-from app.ui.components.frayer import wordversion_expander
+from app.core.repositories.words_repo import (
+    get_course_letter_counts,
+    get_word_version_by_id,
+    iter_course_glossary,
+)
+from app.ui.components.frayer import lazy_wordversion_expander
 
 PAGE_TITLE = "Course Glossary"
 
@@ -18,31 +21,20 @@ def main():
         st.error("No course selected—this is unexpected!")
         st.stop()
 
-    course_word_versions = get_word_versions_for_course(course)
-    course_word_versions.sort()
-
-    groups = {letter: [] for letter in string.ascii_uppercase}
-    groups["#"] = []  # for everything non-alphabetic
-
-    for wv in course_word_versions:
-        first = wv.word[0].upper()
-        key = first if first in groups else "#"
-        groups[key].append(wv)
-
-    for letter in string.ascii_uppercase:
-        items = groups[letter]
-        if not items:
-            continue
-
+    counts = get_course_letter_counts(course)
+    selected = st.pills(
+        "Jump to letter",
+        options=list(counts),
+        format_func=lambda letter: f"{letter} ({counts[letter]})",
+        key=f"glossary_letter_{course.pk}",
+    )
+
+    # Each letter is drawn as soon as it arrives, and an entry's Frayer model
+    # is only loaded while its expander is open
+    for letter, entries in iter_course_glossary(course, selected):
         st.subheader(letter)
-
-        for wv in items:
-            wordversion_expander(wv)
-
-    if groups["#"]:
-        st.subheader("#")
-        for wv in groups["#"]:
-            wordversion_expander(wv)
+        for entry in entries:
+            lazy_wordversion_expander(entry, get_word_version_by_id)
 
 
 if __name__ == "__main__":
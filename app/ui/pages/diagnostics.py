@@ -0,0 +1,103 @@
+"""Hidden page showing page timings, SQL statistics and cache sizes."""
+
+import pandas as pd
+import streamlit as st
+
+from app.core import page_timing, sql_stats
+from app.core.db import get_db_version
+from app.core.repositories.word_graph_repo import load_graph_source
+from app.ui.components.page_header import page_header
+
+PAGE_TITLE = "Diagnostics"
+
+
+def render_page_timings():
+    st.subheader("Page runs")
+
+    if not page_timing.is_enabled():
+        st.info(
+            f"Page timing is off. Start the app with "
+            f"`{page_timing.ENV_VAR}=1` to time every page run."
+        )
+        return
+
+    summary = page_timing.summary_by_page()
+    if not summary:
+        st.caption("No page runs recorded yet.")
+        return
+
+    st.dataframe(pd.DataFrame(summary), width="stretch", hide_index=True)
+    with st.expander("Recent runs"):
+        st.dataframe(
+            pd.DataFrame(page_timing.recent_runs()), width="stretch", hide_index=True
+        )
+    if st.button("Reset page timings"):
+        page_timing.reset()
+        st.rerun()
+
+
+def render_sql_stats():
+    st.subheader("SQL by repository function")
+
+    if not sql_stats.is_enabled():
+        st.info(
+            f"SQL instrumentation is off. Start the app with "
+            f"`{sql_stats.ENV_VAR}=1` to record query timings."
+        )
+        return
+
+    rows = sql_stats.snapshot()
+    col1, col2 = st.columns(2)
+    with col1:
+        st.download_button(
+            "Download JSON",
+            data=sql_stats.dump_json(),
+            file_name="sql_stats.json",
+            mime="application/json",
+        )
+    with col2:
+        if st.button("Reset statistics"):
+            sql_stats.reset()
+            st.rerun()
+
+    if not rows:
+        st.caption("No queries recorded yet.")
+        return
+
+    df = pd.DataFrame(rows)
+    by_function = (
+        df.groupby("function")[["count", "total_ms", "rows"]]
+        .sum()
+        .sort_values("total_ms", ascending=False)
+    )
+    st.dataframe(by_function, width="stretch")
+
+    st.markdown("**Per statement**")
+    st.dataframe(
+        df,
+        width="stretch",
+        hide_index=True,
+        column_config={"sql": st.column_config.TextColumn(width="large")},
+    )
+
+
+def render_graph_memory():
+    st.subheader("Relationship graph source data")
+    report = load_graph_source(get_db_version()).memory_report()
+    st.dataframe(
+        pd.DataFrame(
+            {"frame": list(report), "bytes": list(report.values())}
+        ),
+        hide_index=True,
+    )
+
+
+def main():
+    page_header(PAGE_TITLE)
+    render_page_timings()
+    render_sql_stats()
+    render_graph_memory()
+
+
+if __name__ == "__main__":
+    main()
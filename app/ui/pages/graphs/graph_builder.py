@@ -1,57 +1,266 @@
-import networkx as nx
+import random
+from dataclasses import dataclass
+
+import numpy as np
 from streamlit_agraph import Node, Edge
 
+from app.core.graph_layout import connected_components, edge_ordinals, layout_graph
+
+EDGE_COLOUR = "#BBBBBB"
+PALETTE_SIZE = 64
+
+# Most nodes sent to the browser when clustering is on
+MAX_GRAPH_NODES = 300
+# Cluster key shared by every word without relationships
+SINGLETONS = -1
+CLUSTER_PREFIX = "cluster:"
+SINGLETONS_COLOUR = "#DDDDDD"
+
+
+@dataclass
+class GraphData:
+    """A built relationship graph, ready to hand to agraph once positioned.
+
+    Nodes carry no positions: those come from the importer's stored layout
+    (apply_positions) or from laying out just what is drawn (layout_nodes).
+    """
+
+    nodes: list[Node]
+    edges: list[Edge]
+    word_ids: np.ndarray
+    degrees: np.ndarray
+    components: np.ndarray
+    # edge endpoints as node ordinals, aligned with edges
+    a_idx: np.ndarray
+    b_idx: np.ndarray
+
+    @property
+    def component_count(self) -> int:
+        return int(self.components.max()) + 1 if len(self.components) else 0
+
+    @property
+    def cluster_keys(self) -> np.ndarray:
+        """Cluster key per node: its component id, or SINGLETONS if unconnected."""
+        counts = np.bincount(self.components)
+        return np.where(counts[self.components] > 1, self.components, SINGLETONS)
+
+
+def _pastel(i: int) -> str:
+    # Private RNG so building the palette never touches the global random state
+    rng = random.Random(i + 77)
+    r = rng.randint(120, 220)
+    g = rng.randint(120, 220)
+    b = rng.randint(120, 220)
+    return f"rgb({r},{g},{b})"
 
-def build_graph(df_words, df_rels):
-    # build networkx graph for degree + components
-    G = nx.Graph()
-    G.add_nodes_from(df_words["word_id"])
-    for _, row in df_rels.iterrows():
-        G.add_edge(int(row["a"]), int(row["b"]))
 
-    # component map
-    components = list(nx.connected_components(G))
-    comp_map = {}
-    for idx, comp in enumerate(components):
-        for n in comp:
-            comp_map[n] = idx
+# Deterministic colour lookup table, indexed by component id
+PALETTE = np.array([_pastel(i) for i in range(PALETTE_SIZE)], dtype=object)
 
-    # colour function
-    def pastel(i):
-        import random
 
-        random.seed(i + 77)
-        r = random.randint(120, 220)
-        g = random.randint(120, 220)
-        b = random.randint(120, 220)
-        return f"rgb({r},{g},{b})"
+def build_graph(df_words, df_rels) -> GraphData:
+    word_ids = df_words["word_id"].to_numpy(dtype=np.int64)
+    labels = df_words["word"].tolist()
+    a_idx, b_idx = edge_ordinals(
+        word_ids,
+        df_rels["a"].to_numpy(dtype=np.int64),
+        df_rels["b"].to_numpy(dtype=np.int64),
+    )
+
+    n = len(word_ids)
+    degrees = np.bincount(np.concatenate([a_idx, b_idx]), minlength=n)
+    comp_ids = connected_components(n, a_idx, b_idx)
+
+    sizes = 10 + np.minimum(degrees * 2, 30)
+    colours = PALETTE[comp_ids % PALETTE_SIZE]
+    str_ids = word_ids.astype(str)
 
     # build nodes
-    nodes = []
-    for _, row in df_words.iterrows():
-        wid = int(row["word_id"])
-        degree = G.degree[wid]
-        size = 10 + min(degree * 2, 30)
-
-        nodes.append(
-            Node(
-                id=str(wid),
-                label=row["word"],
-                size=size,
-                color=pastel(comp_map.get(wid, 0)),
-                title=f"Degree: {degree}",
-            )
+    nodes = [
+        Node(
+            id=wid,
+            label=label,
+            size=size,
+            color=colour,
+            title=f"Degree: {degree}",
+        )
+        for wid, label, size, colour, degree in zip(
+            str_ids.tolist(),
+            labels,
+            sizes.tolist(),
+            colours.tolist(),
+            degrees.tolist(),
         )
+    ]
 
     # build edges
     edges = [
-        Edge(
-            source=str(int(row["a"])),
-            target=str(int(row["b"])),
-            color="#BBBBBB",
-            width=1,
+        Edge(source=source, target=target, color=EDGE_COLOUR, width=1)
+        for source, target in zip(
+            str_ids[a_idx].tolist(),
+            str_ids[b_idx].tolist(),
         )
-        for _, row in df_rels.iterrows()
     ]
 
-    return nodes, edges
+    return GraphData(
+        nodes=nodes,
+        edges=edges,
+        word_ids=word_ids,
+        degrees=degrees,
+        components=comp_ids,
+        a_idx=a_idx,
+        b_idx=b_idx,
+    )
+
+
+def stored_positions(
+    graph: GraphData, layout: dict[int, tuple[int, int]]
+) -> np.ndarray | None:
+    """Positions of every node from a stored course layout.
+
+    Returns:
+        (n, 2) array indexed by node ordinal, or None if the layout misses
+        any node (e.g. the importer has not laid out the course yet).
+    """
+    positions = [layout.get(wid) for wid in graph.word_ids.tolist()]
+    if any(p is None for p in positions):
+        return None
+    return np.array(positions, dtype=np.int64).reshape(-1, 2)
+
+
+def apply_positions(nodes: list[Node], positions: np.ndarray) -> None:
+    """Pin each node at its row of positions."""
+    for node, (x, y) in zip(nodes, positions.tolist()):
+        node.x = x
+        node.y = y
+
+
+def layout_nodes(nodes: list[Node], edges: list[Edge]) -> None:
+    """Lay out exactly the nodes about to be drawn and pin them there."""
+    ordinal = {node.id: i for i, node in enumerate(nodes)}
+    a_idx = np.array([ordinal[e.source] for e in edges], dtype=np.int64)
+    b_idx = np.array([ordinal[e.to] for e in edges], dtype=np.int64)
+    n = len(nodes)
+    xs, ys = layout_graph(n, a_idx, b_idx, connected_components(n, a_idx, b_idx))
+    apply_positions(nodes, np.column_stack([xs, ys]))
+
+
+def cluster_node_id(key: int) -> str:
+    return f"{CLUSTER_PREFIX}{key}"
+
+
+def parse_cluster_node_id(node_id) -> int | None:
+    """Return the cluster key for a super-node id, or None for a word node."""
+    if isinstance(node_id, str) and node_id.startswith(CLUSTER_PREFIX):
+        try:
+            return int(node_id[len(CLUSTER_PREFIX) :])
+        except ValueError:
+            return None
+    return None
+
+
+def _centre(positions: np.ndarray | None, members: np.ndarray) -> dict:
+    if positions is None:
+        return {}
+    x, y = positions[members].mean(axis=0)
+    return {"x": int(x), "y": int(y)}
+
+
+def _super_node(
+    graph: GraphData, key: int, members: np.ndarray, positions: np.ndarray | None
+) -> Node:
+    size = len(members)
+    if key == SINGLETONS:
+        label = f"Unconnected words ({size})"
+        colour = SINGLETONS_COLOUR
+    else:
+        hub = members[np.argmax(graph.degrees[members])]
+        label = f"{graph.nodes[hub].label} +{size - 1}"
+        colour = PALETTE[key % PALETTE_SIZE]
+
+    return Node(
+        id=cluster_node_id(key),
+        label=label,
+        size=15 + min(5 * size**0.5, 45),
+        color=colour,
+        title=f"{size} words — click to expand",
+        **_centre(positions, members),
+    )
+
+
+def build_clustered_graph(
+    graph: GraphData,
+    expanded: set[int],
+    max_nodes: int = MAX_GRAPH_NODES,
+    positions: np.ndarray | None = None,
+) -> tuple[list[Node], list[Edge], set[int]]:
+    """Collapse connected components into super-nodes sized by member count.
+
+    Clusters listed in expanded are shown word by word, as long as they fit
+    in the max_nodes budget. Every other cluster is a single node; if there
+    are still too many, the smallest are merged into one final node. The
+    payload therefore never exceeds max_nodes nodes.
+
+    With stored positions, words keep their place in the course layout and
+    each super-node sits at its members' centre. Without them only the
+    returned nodes are laid out, so the cost is bounded by max_nodes.
+
+    Returns:
+        (nodes, edges, keys of the clusters that were expanded)
+    """
+    keys = graph.cluster_keys
+    order = np.argsort(keys, kind="stable")
+    cluster, starts, sizes = np.unique(
+        keys[order], return_index=True, return_counts=True
+    )
+    members_of = {
+        int(k): order[start : start + size]
+        for k, start, size in zip(cluster, starts, sizes)
+    }
+
+    budget = max_nodes
+    shown = np.zeros(len(keys), dtype=bool)
+    opened = set()
+    for key in sorted(expanded):
+        members = members_of.get(key)
+        if members is None:
+            continue
+        # keep a slot free so the collapsed clusters never disappear
+        still_collapsed = len(members_of) - len(opened) - 1
+        if len(members) + min(still_collapsed, 1) > budget:
+            continue
+        shown[members] = True
+        opened.add(key)
+        budget -= len(members)
+
+    shown_idx = np.flatnonzero(shown)
+    nodes = [graph.nodes[i] for i in shown_idx]
+    if positions is not None:
+        apply_positions(nodes, positions[shown_idx])
+    in_view = shown[graph.a_idx] & shown[graph.b_idx]
+    edges = [graph.edges[i] for i in np.flatnonzero(in_view)]
+
+    collapsed = sorted(
+        (k for k in members_of if k not in opened),
+        key=lambda k: -len(members_of[k]),
+    )
+    rest_node = None
+    if len(collapsed) > budget:
+        rest = collapsed[budget - 1 :]
+        collapsed = collapsed[: budget - 1]
+        rest_members = np.concatenate([members_of[k] for k in rest])
+        rest_node = Node(
+            id=f"{CLUSTER_PREFIX}rest",
+            label=f"{len(rest)} more groups ({len(rest_members)} words)",
+            size=15,
+            color=SINGLETONS_COLOUR,
+            title="Too many groups to show individually",
+            **_centre(positions, rest_members),
+        )
+
+    nodes.extend(_super_node(graph, k, members_of[k], positions) for k in collapsed)
+    if rest_node is not None:
+        nodes.append(rest_node)
+    if positions is None:
+        layout_nodes(nodes, edges)
+    return nodes, edges, opened
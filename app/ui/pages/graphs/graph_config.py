@@ -5,6 +5,10 @@ from app.ui.components.selection_helpers import cookie_manager
 HEIGHT_SESSION_KEY = "graph_height"
 HEIGHT_COOKIE_KEY = "fs_graph_height"
 
+# Values of the "graph_mode" radio, also set by links into the graph page
+COURSE_MODE = "Course"
+FOCUS_MODE = "Focus word"
+
 
 def get_graph_height():
     # Initialise session state from cookie
@@ -36,19 +40,15 @@ def get_graph_height():
 
 
 def default_config(height):
+    # Node positions are fixed on the server (see importer.graph_layouts),
+    # so the browser only draws the graph instead of simulating it.
     return Config(
         width="100%",
         height=height,
         directed=False,
-        springLength=350,
-        springStrength=0.002,
-        centralGravity=0.0,
-        gravity=0.0,
-        damping=0.35,
         nodeHighlightBehavior=True,
         highlightColor="#000",
-        edgeWeight=0.05,
         collapsible=False,
-        physics=True,
+        physics=False,
         hierarchical=False,
     )
@@ -1,20 +1,117 @@
-def filter_words(
-    df_words, df_rels, df_levels, df_courses, subject_id, level_id, course_id
-):
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass
+class Membership:
+    """Boolean membership of every word in each group (subject, level, ...).
+
+    matrix[rows[group_id], i] is True when the word with ordinal i belongs to
+    the group, so looking a group up is a single row read.
+    """
+
+    rows: dict[int, int]
+    matrix: np.ndarray
+
+    def mask(self, group_id: int) -> np.ndarray:
+        row = self.rows.get(group_id)
+        if row is None:
+            return np.zeros(self.matrix.shape[1], dtype=bool)
+        return self.matrix[row]
+
+
+@dataclass
+class MembershipIndex:
+    """Everything filter_words needs, precomputed once per database version.
+
+    Words are addressed by dense ordinals (their row in df_words); each
+    relationship is stored as a pair of ordinals so that filtering edges is a
+    gather from the word mask.
+    """
+
+    df_words: pd.DataFrame
+    df_rels: pd.DataFrame
+    # rows of df_rels whose endpoints are both known words, and their ordinals
+    rel_rows: np.ndarray
+    rel_a: np.ndarray
+    rel_b: np.ndarray
+    subjects: Membership
+    levels: Membership
+    courses: Membership
+
+
+def _ordinals(word_ids: np.ndarray, ids: np.ndarray):
+    """Map word ids to ordinals in word_ids.
+
+    Returns:
+        (ordinals, found) where found marks the ids present in word_ids.
+    """
+    if len(word_ids) == 0:
+        return np.zeros(len(ids), dtype=np.int64), np.zeros(len(ids), dtype=bool)
+
+    order = np.argsort(word_ids, kind="stable")
+    sorted_ids = word_ids[order]
+    pos = np.minimum(np.searchsorted(sorted_ids, ids), len(sorted_ids) - 1)
+    return order[pos], sorted_ids[pos] == ids
+
+
+def _membership(word_ids: np.ndarray, ids: np.ndarray, groups: np.ndarray):
+    ords, found = _ordinals(word_ids, ids)
+    keys, group_rows = np.unique(groups[found], return_inverse=True)
+
+    matrix = np.zeros((len(keys), len(word_ids)), dtype=bool)
+    matrix[group_rows, ords[found]] = True
+    return Membership(
+        rows={int(k): i for i, k in enumerate(keys.tolist())}, matrix=matrix
+    )
+
+
+def build_membership_index(df_words, df_rels, df_levels, df_courses):
+    word_ids = df_words["word_id"].to_numpy(dtype=np.int64)
+
+    a, a_found = _ordinals(word_ids, df_rels["a"].to_numpy(dtype=np.int64))
+    b, b_found = _ordinals(word_ids, df_rels["b"].to_numpy(dtype=np.int64))
+    known = a_found & b_found
+
+    return MembershipIndex(
+        df_words=df_words,
+        df_rels=df_rels,
+        rel_rows=np.flatnonzero(known),
+        rel_a=a[known],
+        rel_b=b[known],
+        subjects=_membership(
+            word_ids, word_ids, df_words["subject_id"].to_numpy(dtype=np.int64)
+        ),
+        levels=_membership(
+            word_ids,
+            df_levels["word_id"].to_numpy(dtype=np.int64),
+            df_levels["level_id"].to_numpy(dtype=np.int64),
+        ),
+        courses=_membership(
+            word_ids,
+            df_courses["word_id"].to_numpy(dtype=np.int64),
+            df_courses["course_id"].to_numpy(dtype=np.int64),
+        ),
+    )
+
+
+def filter_words(index: MembershipIndex, subject_id, level_id, course_id):
     # start with subject
-    allowed = set(df_words[df_words["subject_id"] == subject_id]["word_id"])
+    allowed = index.subjects.mask(subject_id)
 
     # level filter
     if level_id is not None:
-        lvl_allowed = set(df_levels[df_levels["level_id"] == level_id]["word_id"])
-        allowed &= lvl_allowed
+        allowed = allowed & index.levels.mask(level_id)
 
     # course filter
     if course_id is not None:
-        crs_allowed = set(df_courses[df_courses["course_id"] == course_id]["word_id"])
-        allowed &= crs_allowed
+        allowed = allowed & index.courses.mask(course_id)
+
+    keep = allowed[index.rel_a] & allowed[index.rel_b]
 
-    df_words_out = df_words[df_words["word_id"].isin(allowed)]
-    df_rels_out = df_rels[df_rels["a"].isin(allowed) & df_rels["b"].isin(allowed)]
+    df_words_out = index.df_words[allowed]
+    df_rels_out = index.df_rels.iloc[index.rel_rows[keep]]
 
     return df_words_out, df_rels_out
@@ -1,27 +1,263 @@
+import numpy as np
 import streamlit as st
 
+from app.core.db import get_db_version
+from app.core.page_timing import timed_cache_miss
 from app.core.repositories.word_graph_repo import (
-    load_words_and_rels,
-    load_word_levels,
-    load_word_courses,
+    get_word_id,
+    load_ego_network,
+    load_course_layout,
+    load_graph_source,
+    load_subject_words,
 )
 from app.core.repositories.courses_repo import get_courses
-from app.ui.components.selection_helpers import select_course
-from app.ui.pages.graphs.graph_filters import filter_words
-from app.ui.pages.graphs.graph_builder import build_graph
-from app.ui.pages.graphs.graph_config import get_graph_height, default_config
+from app.core.repositories.subjects_repo import get_all_subjects
+from app.ui.components.selection_helpers import select_course, select_one
+from app.ui.pages.graphs.graph_filters import (
+    MembershipIndex,
+    build_membership_index,
+    filter_words,
+)
+from app.ui.pages.graphs.graph_builder import (
+    MAX_GRAPH_NODES,
+    GraphData,
+    apply_positions,
+    build_clustered_graph,
+    build_graph,
+    layout_nodes,
+    parse_cluster_node_id,
+    stored_positions,
+)
+from app.ui.pages.graphs.graph_config import (
+    COURSE_MODE,
+    FOCUS_MODE,
+    default_config,
+    get_graph_height,
+)
 
 from streamlit_agraph import agraph
 
+DEFAULT_HOPS = 2
+MAX_HOPS = 3
+FOCUS_NODE_SIZE = 45
+
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+@timed_cache_miss
+def get_membership_index(db_version: str) -> MembershipIndex:
+    """Word membership of every subject, level and course, built once per
+    database version and shared read-only between sessions."""
+    source = load_graph_source(db_version)
+    return build_membership_index(
+        source.words, source.rels, source.levels, source.courses
+    )
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+@timed_cache_miss
+def get_filtered_graph(
+    subject_id: int, level_id: int, course_id: int, db_version: str
+) -> GraphData:
+    """Build the graph for one filter selection.
+
+    Memoised per (subject, level, course); db_version is part of the key so
+    an import invalidates the cached graphs. Widgets that only change how the
+    graph is displayed (e.g. its height) never reach this function.
+    """
+    index = get_membership_index(db_version)
+    df_words_filt, df_rel_filt = filter_words(index, subject_id, level_id, course_id)
+
+    return build_graph(df_words_filt, df_rel_filt)
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+@timed_cache_miss
+def get_course_layout(course_id: int, db_version: str) -> dict[int, tuple[int, int]]:
+    """Fixed word positions for a course, as laid out by the importer."""
+    return load_course_layout(course_id)
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+@timed_cache_miss
+def get_computed_positions(
+    subject_id: int, level_id: int, course_id: int, db_version: str
+) -> np.ndarray:
+    """Lay out a whole course graph on the server.
+
+    Only used to draw a course ungrouped when the importer has not stored
+    its layout yet (e.g. a database that was migrated but not re-imported).
+    """
+    graph = get_filtered_graph(subject_id, level_id, course_id, db_version)
+    layout_nodes(graph.nodes, graph.edges)
+    return np.array([(node.x, node.y) for node in graph.nodes], dtype=np.int64)
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+@timed_cache_miss
+def get_focus_graph(word_id: int, hops: int, db_version: str) -> GraphData:
+    """Build the graph of everything within `hops` relationships of a word.
+
+    Only the neighbourhood is loaded, so this stays cheap however large the
+    catalogue grows. The focus word is drawn larger than its neighbours.
+    """
+    df_words, df_rels = load_ego_network(word_id, hops)
+    graph = build_graph(df_words, df_rels)
+    # a neighbourhood is small enough to lay out whenever it is first drawn
+    layout_nodes(graph.nodes, graph.edges)
+
+    focus = str(word_id)
+    for node in graph.nodes:
+        if node.id == focus:
+            node.size = FOCUS_NODE_SIZE
+            node.shape = "diamond"
+    return graph
+
+
+def render_clustered(
+    graph: GraphData, course_id: int, config, positions: np.ndarray | None
+) -> None:
+    """Render the graph with components collapsed into expandable super-nodes."""
+    state_key = f"graph_expanded_{course_id}"
+    # agraph keeps returning the last clicked node, so remember what was handled
+    click_key = f"graph_last_click_{course_id}"
+    expanded = st.session_state.setdefault(state_key, set())
+
+    nodes, edges, opened = build_clustered_graph(
+        graph, expanded, positions=positions
+    )
+    if opened != expanded:
+        st.info("Some groups are too large to expand alongside the others.")
+
+    st.caption(
+        f"{len(graph.nodes)} words, showing {len(nodes)} nodes "
+        "— click a group to expand it"
+    )
+    if expanded and st.button("Collapse all groups"):
+        st.session_state[state_key] = set()
+        st.rerun()
+
+    with st.container(border=True):
+        clicked = agraph(nodes=nodes, edges=edges, config=config)
+
+    if clicked == st.session_state.get(click_key):
+        return
+    st.session_state[click_key] = clicked
+
+    key = parse_cluster_node_id(clicked)
+    if key is not None and key not in expanded:
+        st.session_state[state_key] = expanded | {key}
+        st.rerun()
+
+
+def load_focus_from_query_params() -> None:
+    """Seed focus mode from ?subject=&word=&hops= on the first run only.
+
+    Later runs leave the widgets in charge; the URL is then kept in sync by
+    sync_focus_query_params.
+    """
+    if st.session_state.get("_graph_qp_loaded"):
+        return
+    st.session_state["_graph_qp_loaded"] = True
+
+    qp = st.query_params
+    if not qp.get("subject") or not qp.get("word"):
+        return
+
+    st.session_state["graph_mode"] = FOCUS_MODE
+    st.session_state["global_subject"] = qp["subject"]
+    st.session_state["graph_focus_word"] = qp["word"]
+    try:
+        hops = int(qp.get("hops"))
+        st.session_state["graph_focus_hops"] = min(max(hops, 1), MAX_HOPS)
+    except (TypeError, ValueError):
+        pass
+
+
+def sync_focus_query_params(
+    subject_slug: str | None, word_slug: str | None, hops: int
+) -> None:
+    """Mirror the focus selection in the URL so it can be shared."""
+    if subject_slug and word_slug:
+        st.query_params.update(subject=subject_slug, word=word_slug, hops=str(hops))
+    else:
+        for key in ("subject", "word", "hops"):
+            st.query_params.pop(key, None)
+
+
+def select_focus_word():
+    """Sidebar controls for focus mode.
+
+    Returns:
+        (word_id, hops), or None if nothing is selected.
+    """
+    subjects = sorted(get_all_subjects(), key=lambda s: s.name)
+    subject = select_one(items=subjects, key="subject", label="Subject")
+    if not subject:
+        return None
+
+    words = dict(load_subject_words(subject.pk))
+    if not words:
+        st.info("This subject has no words yet.")
+        return None
+    if st.session_state.get("graph_focus_word") not in words:
+        st.session_state.pop("graph_focus_word", None)
+
+    word_slug = st.selectbox(
+        "Word",
+        list(words),
+        format_func=words.get,
+        key="graph_focus_word",
+    )
+    st.session_state.setdefault("graph_focus_hops", DEFAULT_HOPS)
+    hops = st.slider(
+        "Hops",
+        min_value=1,
+        max_value=MAX_HOPS,
+        key="graph_focus_hops",
+        help="How many relationships away from the word to include",
+    )
+    sync_focus_query_params(subject.slug, word_slug, hops)
+
+    word_id = get_word_id(subject.slug, word_slug)
+    if word_id is None:
+        return None
+    return word_id, hops
+
+
+def render_focus(config) -> None:
+    with st.sidebar:
+        selection = select_focus_word()
+    if selection is None:
+        return
+
+    word_id, hops = selection
+    graph = get_focus_graph(word_id, hops, get_db_version())
+
+    st.caption(
+        f"{len(graph.nodes)} words within {hops} "
+        f"{'hop' if hops == 1 else 'hops'}, {len(graph.edges)} relationships"
+    )
+    with st.container(border=True):
+        agraph(nodes=graph.nodes, edges=graph.edges, config=config)
+
 
 def main():
     st.title("Relationship Graph")
-
-    df_words, df_rels = load_words_and_rels()
-    df_levels = load_word_levels()
-    df_courses = load_word_courses()
+    load_focus_from_query_params()
 
     # sidebar
+    with st.sidebar:
+        mode = st.radio(
+            "Show", (COURSE_MODE, FOCUS_MODE), key="graph_mode", horizontal=True
+        )
+        graph_height = get_graph_height()
+
+    config = default_config(graph_height)
+    if mode == FOCUS_MODE:
+        render_focus(config)
+        return
+    sync_focus_query_params(None, None, 0)
+
     with st.sidebar:
         available_courses = get_courses()
         selected_course = select_course(available_courses)
@@ -32,32 +268,34 @@ def main():
         level_id = selected_course.level.pk
         course_id = selected_course.pk
 
-        graph_height = get_graph_height()
-
-    # filtering
-    df_words_filt, df_rel_filt = filter_words(
-        df_words,
-        df_rels,
-        df_levels,
-        df_courses,
-        subject_id,
-        level_id,
-        course_id,
-    )
+    db_version = get_db_version()
+    graph = get_filtered_graph(subject_id, level_id, course_id, db_version)
 
-    if df_words_filt.empty:
+    if not graph.nodes:
         st.warning("No words match the selected filters.")
         return
 
-    st.caption(f"{len(df_words_filt)} words, {len(df_rel_filt)} relationships")
-
-    # build graph
-    nodes, edges = build_graph(df_words_filt, df_rel_filt)
+    with st.sidebar:
+        # large graphs are grouped by default to keep the browser payload bounded
+        clustered = st.toggle(
+            "Group connected words",
+            value=len(graph.nodes) > MAX_GRAPH_NODES,
+            key=f"graph_clustered_{course_id}",
+        )
 
     # render
-    config = default_config(graph_height)
+    positions = stored_positions(graph, get_course_layout(course_id, db_version))
+    if clustered:
+        render_clustered(graph, course_id, config, positions)
+        return
+
+    if positions is None:
+        positions = get_computed_positions(subject_id, level_id, course_id, db_version)
+    apply_positions(graph.nodes, positions)
+
+    st.caption(f"{len(graph.nodes)} words, {len(graph.edges)} relationships")
     with st.container(border=True):
-        agraph(nodes=nodes, edges=edges, config=config)
+        agraph(nodes=graph.nodes, edges=graph.edges, config=config)
 
 
 if __name__ == "__main__":
@@ -12,6 +12,7 @@ from app.core.repositories.subjects_repo import get_all_subjects
 from app.core.repositories.levels_repo import get_all_levels
 from app.services.search.search_service import get_subject_level_map
 from app.ui.components.selection_helpers import select_one
+from app.core.page_timing import timed_cache_miss
 
 PAGE_TITLE = "Search"
 
@@ -37,6 +38,7 @@ def select_search_filters():
 
 
 @st.cache_data(show_spinner=False)
+@timed_cache_miss
 def search_query(query: str, filters: SearchFilters):
     """Return matching words and search duration."""
     start_time = time.perf_counter()
@@ -3,6 +3,7 @@ from app.core.models.word_models import WordVersionChoice
 from app.core.repositories.words_repo import (
     get_word_by_word_slug_and_subject_slug,
 )
+from app.ui.components.buttons import word_graph_button
 from app.ui.components.page_header import page_header
 from app.ui.components.selection_helpers import select_one
 from app.ui.components.frayer import render_frayer_model, render_related_words
@@ -208,6 +209,7 @@ def render_sidebar(word, levels_slug):
         if word.related_words:
             with st.expander(label="Related Words", expanded=False):
                 render_related_words(word.related_words)
+            word_graph_button(word)
         return version, options
 
 
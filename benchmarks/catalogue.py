@@ -0,0 +1,200 @@
+"""Generate a synthetic YAML catalogue in the layout the importer reads.
+
+    yaml_data/
+        levels.yaml
+        subjects.yaml
+        subjects/<subject>/courses/<course>.yaml
+        subjects/<subject>/words/<word>/<word>-<level>.yaml
+        subjects/<subject>/words/<word>/<word>.synonyms.yaml
+
+Reviewed relationships only live in the database, so they are not part of
+the YAML; add_relationships() inserts them into a built database instead.
+"""
+
+import os
+import random
+import sqlite3
+from dataclasses import asdict, dataclass
+
+import yaml
+
+from importer.graph_layouts import refresh_graph_layouts
+from importer.word_documents import refresh_word_documents
+
+SYLLABLES = [
+    "ar", "bit", "cache", "da", "el", "fo", "gra", "hex", "in", "jo",
+    "ker", "lo", "mem", "no", "op", "pro", "qua", "ra", "sto", "ta",
+    "un", "ve", "wor", "xo", "yel", "zen",
+]
+
+
+@dataclass
+class CatalogueSpec:
+    subjects: int = 3
+    courses_per_subject: int = 4
+    topics_per_course: int = 40
+    words_per_subject: int = 1000
+    levels: int = 3
+    # each word gets between 1 and this many versions, one per level
+    max_versions_per_word: int = 2
+    topics_per_version: int = 2
+    synonyms_per_word: int = 2
+    # average reviewed relationships per word, inserted after the import
+    relationships_per_word: float = 3.0
+    seed: int = 0
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def _word_names(rng: random.Random, count: int) -> list[str]:
+    """Unique, pronounceable names so LIKE searches find realistic matches."""
+    names = set()
+    while len(names) < count:
+        parts = rng.sample(SYLLABLES, rng.randint(2, 3))
+        name = "".join(parts)
+        if rng.random() < 0.3:
+            name += " " + "".join(rng.sample(SYLLABLES, 2))
+        names.add(name)
+    return sorted(names)
+
+
+def _dump(path: str, data: dict) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        yaml.safe_dump(data, f, sort_keys=False, allow_unicode=True)
+
+
+def generate_catalogue(root: str, spec: CatalogueSpec) -> dict:
+    """Write levels.yaml, subjects.yaml and the subjects tree under root.
+
+    Returns:
+        Counts of what was written.
+    """
+    rng = random.Random(spec.seed)
+    subjects_root = os.path.join(root, "subjects")
+    levels = [f"KS{i}" for i in range(1, spec.levels + 1)]
+
+    _dump(
+        os.path.join(root, "levels.yaml"),
+        {"levels": [{"name": l, "description": f"Level {l}"} for l in levels]},
+    )
+
+    counts = {"subjects": 0, "courses": 0, "topics": 0, "words": 0, "versions": 0}
+    subjects_yaml = []
+    for s in range(1, spec.subjects + 1):
+        subject = f"subject{s}"
+        course_refs = []
+        # level -> [(course name, topic codes)]
+        courses_by_level: dict[str, list[tuple[str, list[str]]]] = {}
+        for c in range(1, spec.courses_per_subject + 1):
+            # course names are looked up globally, so they must be unique
+            name = f"Course {s}.{c}"
+            level = levels[(c - 1) % len(levels)]
+            codes = [f"{c}.{t}" for t in range(1, spec.topics_per_course + 1)]
+            rel_path = f"{subject}/courses/course_{c}.yaml"
+            _dump(
+                os.path.join(subjects_root, rel_path),
+                {
+                    "name": name,
+                    "level": level,
+                    "topics": [
+                        {"code": code, "name": f"Topic {code} of {name}"}
+                        for code in codes
+                    ],
+                },
+            )
+            course_refs.append({"file": rel_path})
+            courses_by_level.setdefault(level, []).append((name, codes))
+            counts["courses"] += 1
+            counts["topics"] += len(codes)
+        subjects_yaml.append({"name": f"Subject {s}", "courses": course_refs})
+        counts["subjects"] += 1
+
+        names = _word_names(rng, spec.words_per_subject)
+        subject_levels = sorted(courses_by_level)
+        for name in names:
+            slug = name.replace(" ", "_")
+            word_dir = os.path.join(subjects_root, subject, "words", slug)
+            n_versions = rng.randint(
+                1, min(spec.max_versions_per_word, len(subject_levels))
+            )
+            for level in rng.sample(subject_levels, n_versions):
+                course, codes = rng.choice(courses_by_level[level])
+                picked = rng.sample(codes, min(spec.topics_per_version, len(codes)))
+                others = rng.sample(names, 3)
+                _dump(
+                    os.path.join(word_dir, f"{slug}-{level.lower()}.yaml"),
+                    {
+                        "word": name,
+                        "levels": [level],
+                        "definition": (
+                            f"A {level} description of {name}, "
+                            f"related to {others[0]}."
+                        ),
+                        "characteristics": [
+                            f"Has something in common with {others[1]}",
+                            f"Is usually met in {course}",
+                        ],
+                        "examples": [f"An example of {name}"],
+                        "non_examples": [f"{others[2]}"],
+                        "topics": [{"course": course, "codes": sorted(picked)}],
+                    },
+                )
+                counts["versions"] += 1
+
+            if spec.synonyms_per_word:
+                _dump(
+                    os.path.join(word_dir, f"{slug}.synonyms.yaml"),
+                    {
+                        "word": name,
+                        "synonyms": [
+                            f"{name} {i}" for i in range(1, spec.synonyms_per_word + 1)
+                        ],
+                    },
+                )
+            counts["words"] += 1
+
+    _dump(os.path.join(root, "subjects.yaml"), {"subjects": subjects_yaml})
+    return counts
+
+
+def add_relationships(db_path: str, spec: CatalogueSpec) -> int:
+    """Insert random reviewed relationships between words of the same subject.
+
+    The related words' documents are refreshed, as the importer does after
+    approving relationships, so the documents carry them.
+
+    Returns:
+        The number of relationships inserted.
+    """
+    rng = random.Random(spec.seed + 1)
+    conn = sqlite3.connect(db_path)
+    try:
+        by_subject: dict[int, list[int]] = {}
+        for word_id, subject_id in conn.execute("SELECT id, subject_id FROM Words"):
+            by_subject.setdefault(subject_id, []).append(word_id)
+
+        pairs = set()
+        for word_ids in by_subject.values():
+            if len(word_ids) < 2:
+                continue
+            n = len(word_ids)
+            wanted = min(int(n * spec.relationships_per_word / 2), n * (n - 1) // 2)
+            target = len(pairs) + wanted
+            while len(pairs) < target:
+                a, b = rng.sample(word_ids, 2)
+                pairs.add((min(a, b), max(a, b)))
+
+        conn.executemany(
+            "INSERT INTO WordRelationships (word_id1, word_id2) VALUES (?, ?)",
+            sorted(pairs),
+        )
+        related = [word_id for pair in pairs for word_id in pair]
+        refresh_word_documents(conn, related)
+        refresh_graph_layouts(conn, related)
+        conn.execute("ANALYZE")
+        conn.commit()
+    finally:
+        conn.close()
+    return len(pairs)
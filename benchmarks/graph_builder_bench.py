@@ -0,0 +1,94 @@
+"""Benchmark graph_builder.build_graph on a synthetic graph.
+
+Run from the project root:
+    python -m benchmarks.graph_builder_bench [--nodes 5000] [--edges 20000]
+
+Pass --layout to also time the force layout the importer stores per course
+(importer.graph_layouts); it is not part of build_graph.
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from app.ui.pages.graphs.graph_builder import build_graph
+from app.core.graph_layout import layout_graph
+
+
+def synthetic_graph(n_nodes: int, n_edges: int, seed: int = 0):
+    """Random words and unique (a < b) relationships, like WordRelationships."""
+    rng = np.random.default_rng(seed)
+    word_ids = np.arange(1, n_nodes + 1)
+    df_words = pd.DataFrame(
+        {
+            "word_id": word_ids,
+            "word": [f"word {i}" for i in word_ids],
+            "subject_id": 1,
+        }
+    )
+
+    pairs = set()
+    while len(pairs) < n_edges:
+        a, b = rng.integers(1, n_nodes + 1, size=2)
+        if a != b:
+            pairs.add((min(a, b), max(a, b)))
+    a, b = zip(*sorted(pairs))
+    df_rels = pd.DataFrame({"a": a, "b": b})
+    return df_words, df_rels
+
+
+def check_against_networkx(df_words, df_rels, nodes) -> None:
+    """Compare degrees and component partition with a networkx reference."""
+    import networkx as nx
+
+    G = nx.Graph()
+    G.add_nodes_from(df_words["word_id"])
+    G.add_edges_from(zip(df_rels["a"], df_rels["b"]))
+
+    for node in nodes:
+        assert node.title == f"Degree: {G.degree[int(node.id)]}", node.id
+
+    colour_of = {int(node.id): node.color for node in nodes}
+    for comp in nx.connected_components(G):
+        assert len({colour_of[n] for n in comp}) == 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nodes", type=int, default=5000)
+    parser.add_argument("--edges", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--check", action="store_true", help="Verify results against networkx"
+    )
+    parser.add_argument(
+        "--layout", action="store_true", help="Also time the importer's layout"
+    )
+    args = parser.parse_args()
+
+    df_words, df_rels = synthetic_graph(args.nodes, args.edges)
+
+    timings = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        graph = build_graph(df_words, df_rels)
+        timings.append(time.perf_counter() - start)
+
+    print(f"build_graph: {args.nodes} nodes, {args.edges} edges")
+    print(f"   best {min(timings) * 1000:.1f} ms")
+    print(f"   mean {sum(timings) / len(timings) * 1000:.1f} ms")
+
+    if args.layout:
+        start = time.perf_counter()
+        layout_graph(len(graph.word_ids), graph.a_idx, graph.b_idx, graph.components)
+        print(f"layout_graph: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    if args.check:
+        check_against_networkx(df_words, df_rels, graph.nodes)
+        print("   ✓ matches networkx degrees and components")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,429 @@
+"""Simulate concurrent sessions against the app with streamlit's AppTest.
+
+Each simulated teacher is an AppTest of app_main.py running in its own
+process. It moves between Search, Course Glossary, Topic Glossary, Model
+Viewer and Relationship Graph, interacting as a person would, and pauses for
+a random think time between pages. Every script run is timed.
+
+AppTest runs the scripts without a browser or websocket, so the numbers are
+the server-side cost of each rerun. It keeps process-wide state (the global
+Runtime instance, the pages manager), so two AppTests cannot run in one
+process at once; a process per session lets the runs really overlap and
+compete for CPU and the database. The flip side is that st.cache_data /
+st.cache_resource are per process rather than shared as on a real server,
+so every session first warms its own caches with one untimed pass through
+the pages, and the sessions start together once all of them are warm.
+Memory is reported per session process.
+
+Run from the project root:
+    python -m benchmarks.load_test [--sessions 10] [--duration 60] [--think 2.0]
+        [--db path/to/Words.db] [--output results.json]
+
+Use `python -m benchmarks.repository_bench --workdir DIR` to build a large
+synthetic database to point --db at. Without --db the app's own database is
+used, and pending migrations are applied to it when the app starts.
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import signal
+import statistics
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_SCRIPT = os.path.join(PROJECT_ROOT, "app", "app_main.py")
+RUN_TIMEOUT = 120
+# Longest a session process may take to start and warm its caches
+WARM_UP_TIMEOUT = 600
+
+SEARCH_PAGE = "ui/pages/search_words.py"
+COURSE_GLOSSARY_PAGE = "ui/pages/course_glossary.py"
+TOPIC_GLOSSARY_PAGE = "ui/pages/topic_glossary.py"
+VIEW_PAGE = "ui/pages/view.py"
+GRAPH_PAGE = "ui/pages/graphs/relationship_graph.py"
+
+# Relative frequency of each page in a session
+PAGE_WEIGHTS = {
+    "Search": 4,
+    "Model Viewer": 4,
+    "Course Glossary": 2,
+    "Topic Glossary": 2,
+    "Relationship Graph": 1,
+}
+
+
+# ================================================================
+# Catalogue sample
+# ================================================================
+
+
+@dataclass
+class Catalogue:
+    """Real values for the simulated sessions to pick from."""
+
+    courses: list
+    words: list[tuple[str, str]]
+    queries: list[str]
+
+
+def load_catalogue() -> Catalogue:
+    # imported here so FRAYERSTORE_DB_PATH is honoured
+    from app.core.db import get_db
+    from app.core.repositories.courses_repo import get_courses
+
+    db = get_db()
+    words = [
+        (r["subject_slug"], r["word_slug"])
+        for r in db.execute(
+            """
+            SELECT s.slug AS subject_slug, w.slug AS word_slug
+            FROM Words w
+            JOIN Subjects s ON s.id = w.subject_id
+            """
+        )
+    ]
+    queries = sorted({slug.replace("-", " ")[:n] for _, slug in words for n in (3, 5)})
+    return Catalogue(courses=get_courses.__wrapped__(), words=words, queries=queries)
+
+
+# ================================================================
+# Sessions
+# ================================================================
+
+
+@dataclass
+class Sample:
+    page: str
+    seconds: float
+    ok: bool
+
+
+@dataclass
+class SimulatedSession:
+    """One teacher: an AppTest plus the timings of its script runs."""
+
+    catalogue: Catalogue
+    rng: random.Random
+    samples: list[Sample] = field(default_factory=list)
+    # set when the session stopped on an exception outside a timed run
+    crash: str | None = None
+
+    def __post_init__(self):
+        from streamlit.testing.v1 import AppTest
+
+        self.at = AppTest.from_file(APP_SCRIPT, default_timeout=RUN_TIMEOUT)
+
+    def _timed(self, label: str, action) -> None:
+        start = time.perf_counter()
+        try:
+            at = action()
+            ok = not at.exception
+        except Exception:
+            ok = False
+        self.samples.append(Sample(label, time.perf_counter() - start, ok))
+
+    def _choose_course(self) -> None:
+        course = self.rng.choice(self.catalogue.courses)
+        self.at.session_state["global_subject"] = course.subject.slug
+        self.at.session_state["global_levels"] = course.level.slug
+        self.at.session_state["global_course"] = course.slug
+
+    def open(self) -> None:
+        self._timed("Search", self.at.run)
+
+    def search(self) -> None:
+        self._timed("Search", lambda: self.at.switch_page(SEARCH_PAGE).run())
+        query = self.rng.choice(self.catalogue.queries)
+        self._timed(
+            "Search (query)",
+            lambda: self.at.text_input(key="search_input").input(query).run(),
+        )
+
+    def course_glossary(self) -> None:
+        self._choose_course()
+        self._timed(
+            "Course Glossary",
+            lambda: self.at.switch_page(COURSE_GLOSSARY_PAGE).run(),
+        )
+
+    def topic_glossary(self) -> None:
+        self._choose_course()
+        self._timed(
+            "Topic Glossary",
+            lambda: self.at.switch_page(TOPIC_GLOSSARY_PAGE).run(),
+        )
+
+    def model_viewer(self) -> None:
+        subject_slug, word_slug = self.rng.choice(self.catalogue.words)
+        self.at.session_state["view_subject"] = subject_slug
+        self.at.session_state["view_word"] = word_slug
+        self._timed("Model Viewer", lambda: self.at.switch_page(VIEW_PAGE).run())
+
+    def relationship_graph(self) -> None:
+        self._choose_course()
+        self._timed(
+            "Relationship Graph", lambda: self.at.switch_page(GRAPH_PAGE).run()
+        )
+
+
+@dataclass
+class SessionResult:
+    """What a session process reports back to the parent."""
+
+    samples: list[Sample]
+    # set when the session stopped on an exception outside a timed run
+    crash: str | None
+    # resident set size of the process after warming up, and at the end
+    warm_rss: int
+    end_rss: int
+
+
+def warm_up(session: SimulatedSession) -> None:
+    """One untimed pass through every page, filling the process's caches."""
+    session.open()
+    for action in (
+        session.search,
+        session.model_viewer,
+        session.course_glossary,
+        session.topic_glossary,
+        session.relationship_graph,
+    ):
+        action()
+    session.samples.clear()
+
+
+def run_session(
+    db_path: str | None,
+    seed: int,
+    delay: float,
+    duration: float,
+    think: float,
+    ready,
+    stop,
+) -> SessionResult:
+    """Entry point of a session process: warm up, wait for the rest, browse.
+
+    ready is a Barrier shared with the parent and the other sessions; stop
+    is an Event the parent sets on Ctrl+C. An exception ends the session
+    and is reported as an error.
+    """
+    # Ctrl+C is handled by the parent, which sets stop
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    if db_path:
+        # must be set before the app modules import app.core.db
+        os.environ["FRAYERSTORE_DB_PATH"] = db_path
+
+    session = None
+    crash = None
+    warm_rss = 0
+    try:
+        session = SimulatedSession(load_catalogue(), random.Random(seed))
+        warm_up(session)
+        warm_rss = rss_bytes()
+    except Exception as e:
+        crash = f"{type(e).__name__}: {e}"
+    try:
+        ready.wait(WARM_UP_TIMEOUT)
+    except threading.BrokenBarrierError:
+        pass
+
+    if crash is None and not stop.wait(delay):
+        try:
+            _browse(session, time.monotonic() + duration, think, stop)
+        except Exception as e:
+            crash = f"{type(e).__name__}: {e}"
+
+    samples = session.samples if session is not None else []
+    return SessionResult(samples, crash, warm_rss, rss_bytes())
+
+
+def _browse(session: SimulatedSession, deadline: float, think: float, stop) -> None:
+    actions = {
+        "Search": session.search,
+        "Model Viewer": session.model_viewer,
+        "Course Glossary": session.course_glossary,
+        "Topic Glossary": session.topic_glossary,
+        "Relationship Graph": session.relationship_graph,
+    }
+    pages = list(PAGE_WEIGHTS)
+    weights = list(PAGE_WEIGHTS.values())
+
+    session.open()
+    while time.monotonic() < deadline and not stop.is_set():
+        actions[session.rng.choices(pages, weights)[0]]()
+        # people read the page before moving on
+        if think and stop.wait(session.rng.expovariate(1 / think)):
+            break
+
+
+# ================================================================
+# Measurement
+# ================================================================
+
+
+def rss_bytes() -> int:
+    """Current resident set size, or 0 where /proc is not available."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return 0
+
+
+def percentiles(seconds: list[float]) -> dict:
+    ms = sorted(s * 1000 for s in seconds)
+    cuts = statistics.quantiles(ms, n=100) if len(ms) > 1 else ms * 99
+    return {
+        "runs": len(ms),
+        "mean_ms": round(statistics.fmean(ms), 2),
+        "p50_ms": round(cuts[49], 2),
+        "p90_ms": round(cuts[89], 2),
+        "p95_ms": round(cuts[94], 2),
+        "p99_ms": round(cuts[98], 2),
+        "max_ms": round(ms[-1], 2),
+    }
+
+
+def summarise(results: list[SessionResult], wall_seconds: float) -> dict:
+    samples = [s for result in results for s in result.samples]
+    by_page: dict[str, list[float]] = {}
+    for s in samples:
+        by_page.setdefault(s.page, []).append(s.seconds)
+    crashes = [result.crash for result in results if result.crash]
+
+    return {
+        "script_runs": len(samples),
+        # failed runs plus sessions that stopped on an exception
+        "errors": sum(not s.ok for s in samples) + len(crashes),
+        "crashed_sessions": crashes,
+        "throughput_runs_per_s": round(len(samples) / wall_seconds, 2),
+        "latency": percentiles([s.seconds for s in samples]) if samples else {},
+        "pages": {page: percentiles(times) for page, times in sorted(by_page.items())},
+    }
+
+
+def memory_summary(results: list[SessionResult]) -> dict:
+    """Mean resident set size of a session process, warm and at the end."""
+    measured = [r for r in results if r.warm_rss]
+    if not measured:
+        return {}
+    warm = statistics.fmean(r.warm_rss for r in measured) / 2**20
+    end = statistics.fmean(r.end_rss for r in measured) / 2**20
+    return {
+        "per_session_warm_rss_mib": round(warm, 1),
+        "per_session_end_rss_mib": round(end, 1),
+        # session state, widget trees and anything a page keeps per session
+        "per_session_growth_mib": round(end - warm, 2),
+    }
+
+
+def _result(future) -> SessionResult:
+    try:
+        return future.result()
+    except Exception as e:
+        # e.g. the process died: count the session as crashed
+        return SessionResult([], f"{type(e).__name__}: {e}", 0, 0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=10)
+    parser.add_argument(
+        "--duration", type=float, default=60, help="seconds each session runs for"
+    )
+    parser.add_argument(
+        "--think", type=float, default=2.0, help="mean think time between pages (s)"
+    )
+    parser.add_argument(
+        "--ramp-up", type=float, default=5.0, help="seconds over which sessions start"
+    )
+    parser.add_argument("--db", help="database to serve (default: db/Words.db)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write the results as JSON")
+    args = parser.parse_args()
+    db_path = os.path.abspath(args.db) if args.db else None
+
+    # spawn, so each session process imports the app afresh
+    context = multiprocessing.get_context("spawn")
+    with (
+        context.Manager() as manager,
+        ProcessPoolExecutor(max_workers=args.sessions, mp_context=context) as pool,
+    ):
+        ready = manager.Barrier(args.sessions + 1)
+        stop = manager.Event()
+        futures = [
+            pool.submit(
+                run_session,
+                db_path,
+                args.seed + 1 + i,
+                # stagger the starts so the sessions do not run in lockstep
+                args.ramp_up * i / max(1, args.sessions),
+                args.duration,
+                args.think,
+                ready,
+                stop,
+            )
+            for i in range(args.sessions)
+        ]
+        started = time.monotonic()
+        try:
+            try:
+                ready.wait(WARM_UP_TIMEOUT)
+                print(f"✓ {args.sessions} session processes warmed up")
+            except threading.BrokenBarrierError:
+                print("⚠️  Not every session warmed up; starting the rest")
+            started = time.monotonic()
+            session_results = [_result(f) for f in futures]
+        except KeyboardInterrupt:
+            stop.set()
+            ready.abort()
+            print("⚠️  Interrupted; reporting the runs so far")
+            session_results = [_result(f) for f in futures]
+    wall_seconds = time.monotonic() - started
+
+    results = {
+        "benchmark": "load_test",
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "sessions": args.sessions,
+        "duration_s": args.duration,
+        "think_s": args.think,
+        "wall_s": round(wall_seconds, 2),
+        **summarise(session_results, wall_seconds),
+        "memory": memory_summary(session_results),
+    }
+
+    print(
+        f"✓ {results['script_runs']} script runs from {args.sessions} sessions in "
+        f"{results['wall_s']:.0f}s: {results['throughput_runs_per_s']} runs/s, "
+        f"{results['errors']} errors"
+    )
+    print(f"   {'page':<22}{'runs':>6}{'p50':>10}{'p95':>10}{'p99':>10}  ms")
+    for page, stats in results["pages"].items():
+        print(
+            f"   {page:<22}{stats['runs']:>6}{stats['p50_ms']:>10.1f}"
+            f"{stats['p95_ms']:>10.1f}{stats['p99_ms']:>10.1f}"
+        )
+    for crash in results["crashed_sessions"]:
+        print(f"⚠️  Session stopped: {crash}")
+    memory = results["memory"]
+    if memory:
+        print(
+            f"   memory per session process: {memory['per_session_warm_rss_mib']} "
+            f"MiB warm → {memory['per_session_end_rss_mib']} MiB at the end"
+        )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"✅ Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Benchmark related-word lookups on a synthetic WordRelationships table.
+
+Run from the project root:
+    python -m benchmarks.related_words_bench [--words 20000] [--relationships 100000]
+"""
+
+import argparse
+import os
+import sqlite3
+import time
+
+import numpy as np
+
+from app.core.repositories.words_repo import RELATED_WORDS_SQL
+
+SCHEMA_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "db", "schema.sql"
+)
+
+# The query get_related_words used before it was split into two lookups
+OR_JOIN_SQL = """
+    SELECT w.id, w.word, w.slug, s.slug AS subject_slug
+    FROM WordRelationships r
+    JOIN Words w
+      ON w.id = CASE
+        WHEN r.word_id1 = :word_id THEN r.word_id2
+        ELSE r.word_id1
+      END
+    JOIN Subjects s ON w.subject_id = s.id
+    WHERE r.word_id1 = :word_id OR r.word_id2 = :word_id
+    ORDER BY w.word
+"""
+
+
+def synthetic_database(n_words: int, n_relationships: int, seed: int = 0):
+    """An in-memory database from schema.sql with random unique relationships."""
+    conn = sqlite3.connect(":memory:")
+    with open(SCHEMA_PATH, encoding="utf-8") as f:
+        conn.executescript(f.read())
+
+    conn.execute("INSERT INTO Subjects (id, name, slug) VALUES (1, 'Bench', 'bench')")
+    conn.executemany(
+        "INSERT INTO Words (id, word, subject_id, slug) VALUES (?, ?, 1, ?)",
+        ((i, f"word {i}", f"word-{i}") for i in range(1, n_words + 1)),
+    )
+
+    rng = np.random.default_rng(seed)
+    pairs = set()
+    while len(pairs) < n_relationships:
+        a, b = rng.integers(1, n_words + 1, size=(2, n_relationships))
+        keep = a != b
+        lo = np.minimum(a[keep], b[keep]).tolist()
+        hi = np.maximum(a[keep], b[keep]).tolist()
+        pairs.update(zip(lo, hi))
+    conn.executemany(
+        "INSERT INTO WordRelationships (word_id1, word_id2) VALUES (?, ?)",
+        sorted(pairs)[:n_relationships],
+    )
+    conn.commit()
+    conn.execute("ANALYZE")
+    return conn
+
+
+def time_lookups(conn, sql: str, word_ids: list[int]) -> float:
+    """Mean seconds per lookup."""
+    start = time.perf_counter()
+    for word_id in word_ids:
+        conn.execute(sql, {"word_id": word_id}).fetchall()
+    return (time.perf_counter() - start) / len(word_ids)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--words", type=int, default=20000)
+    parser.add_argument("--relationships", type=int, default=100000)
+    parser.add_argument("--lookups", type=int, default=200)
+    args = parser.parse_args()
+
+    conn = synthetic_database(args.words, args.relationships)
+    rng = np.random.default_rng(1)
+    word_ids = rng.integers(1, args.words + 1, size=args.lookups).tolist()
+
+    for word_id in word_ids[:20]:
+        old = conn.execute(OR_JOIN_SQL, {"word_id": word_id}).fetchall()
+        new = conn.execute(RELATED_WORDS_SQL, {"word_id": word_id}).fetchall()
+        assert sorted(old) == sorted(new), word_id
+
+    print(
+        f"get_related_words: {args.words} words, "
+        f"{args.relationships} relationships, {args.lookups} lookups"
+    )
+    for with_index in (True, False):
+        if not with_index:
+            conn.execute("DROP INDEX idx_WordRelationships_word_id2")
+        label = "with" if with_index else "without"
+        print(f"   {label} idx_WordRelationships_word_id2:")
+        for name, sql in (("OR join", OR_JOIN_SQL), ("UNION ALL", RELATED_WORDS_SQL)):
+            mean = time_lookups(conn, sql, word_ids)
+            print(f"      {name:<10} {mean * 1e6:10.1f} µs per lookup")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,345 @@
+"""Benchmark the repository functions on a large synthetic catalogue.
+
+A synthetic YAML tree is generated and imported with the real importer
+(importer.build_db), then every repository function is timed against the
+result. Cached functions are called through __wrapped__ so each call reaches
+the database. Results are written as JSON so runs can be compared over time.
+
+Run from the project root:
+    python -m benchmarks.repository_bench [--words-per-subject 1000] [--calls 200]
+        [--output results.json] [--compare previous.json]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+from benchmarks.catalogue import CatalogueSpec, add_relationships, generate_catalogue
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCHEMA_PATH = os.path.join(PROJECT_ROOT, "db", "schema.sql")
+RESULTS_DIR = os.path.join(PROJECT_ROOT, "benchmarks", "results")
+# Ratio of new to old mean above which --compare flags a scenario
+REGRESSION_THRESHOLD = 1.2
+# Words looked up together by the bulk scenarios
+LESSON_WORDS = 40
+
+
+# ================================================================
+# Building the database
+# ================================================================
+
+
+def build_catalogue_database(workdir: str, spec: CatalogueSpec) -> dict:
+    """Generate the YAML, import it and add relationships.
+
+    Returns:
+        The database path, catalogue counts and build time.
+    """
+    from importer.build_db import build_database
+
+    data_root = os.path.join(workdir, "yaml_data")
+    db_path = os.path.join(workdir, "Words.db")
+    counts = generate_catalogue(data_root, spec)
+
+    started = time.perf_counter()
+    # the importer reports every word; keep only the summary
+    with contextlib.redirect_stdout(io.StringIO()):
+        build_database(
+            db_path, SCHEMA_PATH, data_root, os.path.join(data_root, "subjects")
+        )
+    build_seconds = time.perf_counter() - started
+    counts["relationships"] = add_relationships(db_path, spec)
+
+    return {"db_path": db_path, "counts": counts, "build_seconds": build_seconds}
+
+
+# ================================================================
+# Scenarios
+# ================================================================
+
+
+def _sample(rng: random.Random, items: list, n: int) -> list:
+    return [rng.choice(items) for _ in range(n)] if items else []
+
+
+def scenarios(db_path: str, calls: int, seed: int) -> dict:
+    """Map scenario name to (function, argument tuples), sampled from the db.
+
+    The app modules are imported here, after FRAYERSTORE_DB_PATH is set.
+    """
+    from app.core.repositories import (
+        courses_repo,
+        levels_repo,
+        search_repo,
+        subjects_repo,
+        topics_repo,
+        word_graph_repo,
+        words_repo,
+    )
+    from app.services.search.search_models import SearchFilters
+
+    rng = random.Random(seed)
+    conn = sqlite3.connect(db_path)
+    try:
+        word_ids = [r[0] for r in conn.execute("SELECT id FROM Words")]
+        version_ids = [r[0] for r in conn.execute("SELECT id FROM WordVersions")]
+        slugs = conn.execute(
+            "SELECT s.slug, w.slug FROM Words w JOIN Subjects s ON s.id = w.subject_id"
+        ).fetchall()
+        subject_ids = [r[0] for r in conn.execute("SELECT id FROM Subjects")]
+    finally:
+        conn.close()
+
+    courses = courses_repo.get_courses.__wrapped__()
+    topics = [
+        t
+        for c in courses
+        for t in topics_repo.get_topics_for_course.__wrapped__(c, True)
+    ]
+    subjects = subjects_repo.get_all_subjects()
+    # the first two letters of a name match a wide spread of words
+    queries = [s[1][:2] for s in _sample(rng, slugs, 20)] + [
+        s[1][:5] for s in _sample(rng, slugs, 20)
+    ]
+
+    def each(values):
+        return [(v,) for v in _sample(rng, values, calls)]
+
+    return {
+        "courses_repo.get_courses": (courses_repo.get_courses.__wrapped__, [()]),
+        "levels_repo.get_all_levels": (levels_repo.get_all_levels, [()]),
+        "subjects_repo.get_all_subjects": (subjects_repo.get_all_subjects, [()]),
+        "topics_repo.get_topics_for_course": (
+            topics_repo.get_topics_for_course.__wrapped__,
+            [(c, True) for c in courses],
+        ),
+        "words_repo.get_word_full": (
+            words_repo.get_word_full.__wrapped__,
+            each(word_ids),
+        ),
+        # a lesson's vocabulary: one bulk call against forty single lookups
+        "words_repo.get_words_full_bulk[40]": (
+            words_repo.get_words_full_bulk,
+            [(_sample(rng, slugs, LESSON_WORDS),) for _ in range(calls)],
+        ),
+        "words_repo.get_word_full[40]": (
+            lambda ids: [words_repo.get_word_full.__wrapped__(i) for i in ids],
+            [(_sample(rng, word_ids, LESSON_WORDS),) for _ in range(calls)],
+        ),
+        "words_repo.get_related_words": (words_repo.get_related_words, each(word_ids)),
+        "words_repo.get_word_version_by_id": (
+            words_repo.get_word_version_by_id,
+            each(version_ids),
+        ),
+        "words_repo.get_word_versions_for_topic": (
+            words_repo.get_word_versions_for_topic,
+            each(topics),
+        ),
+        "words_repo.get_word_versions_for_course": (
+            words_repo.get_word_versions_for_course,
+            [(c,) for c in courses],
+        ),
+        "search_repo.search_raw": (
+            search_repo.search_raw,
+            [(q, SearchFilters()) for q in queries],
+        ),
+        "search_repo.search_raw[subject]": (
+            search_repo.search_raw,
+            [(q, SearchFilters(subject=rng.choice(subjects))) for q in queries],
+        ),
+        "word_graph_repo.load_words_and_rels": (
+            word_graph_repo.load_words_and_rels,
+            [()],
+        ),
+        "word_graph_repo.load_word_levels": (word_graph_repo.load_word_levels, [()]),
+        "word_graph_repo.load_word_courses": (word_graph_repo.load_word_courses, [()]),
+        "word_graph_repo.get_word_id": (
+            word_graph_repo.get_word_id,
+            _sample(rng, slugs, calls),
+        ),
+        "word_graph_repo.load_subject_words": (
+            word_graph_repo.load_subject_words,
+            each(subject_ids),
+        ),
+        "word_graph_repo.load_ego_network": (
+            word_graph_repo.load_ego_network,
+            [(w, 2) for w in _sample(rng, word_ids, calls)],
+        ),
+    }
+
+
+def time_scenario(func, arg_sets: list[tuple], calls: int) -> dict:
+    """Call func `calls` times, cycling through arg_sets, after one warm-up."""
+    func(*arg_sets[0])
+    samples = []
+    for i in range(calls):
+        args = arg_sets[i % len(arg_sets)]
+        start = time.perf_counter()
+        func(*args)
+        samples.append(time.perf_counter() - start)
+
+    ms = sorted(s * 1000 for s in samples)
+    return {
+        "calls": calls,
+        "mean_ms": round(statistics.fmean(ms), 4),
+        "p50_ms": round(statistics.median(ms), 4),
+        "p95_ms": round(statistics.quantiles(ms, n=20)[18], 4) if calls > 1 else ms[0],
+        "max_ms": round(ms[-1], 4),
+    }
+
+
+# ================================================================
+# Reporting
+# ================================================================
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results: dict, previous_path: str) -> list[str]:
+    """Scenarios whose mean grew by more than REGRESSION_THRESHOLD."""
+    with open(previous_path, encoding="utf-8") as f:
+        previous_results = json.load(f)
+    previous = previous_results["scenarios"]
+
+    regressions = []
+    print(f"\nCompared with {previous_path}:")
+    if previous_results.get("spec") != results["spec"]:
+        print("⚠️  The catalogues differ, so timings are not directly comparable")
+    for name, result in results["scenarios"].items():
+        old = previous.get(name)
+        if not old or not old["mean_ms"]:
+            print(f"   {name:<42} (new)")
+            continue
+        ratio = result["mean_ms"] / old["mean_ms"]
+        flag = "⚠️ " if ratio > REGRESSION_THRESHOLD else "  "
+        print(f"{flag} {name:<42} {old['mean_ms']:9.3f} → {result['mean_ms']:9.3f} ms")
+        if ratio > REGRESSION_THRESHOLD:
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    defaults = CatalogueSpec()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--subjects", type=int, default=defaults.subjects)
+    parser.add_argument(
+        "--courses-per-subject", type=int, default=defaults.courses_per_subject
+    )
+    parser.add_argument(
+        "--topics-per-course", type=int, default=defaults.topics_per_course
+    )
+    parser.add_argument(
+        "--words-per-subject", type=int, default=defaults.words_per_subject
+    )
+    parser.add_argument("--levels", type=int, default=defaults.levels)
+    parser.add_argument(
+        "--max-versions-per-word", type=int, default=defaults.max_versions_per_word
+    )
+    parser.add_argument(
+        "--topics-per-version", type=int, default=defaults.topics_per_version
+    )
+    parser.add_argument(
+        "--synonyms-per-word", type=int, default=defaults.synonyms_per_word
+    )
+    parser.add_argument(
+        "--relationships-per-word",
+        type=float,
+        default=defaults.relationships_per_word,
+    )
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--calls", type=int, default=200, help="calls per scenario")
+    parser.add_argument(
+        "--workdir", help="keep the generated YAML and database here (default: temp)"
+    )
+    parser.add_argument("--output", help="JSON results path")
+    parser.add_argument(
+        "--compare", help="earlier JSON results; exit 1 if any scenario regressed"
+    )
+    args = parser.parse_args()
+
+    spec = CatalogueSpec(
+        subjects=args.subjects,
+        courses_per_subject=args.courses_per_subject,
+        topics_per_course=args.topics_per_course,
+        words_per_subject=args.words_per_subject,
+        levels=args.levels,
+        max_versions_per_word=args.max_versions_per_word,
+        topics_per_version=args.topics_per_version,
+        synonyms_per_word=args.synonyms_per_word,
+        relationships_per_word=args.relationships_per_word,
+        seed=args.seed,
+    )
+
+    with contextlib.ExitStack() as stack:
+        workdir = args.workdir or stack.enter_context(tempfile.TemporaryDirectory())
+        os.makedirs(workdir, exist_ok=True)
+        built = build_catalogue_database(workdir, spec)
+        counts = built["counts"]
+        print(
+            f"✓ Built {counts['words']} words, {counts['versions']} versions, "
+            f"{counts['relationships']} relationships in {built['build_seconds']:.1f}s"
+        )
+
+        # must be set before the app modules import app.core.db
+        os.environ["FRAYERSTORE_DB_PATH"] = built["db_path"]
+        results = {
+            "benchmark": "repositories",
+            "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "git_commit": git_commit(),
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "spec": spec.to_dict(),
+            "catalogue": counts,
+            "build_seconds": round(built["build_seconds"], 3),
+            "scenarios": {},
+        }
+        for name, (func, arg_sets) in scenarios(
+            built["db_path"], args.calls, spec.seed
+        ).items():
+            if not arg_sets:
+                print(f"   {name:<42} skipped (nothing to sample)")
+                continue
+            result = time_scenario(func, arg_sets, args.calls)
+            results["scenarios"][name] = result
+            print(
+                f"   {name:<42} mean {result['mean_ms']:9.3f} ms   "
+                f"p95 {result['p95_ms']:9.3f} ms"
+            )
+
+    output = args.output or os.path.join(
+        RESULTS_DIR, f"repositories-{datetime.now():%Y%m%d-%H%M%S}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    print(f"✅ Results written to {output}")
+
+    if args.compare and compare(results, args.compare):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -78,6 +78,64 @@ CREATE TABLE WordRelationships (
     UNIQUE (word_id1, word_id2)
 );
 
+-- Candidate relationships found by detection, waiting for review
+CREATE TABLE RelationshipCandidates (
+    id INTEGER PRIMARY KEY,
+    word_id1 INTEGER NOT NULL REFERENCES Words(id) ON DELETE CASCADE,
+    word_id2 INTEGER NOT NULL REFERENCES Words(id) ON DELETE CASCADE,
+    status TEXT NOT NULL DEFAULT 'pending'
+        CHECK (status IN ('pending', 'approved', 'ignored')),
+    detected_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    reviewed_at DATETIME,
+    CHECK (word_id1 < word_id2),
+    UNIQUE (word_id1, word_id2)
+);
+
+CREATE INDEX idx_RelationshipCandidates_status
+    ON RelationshipCandidates (status, id);
+
+-- One denormalised JSON document per word (versions, levels, topics,
+-- synonyms and related words), kept up to date by the importer
+CREATE TABLE WordDocuments (
+    word_id INTEGER PRIMARY KEY REFERENCES Words(id) ON DELETE CASCADE,
+    document TEXT NOT NULL,
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Fixed Relationship Graph positions for every word of a course, laid out
+-- by importer.graph_layouts so the page never runs the simulation itself.
+CREATE TABLE CourseGraphLayouts (
+    course_id INTEGER NOT NULL REFERENCES Courses(id) ON DELETE CASCADE,
+    word_id INTEGER NOT NULL REFERENCES Words(id) ON DELETE CASCADE,
+    x INTEGER NOT NULL,
+    y INTEGER NOT NULL,
+    PRIMARY KEY (course_id, word_id)
+) WITHOUT ROWID;
+
+-- Secondary indexes for the lookups the app makes by foreign key.
+-- Topics(course_id), Synonyms(word_id), Words(subject_id) and Courses(name)
+-- are already served by the leading column of a UNIQUE constraint.
+CREATE INDEX idx_WordVersions_word_id
+    ON WordVersions (word_id);
+
+CREATE INDEX idx_WordVersionContexts_topic_id
+    ON WordVersionContexts (topic_id, word_version_id);
+
+CREATE INDEX idx_WordRelationships_word_id2
+    ON WordRelationships (word_id2, word_id1);
+
+CREATE INDEX idx_Courses_subject_id
+    ON Courses (subject_id, level_id);
+
+-- Glossary A–Z navigation: each word under its upper-cased first letter, or
+-- '#'. Must match words_repo.WORD_INITIAL_SQL exactly to be used.
+CREATE INDEX idx_Words_initial
+    ON Words (
+        (CASE WHEN upper(substr(word, 1, 1)) BETWEEN 'A' AND 'Z'
+            THEN upper(substr(word, 1, 1)) ELSE '#' END),
+        word COLLATE NOCASE
+    );
+
 CREATE VIEW vw_WordDetails AS
 SELECT DISTINCT
     w.id          AS word_id,
@@ -1,6 +1,190 @@
-import sqlite3, pathlib
+import os
+import sqlite3
+import sys
+import time
 
-schema = pathlib.Path("db/schema.sql").read_text()
-conn = sqlite3.connect("db/Words.db")
-conn.executescript(schema)
-conn.close
+# Allow `python importer/build_db.py` to import the package
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from importer import import_levels, import_subjects, import_words
+from importer.config import CONFIG
+from importer.db_utils import OFFLINE_PRAGMAS, connection_pragmas, db_connection
+from importer.migrate import apply_migrations
+from importer.graph_layouts import refresh_layouts_and_report
+from importer.word_documents import refresh_and_report
+
+# ================================================================
+# Carry-over
+# ================================================================
+
+# Reviewed relationships only live in the database, not in the YAML, so they
+# are copied across from the database being replaced. Word ids change between
+# builds, so words are matched by (subject slug, word slug).
+CARRY_OVER_RELATIONSHIPS = """
+INSERT OR IGNORE INTO WordRelationships (word_id1, word_id2)
+SELECT MIN(n1.id, n2.id), MAX(n1.id, n2.id)
+FROM old.WordRelationships r
+JOIN old.Words o1 ON o1.id = r.word_id1
+JOIN old.Subjects os1 ON os1.id = o1.subject_id
+JOIN old.Words o2 ON o2.id = r.word_id2
+JOIN old.Subjects os2 ON os2.id = o2.subject_id
+JOIN Subjects s1 ON s1.slug = os1.slug
+JOIN Words n1 ON n1.subject_id = s1.id AND n1.slug = o1.slug
+JOIN Subjects s2 ON s2.slug = os2.slug
+JOIN Words n2 ON n2.subject_id = s2.id AND n2.slug = o2.slug
+"""
+
+CARRY_OVER_CANDIDATES = """
+INSERT OR IGNORE INTO RelationshipCandidates
+    (word_id1, word_id2, status, detected_at, reviewed_at)
+SELECT MIN(n1.id, n2.id), MAX(n1.id, n2.id), c.status, c.detected_at, c.reviewed_at
+FROM old.RelationshipCandidates c
+JOIN old.Words o1 ON o1.id = c.word_id1
+JOIN old.Subjects os1 ON os1.id = o1.subject_id
+JOIN old.Words o2 ON o2.id = c.word_id2
+JOIN old.Subjects os2 ON os2.id = o2.subject_id
+JOIN Subjects s1 ON s1.slug = os1.slug
+JOIN Words n1 ON n1.subject_id = s1.id AND n1.slug = o1.slug
+JOIN Subjects s2 ON s2.slug = os2.slug
+JOIN Words n2 ON n2.subject_id = s2.id AND n2.slug = o2.slug
+"""
+
+
+def carry_over(conn: sqlite3.Connection, old_db_path: str) -> tuple[int, int]:
+    """Copy reviewed relationships and the review queue from the old database.
+
+    Returns:
+        (relationships copied, candidates copied)
+    """
+    conn.execute("ATTACH DATABASE ? AS old", (old_db_path,))
+    try:
+        old_tables = {
+            r[0]
+            for r in conn.execute(
+                "SELECT name FROM old.sqlite_master WHERE type = 'table'"
+            )
+        }
+        copied = []
+        for table, sql in (
+            ("WordRelationships", CARRY_OVER_RELATIONSHIPS),
+            ("RelationshipCandidates", CARRY_OVER_CANDIDATES),
+        ):
+            if table not in old_tables:
+                copied.append(0)
+                continue
+            copied.append(conn.execute(sql).rowcount)
+        conn.commit()
+    finally:
+        conn.execute("DETACH DATABASE old")
+    return copied[0], copied[1]
+
+
+# ================================================================
+# Verification
+# ================================================================
+
+
+def finalise(conn: sqlite3.Connection) -> None:
+    """Gather planner statistics, compact the file and check it is sound.
+
+    Raises:
+        RuntimeError: if the integrity or foreign key checks fail.
+    """
+    conn.execute("ANALYZE")
+    conn.commit()
+    conn.execute("VACUUM")
+
+    integrity = [r[0] for r in conn.execute("PRAGMA integrity_check")]
+    if integrity != ["ok"]:
+        raise RuntimeError("Integrity check failed: " + "; ".join(integrity[:5]))
+
+    violations = conn.execute("PRAGMA foreign_key_check").fetchall()
+    if violations:
+        tables = sorted({r[0] for r in violations})
+        raise RuntimeError(
+            f"{len(violations)} foreign key violations in: {', '.join(tables)}"
+        )
+
+
+# ================================================================
+# Build
+# ================================================================
+
+
+def build_database(
+    db_path: str, schema_path: str, data_root: str, subjects_root: str
+) -> None:
+    """Build a fresh database from the YAML data and swap it into place.
+
+    The new database is written to a temporary file next to db_path with
+    journalling and syncing switched off, then analysed, vacuumed and
+    verified before os.replace() moves it over db_path in one step. Readers
+    never see a half-built file: open connections keep the old file until
+    they reconnect, and a failed build leaves db_path untouched.
+    """
+    started = time.perf_counter()
+    tmp_path = db_path + ".building"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+
+    try:
+        with open(schema_path, encoding="utf-8") as f:
+            schema = f.read()
+        with db_connection(tmp_path) as conn:
+            conn.executescript(schema)
+            # schema.sql is already current; this records the migrations as applied
+            apply_migrations(conn)
+        print(f"✓ Created schema in {tmp_path}")
+
+        with connection_pragmas(tmp_path, OFFLINE_PRAGMAS):
+            import_levels.import_levels(
+                os.path.join(data_root, "levels.yaml"), tmp_path
+            )
+            import_subjects.import_subjects(
+                os.path.join(data_root, "subjects.yaml"),
+                subjects_root,
+                tmp_path,
+                update_layouts=False,
+            )
+            import_words.import_words(subjects_root, tmp_path, update_layouts=False)
+
+            with db_connection(tmp_path) as conn:
+                if os.path.exists(db_path):
+                    relationships, candidates = carry_over(conn, db_path)
+                    print(
+                        f"✓ Carried over {relationships} relationships and "
+                        f"{candidates} queued candidates"
+                    )
+                    # carried-over relationships appear in both words' documents
+                    if relationships:
+                        refresh_and_report(conn)
+                # once every word and relationship is in place
+                refresh_layouts_and_report(conn)
+                conn.commit()
+                finalise(conn)
+        print("✓ Analysed, vacuumed and verified")
+
+        os.replace(tmp_path, db_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    print(f"✅ Built {db_path} in {time.perf_counter() - started:.1f}s")
+
+
+def main():
+    try:
+        build_database(
+            CONFIG["database"],
+            CONFIG["schema"],
+            CONFIG["data_root"],
+            CONFIG["subjects_root"],
+        )
+    except (RuntimeError, sqlite3.Error) as e:
+        print(f"❌ Build failed, existing database left unchanged: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,21 @@
 import argparse
 import os
+import sys
 from importer import (
+    build_db,
+    export_deck,
+    export_print,
+    export_site,
     import_levels,
     import_subjects,
     import_words,
 )
+from importer.db_utils import db_connection
+from importer.migrate import apply_migrations, migrate
+from importer.graph_layouts import refresh_layouts_and_report
+from importer.word_documents import refresh_and_report
+from importer.query_plans import check_query_plans
+from importer.relationship_candidates import detect_candidates
 from importer.config import CONFIG
 
 
@@ -21,6 +32,60 @@ def main():
     subparsers.add_parser(
         "all", help="Run all imports in sequence (levels, subjects, words)"
     )
+    subparsers.add_parser(
+        "build",
+        help="Build a fresh database from the YAML data and swap it in atomically",
+    )
+    subparsers.add_parser(
+        "migrate", help="Apply pending schema migrations to the database"
+    )
+    subparsers.add_parser(
+        "check-plans",
+        help="Fail if any repository query needs a full table scan",
+    )
+    subparsers.add_parser(
+        "candidates",
+        help="Detect candidate word relationships and queue them for review",
+    )
+    export_parser = subparsers.add_parser(
+        "export-site",
+        help="Render every glossary and Frayer model to static HTML and JSON",
+    )
+    export_parser.add_argument(
+        "--out", default=CONFIG["site_root"], help="output directory"
+    )
+    export_parser.add_argument(
+        "--workers", type=int, help="render processes (default: one per CPU)"
+    )
+    print_parser = subparsers.add_parser(
+        "export-print",
+        help="Write a course's or topic's Frayer models as one printable HTML file",
+    )
+    print_parser.add_argument("course", help="the course, as <subject>/<course>")
+    print_parser.add_argument("--topic", help="only this topic code")
+    print_parser.add_argument(
+        "--out",
+        default=CONFIG["exports_root"],
+        help="output file, or directory to name the file in",
+    )
+    print_parser.add_argument(
+        "--workers", type=int, help="render processes (default: one per CPU)"
+    )
+    deck_parser = subparsers.add_parser(
+        "export-deck",
+        help="Write flashcard decks (Anki or CSV) for a course or a whole subject",
+    )
+    deck_parser.add_argument(
+        "course", help="<subject>/<course>, or <subject> for all its courses"
+    )
+    deck_parser.add_argument(
+        "--format", choices=sorted(export_deck.FORMATS), default="anki"
+    )
+    deck_parser.add_argument(
+        "--out",
+        default=os.path.join(CONFIG["exports_root"], "decks"),
+        help="directory to write the deck directories in",
+    )
 
     args = parser.parse_args()
 
@@ -28,10 +93,23 @@ def main():
     data_root = CONFIG["data_root"]
     subjects_root = CONFIG["subjects_root"]
 
+    # build creates the database, so it is the one command that may run without it
+    if args.command == "build":
+        build_db.main()
+        return
+
     if not os.path.exists(db_path):
         print(f"⚠️  Database not found at: {db_path}")
         return
 
+    # imports maintain tables added by migrations (e.g. WordDocuments) and
+    # candidates fills one (RelationshipCandidates), so an older database is
+    # brought up to date first
+    if args.command in ("levels", "subjects", "words", "all", "candidates"):
+        with db_connection(db_path) as conn:
+            for migration in apply_migrations(conn):
+                print(f"✓ Applied {migration.version:04d}_{migration.name}")
+
     if args.command == "levels":
         levels_path = os.path.join(data_root, "levels.yaml")
         if not os.path.exists(levels_path):
@@ -62,6 +140,31 @@ def main():
         import_words.import_words(subjects_root, db_path)
         print("✅ All imports completed.")
 
+    elif args.command == "migrate":
+        migrate(db_path)
+        # fills WordDocuments and CourseGraphLayouts on databases that predate them
+        with db_connection(db_path) as conn:
+            refresh_and_report(conn)
+            refresh_layouts_and_report(conn)
+
+    elif args.command == "check-plans":
+        if not check_query_plans(CONFIG["schema"]):
+            sys.exit(1)
+
+    elif args.command == "candidates":
+        with db_connection(db_path) as conn:
+            added = detect_candidates(conn, CONFIG["ignore_file"])
+        print(f"✓ Queued {added} new candidate relationships for review.")
+
+    elif args.command == "export-site":
+        export_site.main(db_path, args.out, args.workers)
+
+    elif args.command == "export-print":
+        export_print.main(db_path, args.course, args.out, args.topic, args.workers)
+
+    elif args.command == "export-deck":
+        export_deck.main(db_path, args.course, args.out, args.format)
+
     else:
         parser.print_help()
 
@@ -5,8 +5,12 @@ PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
 CONFIG = {
     "database": os.path.join(PROJECT_ROOT, "db", "Words.db"),
+    "schema": os.path.join(PROJECT_ROOT, "db", "schema.sql"),
     "data_root": os.path.join(PROJECT_ROOT, "yaml_data"),
     "subjects_root": os.path.join(PROJECT_ROOT, "yaml_data", "subjects"),
+    "ignore_file": os.path.join(PROJECT_ROOT, "ignored_relationships.txt"),
+    "site_root": os.path.join(PROJECT_ROOT, "site"),
+    "exports_root": os.path.join(PROJECT_ROOT, "exports"),
 }
 
 # Optional sanity check (helpful if paths change)
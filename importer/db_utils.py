@@ -1,3 +1,4 @@
+import os
 import sqlite3
 from contextlib import contextmanager
 from importer.strings import slugify
@@ -7,11 +8,40 @@ from typing import Optional
 
 # ---------- connection helper ---------- #
 
+# Durability is pointless while building a database nobody can see yet: a
+# crash just means starting the build again.
+OFFLINE_PRAGMAS = {
+    "journal_mode": "OFF",
+    "synchronous": "OFF",
+    "temp_store": "MEMORY",
+    "cache_size": "-65536",
+}
+
+# Extra PRAGMAs applied by db_connection, keyed by absolute database path
+_connection_pragmas: dict[str, dict[str, str]] = {}
+
+
+@contextmanager
+def connection_pragmas(db_path, pragmas: dict[str, str]):
+    """Apply `pragmas` to every db_connection opened on db_path in this block.
+
+    Lets the existing importers, which each open their own connection, run
+    with build-time settings without changing their signatures.
+    """
+    key = os.path.abspath(db_path)
+    _connection_pragmas[key] = pragmas
+    try:
+        yield
+    finally:
+        _connection_pragmas.pop(key, None)
+
 
 @contextmanager
 def db_connection(db_path):
     conn = sqlite3.connect(db_path, timeout=10)
     conn.row_factory = sqlite3.Row  # rows behave like dicts: row["id"]
+    for name, value in _connection_pragmas.get(os.path.abspath(db_path), {}).items():
+        conn.execute(f"PRAGMA {name} = {value}")
     try:
         yield conn  # this is what `with db_connection(...) as conn` uses
         conn.commit()
@@ -0,0 +1,233 @@
+"""Export course glossaries as flashcard decks for spaced repetition.
+
+Each course becomes one deck directory under exports/decks:
+
+    <subject>-<course>/
+        deck.txt|csv     every card
+        changes.txt|csv  only the cards added or changed since the last export
+        manifest-<format>.json
+                         note id -> content hash of every card exported
+
+The "anki" format is Anki's text import (tab-separated, with header lines
+naming the note type, deck and GUID column), so importing changes.txt into
+a collection that already has the deck updates the existing notes in place.
+The "csv" format has the same columns under a header row, for other tools.
+
+Note ids come from the version's subject, word and levels rather than its
+database id, which a rebuild renumbers; the content hash decides whether a
+card has changed. Versions are streamed a chunk at a time (see
+export_print.iter_versions), so only the manifest is held in memory.
+"""
+
+import csv
+import hashlib
+import json
+import os
+import sys
+import time
+
+# Allow `python importer/export_deck.py` to import the package
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from importer.export_print import iter_versions
+from importer.export_site import ExportError, render_frayer, use_database
+
+# Bump when the card layout changes, so every card counts as changed
+CARD_VERSION = 1
+MANIFEST = "manifest-{fmt}.json"
+FORMATS = {"anki": ".txt", "csv": ".csv"}
+COLUMNS = ["guid", "front", "back", "tags"]
+
+
+# ================================================================
+# Cards
+# ================================================================
+
+
+def _tag(text: str) -> str:
+    # Anki tags cannot contain spaces; '::' nests them
+    return "-".join(text.split())
+
+
+def note_id(version: dict) -> str:
+    """A stable id for a version: its subject, word and levels."""
+    key = "/".join(
+        [version["subject"], version["word_slug"], *sorted(version["levels"])]
+    )
+    return "fs-" + hashlib.sha1(key.encode()).hexdigest()[:16]
+
+
+def card_for(version: dict) -> dict:
+    """The flashcard for one serialised word version."""
+    tags = [f"level::{_tag(level)}" for level in version["levels"]]
+    tags += [
+        f"topic::{_tag(topic['course'])}::{_tag(topic['code'])}"
+        for topic in version["topics"]
+    ]
+    return {
+        "guid": note_id(version),
+        "front": version["word"],
+        "back": render_frayer(version),
+        "tags": " ".join(sorted(set(tags))),
+    }
+
+
+def content_hash(card: dict) -> str:
+    text = json.dumps([CARD_VERSION, card], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def iter_cards(course):
+    """Yield (card, content hash) for every version in the course glossary."""
+    for version in iter_versions(course):
+        card = card_for(version)
+        yield card, content_hash(card)
+
+
+# ================================================================
+# Files
+# ================================================================
+
+
+class DeckWriter:
+    """Write cards to a deck file as they arrive, via a temporary file."""
+
+    def __init__(self, path: str, fmt: str, deck_name: str):
+        self.path = path
+        self._tmp_path = path + ".tmp"
+        self._file = open(self._tmp_path, "w", encoding="utf-8", newline="")
+        if fmt == "anki":
+            self._file.write(
+                "#separator:tab\n"
+                "#html:true\n"
+                "#notetype:Basic\n"
+                f"#deck:{deck_name}\n"
+                "#guid column:1\n"
+                "#tags column:4\n"
+            )
+            self._writer = csv.writer(self._file, delimiter="\t", lineterminator="\n")
+        else:
+            self._writer = csv.writer(self._file, lineterminator="\n")
+            self._writer.writerow(COLUMNS)
+        self.count = 0
+
+    def write(self, card: dict) -> None:
+        self._writer.writerow([card[c] for c in COLUMNS])
+        self.count += 1
+
+    def commit(self) -> None:
+        self._file.close()
+        os.replace(self._tmp_path, self.path)
+
+    def discard(self) -> None:
+        self._file.close()
+        if os.path.exists(self._tmp_path):
+            os.remove(self._tmp_path)
+
+
+def _load_manifest(deck_dir: str, fmt: str) -> dict[str, str]:
+    try:
+        path = os.path.join(deck_dir, MANIFEST.format(fmt=fmt))
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)["cards"]
+    except (OSError, ValueError, KeyError):
+        return {}
+
+
+def _save_manifest(deck_dir: str, fmt: str, cards: dict[str, str]) -> None:
+    path = os.path.join(deck_dir, MANIFEST.format(fmt=fmt))
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump({"card_version": CARD_VERSION, "cards": cards}, f, indent=1)
+    os.replace(path + ".tmp", path)
+
+
+# ================================================================
+# Export
+# ================================================================
+
+
+def deck_dirname(course) -> str:
+    return f"{course.subject.slug}-{course.slug}"
+
+
+def export_course_deck(course, out_root: str, fmt: str = "anki") -> dict:
+    """Write the deck for one course and record what it contained.
+
+    Returns:
+        Counts of cards in the deck, added or changed, and removed.
+    """
+    deck_dir = os.path.join(out_root, deck_dirname(course))
+    os.makedirs(deck_dir, exist_ok=True)
+    extension = FORMATS[fmt]
+    deck_name = f"FrayerStore::{course.subject.name}::{course.name}"
+
+    previous = _load_manifest(deck_dir, fmt)
+    current: dict[str, str] = {}
+    deck = DeckWriter(os.path.join(deck_dir, f"deck{extension}"), fmt, deck_name)
+    changes = DeckWriter(
+        os.path.join(deck_dir, f"changes{extension}"), fmt, deck_name
+    )
+    try:
+        for card, digest in iter_cards(course):
+            if card["guid"] in current:
+                # versions of a word differ in levels, so this is only a guard
+                continue
+            current[card["guid"]] = digest
+            deck.write(card)
+            if previous.get(card["guid"]) != digest:
+                changes.write(card)
+    except BaseException:
+        deck.discard()
+        changes.discard()
+        raise
+    deck.commit()
+    changes.commit()
+    _save_manifest(deck_dir, fmt, current)
+
+    return {
+        "deck": deck_dir,
+        "cards": deck.count,
+        "changed": changes.count,
+        "removed": len(previous.keys() - current.keys()),
+    }
+
+
+def find_courses(ref: str) -> list:
+    """Courses for '<subject>' (all of them) or '<subject>/<course>'."""
+    from app.core.repositories.courses_repo import get_courses
+
+    subject_slug, _, course_slug = ref.partition("/")
+    courses = [
+        c
+        for c in get_courses.__wrapped__()
+        if c.subject.slug == subject_slug and course_slug in ("", c.slug)
+    ]
+    if not courses:
+        raise ExportError(
+            f"No course matches '{ref}' (expected <subject>[/<course>])"
+        )
+    return courses
+
+
+def export_decks(db_path: str, ref: str, out_root: str, fmt: str = "anki") -> list:
+    """Export a deck per course matching ref. Returns each deck's counts."""
+    use_database(db_path)
+    return [export_course_deck(c, out_root, fmt) for c in find_courses(ref)]
+
+
+def main(db_path: str, ref: str, out_root: str, fmt: str = "anki") -> None:
+    started = time.perf_counter()
+    try:
+        results = export_decks(db_path, ref, out_root, fmt)
+    except ExportError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    for r in results:
+        print(
+            f"✓ {r['deck']}: {r['cards']} cards, {r['changed']} new or changed, "
+            f"{r['removed']} removed"
+        )
+    print(
+        f"✅ Exported {len(results)} decks to {out_root} "
+        f"in {time.perf_counter() - started:.1f}s"
+    )
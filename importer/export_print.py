@@ -0,0 +1,210 @@
+"""Export a course's or topic's Frayer models as one printable HTML document.
+
+Each word version gets a page of its own; print the file from a browser
+(or save it as PDF there) to get a pack for the classroom. Versions are read
+from the database a chunk at a time, rendered by a process pool and written
+to disk in glossary order as they come back, so memory stays bounded however
+big the course is.
+"""
+
+import html
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+# Allow `python importer/export_print.py` to import the package
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from importer.export_site import STYLE, ExportError, render_frayer, use_database
+
+# Versions read per get_word_versions_for_course call
+VERSION_CHUNK_SIZE = 100
+# Pages queued per worker; bounds memory however big the course is
+IN_FLIGHT_PER_WORKER = 8
+
+PRINT_STYLE = """
+@page { size: A4 landscape; margin: 12mm; }
+body { max-width: none; margin: 0; }
+.page { break-after: page; page-break-after: always; }
+.page:last-child { break-after: auto; page-break-after: auto; }
+.frayer { margin-bottom: 0; }
+.frayer section { break-inside: avoid; }
+.cover { display: flex; flex-direction: column; justify-content: center;
+         min-height: 80vh; text-align: center; }
+.topics { color: #666; font-size: 0.8rem; }
+@media screen {
+    body { max-width: 60rem; margin: 2rem auto; padding: 0 1rem; }
+    .page { border-bottom: 1px dashed #ccc; padding-bottom: 1rem; margin-bottom: 2rem; }
+}
+"""
+
+
+# ================================================================
+# Versions
+# ================================================================
+
+
+def find_course(course_ref: str):
+    """Find a course from '<subject slug>/<course slug>'."""
+    from app.core.repositories.courses_repo import get_courses
+
+    subject_slug, _, course_slug = course_ref.partition("/")
+    for course in get_courses.__wrapped__():
+        if course.subject.slug == subject_slug and course.slug == course_slug:
+            return course
+    raise ExportError(f"No course '{course_ref}' (expected <subject>/<course>)")
+
+
+def find_topic(course, code: str):
+    from app.core.repositories.topics_repo import get_topics_for_course
+
+    for topic in get_topics_for_course.__wrapped__(course, True):
+        if topic.code == code:
+            return topic
+    raise ExportError(f"No topic '{code}' with words in '{course.name}'")
+
+
+def iter_versions(course, topic=None):
+    """Yield serialised word versions in glossary order, a chunk at a time."""
+    from app.api import serializers
+    from app.core.repositories.words_repo import (
+        get_word_versions_for_course,
+        get_word_versions_for_topic,
+    )
+
+    if topic is not None:
+        for version in get_word_versions_for_topic(topic):
+            yield serializers.word_version_to_dict(version)
+        return
+
+    offset = 0
+    while True:
+        chunk = get_word_versions_for_course(
+            course, offset=offset, limit=VERSION_CHUNK_SIZE
+        )
+        for version in chunk:
+            yield serializers.word_version_to_dict(version)
+        if len(chunk) < VERSION_CHUNK_SIZE:
+            return
+        offset += VERSION_CHUNK_SIZE
+
+
+# ================================================================
+# Rendering (runs in the worker processes)
+# ================================================================
+
+
+def render_page(version: dict) -> str:
+    """One printed page: the word's Frayer model and where it is taught."""
+    topics = ", ".join(f"{t['code']}: {t['name']}" for t in version["topics"])
+    return (
+        '<section class="page">'
+        f"<h2>{html.escape(version['word'])}</h2>"
+        f"{render_frayer(version)}"
+        f'<p class="topics">{html.escape(topics)}</p>'
+        "</section>\n"
+    )
+
+
+def _head(title: str, subtitle: str) -> str:
+    return (
+        "<!DOCTYPE html>\n"
+        '<html lang="en"><head><meta charset="utf-8">'
+        f"<title>{html.escape(title)} · FrayerStore</title>"
+        f"<style>{STYLE}{PRINT_STYLE}</style></head><body>\n"
+        '<section class="page cover">'
+        f"<h1>{html.escape(title)}</h1><p>{html.escape(subtitle)}</p>"
+        "</section>\n"
+    )
+
+
+# ================================================================
+# Export
+# ================================================================
+
+
+def default_filename(course, topic=None) -> str:
+    name = f"{course.subject.slug}-{course.slug}"
+    if topic is not None:
+        name += f"-{topic.code}"
+    return f"{name}.html"
+
+
+def export_print(
+    db_path: str,
+    course_ref: str,
+    out_path: str,
+    topic_code: str | None = None,
+    workers: int | None = None,
+) -> dict:
+    """Write the print document for a course, or one of its topics.
+
+    out_path may be a directory (anything without a file extension), in
+    which case the file is named after the course (and topic). The document
+    is written to a temporary file and moved into place when complete.
+
+    Returns:
+        The path written, the number of pages and the time taken.
+    """
+    use_database(db_path)
+    started = time.perf_counter()
+
+    course = find_course(course_ref)
+    topic = find_topic(course, topic_code) if topic_code else None
+    if os.path.isdir(out_path) or not os.path.splitext(out_path)[1]:
+        out_path = os.path.join(out_path, default_filename(course, topic))
+    os.makedirs(os.path.dirname(os.path.abspath(out_path)), exist_ok=True)
+
+    title = f"{course.name} glossary"
+    subtitle = course.subject.name
+    if topic is not None:
+        title = f"{topic.code}: {topic.name}"
+        subtitle = f"{course.name} · {course.subject.name}"
+
+    workers = workers or os.cpu_count() or 1
+    pages = 0
+    tmp_path = out_path + ".tmp"
+    try:
+        with (
+            open(tmp_path, "w", encoding="utf-8") as out,
+            ProcessPoolExecutor(max_workers=workers) as pool,
+        ):
+            out.write(_head(title, subtitle))
+            # futures are written in submission order, keeping glossary order
+            in_flight = deque()
+            for version in iter_versions(course, topic):
+                in_flight.append(pool.submit(render_page, version))
+                if len(in_flight) >= workers * IN_FLIGHT_PER_WORKER:
+                    out.write(in_flight.popleft().result())
+                    pages += 1
+            while in_flight:
+                out.write(in_flight.popleft().result())
+                pages += 1
+            out.write("</body></html>\n")
+        os.replace(tmp_path, out_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    return {"path": out_path, "pages": pages, "seconds": time.perf_counter() - started}
+
+
+def main(
+    db_path: str,
+    course_ref: str,
+    out_path: str,
+    topic_code: str | None = None,
+    workers: int | None = None,
+) -> None:
+    try:
+        result = export_print(db_path, course_ref, out_path, topic_code, workers)
+    except ExportError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    print(
+        f"✅ Wrote {result['pages']} Frayer models to {result['path']} "
+        f"in {result['seconds']:.1f}s"
+    )
@@ -0,0 +1,466 @@
+"""Export the glossary as a static site of HTML and JSON files.
+
+    site/
+        index.html
+        style.css
+        manifest.json
+        words/<subject>/<word>.html|.json
+        courses/<subject>/<course>/index.html|glossary.json
+        courses/<subject>/<course>/topics/<code>.html|.json
+
+Each page's JSON payload is built in this process and fingerprinted. Only
+pages whose fingerprint differs from manifest.json (or whose files are
+missing) are handed to a process pool to render and write, so re-exporting
+after an import only rewrites what the import changed. Database ids are left
+out of the payloads because a rebuild renumbers them without changing any
+content. Pages that no longer exist are deleted.
+"""
+
+import hashlib
+import html
+import json
+import os
+import posixpath
+import re
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+# Allow `python importer/export_site.py` to import the package
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+# Bump when the templates change, so every page is rendered again
+RENDER_VERSION = 1
+MANIFEST = "manifest.json"
+# Words loaded per get_words_full_bulk call
+WORD_BATCH_SIZE = 200
+# Pages queued per worker; bounds memory however big the catalogue is
+IN_FLIGHT_PER_WORKER = 8
+# Save the manifest this often, so an interrupted export keeps its progress
+MANIFEST_SAVE_EVERY = 500
+
+STYLE = """
+body { font-family: system-ui, sans-serif; max-width: 60rem; margin: 2rem auto;
+       padding: 0 1rem; line-height: 1.5; color: #222; }
+a { color: #1f5fa8; }
+nav { font-size: 0.9rem; margin-bottom: 1rem; }
+.frayer { display: grid; grid-template-columns: 1fr 1fr; gap: 0.75rem;
+          margin-bottom: 2rem; }
+.frayer section { border: 1px solid #ccc; border-radius: 0.5rem; padding: 0.75rem; }
+.frayer h3 { margin: 0 0 0.5rem; font-size: 1rem; }
+.frayer-word { grid-column: 1 / 3; text-align: center; font-size: 1.8rem;
+               font-weight: 600; }
+.levels { color: #666; font-size: 0.9rem; }
+pre { background: #f5f5f5; padding: 0.5rem; overflow-x: auto; }
+code { background: #f5f5f5; padding: 0 0.2rem; }
+.letters a { margin-right: 0.4rem; }
+"""
+
+
+class ExportError(Exception):
+    pass
+
+
+# ================================================================
+# Database
+# ================================================================
+
+
+def use_database(db_path: str) -> None:
+    """Point the app repositories, which the exports read through, at db_path.
+
+    app.core.db fixes its path when it is first imported, so this must run
+    before anything imports it; a process already reading another database
+    cannot be switched.
+
+    Raises:
+        ExportError: if db_path does not exist, or app.core.db has already
+            been imported with a different path.
+    """
+    if not os.path.isfile(db_path):
+        raise ExportError(f"Database not found: {db_path}")
+    os.environ["FRAYERSTORE_DB_PATH"] = db_path
+
+    from app.core import db
+
+    if os.path.abspath(db.DB_PATH) != os.path.abspath(db_path):
+        raise ExportError(
+            f"The app is already reading {db.DB_PATH}; "
+            f"export {db_path} from a new process"
+        )
+
+
+# ================================================================
+# Payloads
+# ================================================================
+
+
+def _without_ids(data):
+    if isinstance(data, dict):
+        return {
+            k: _without_ids(v) for k, v in data.items() if k not in ("id", "version_id")
+        }
+    if isinstance(data, list):
+        return [_without_ids(v) for v in data]
+    return data
+
+
+def fingerprint(payload) -> str:
+    text = json.dumps([RENDER_VERSION, payload], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def word_path(subject_slug: str, word_slug: str) -> str:
+    return f"words/{subject_slug}/{word_slug}.html"
+
+
+def course_path(course: dict) -> str:
+    return f"courses/{course['subject']['slug']}/{course['slug']}/index.html"
+
+
+def topic_path(course: dict, code: str) -> str:
+    return f"courses/{course['subject']['slug']}/{course['slug']}/topics/{code}.html"
+
+
+def iter_pages():
+    """Yield (kind, path, payload) for every page of the site."""
+    from app.api import serializers
+    from app.core.db import get_db
+    from app.core.repositories.courses_repo import get_courses
+    from app.core.repositories.topics_repo import get_topics_for_course
+    from app.core.repositories.words_repo import (
+        get_word_versions_for_course,
+        get_word_versions_for_topic,
+        get_words_full_bulk,
+    )
+
+    courses = get_courses.__wrapped__()
+    yield "index", "index.html", [serializers.course_to_dict(c) for c in courses]
+
+    for course in courses:
+        course_data = serializers.course_to_dict(course)
+        topics = get_topics_for_course.__wrapped__(course, True)
+        versions = sorted(get_word_versions_for_course(course))
+        yield "course", course_path(course_data), {
+            "course": course_data,
+            "topics": [serializers.topic_to_dict(t) for t in topics],
+            "words": _without_ids(
+                [serializers.word_version_to_dict(v) for v in versions]
+            ),
+        }
+        for topic in topics:
+            versions = sorted(get_word_versions_for_topic(topic))
+            yield "topic", topic_path(course_data, topic.code), {
+                "course": course_data,
+                "topic": serializers.topic_to_dict(topic),
+                "words": _without_ids(
+                    [serializers.word_version_to_dict(v) for v in versions]
+                ),
+            }
+
+    slugs = [
+        (r["subject_slug"], r["word_slug"])
+        for r in get_db().execute(
+            """
+            SELECT s.slug AS subject_slug, w.slug AS word_slug
+            FROM Words w
+            JOIN Subjects s ON s.id = w.subject_id
+            ORDER BY s.slug, w.slug
+            """
+        )
+    ]
+    for start in range(0, len(slugs), WORD_BATCH_SIZE):
+        words = get_words_full_bulk(slugs[start : start + WORD_BATCH_SIZE])
+        for (subject_slug, word_slug), word in words.items():
+            yield "word", word_path(subject_slug, word_slug), _without_ids(
+                serializers.word_to_dict(word)
+            )
+
+
+# ================================================================
+# Rendering (runs in the worker processes)
+# ================================================================
+
+
+def _inline(text: str) -> str:
+    """Escape text and apply the Markdown the YAML uses: `code` and **bold**."""
+    parts = re.split(r"(`[^`]+`)", text)
+    out = []
+    for part in parts:
+        if part.startswith("`") and part.endswith("`") and len(part) > 1:
+            out.append(f"<code>{html.escape(part[1:-1])}</code>")
+        else:
+            escaped = html.escape(part)
+            out.append(re.sub(r"\*\*(.+?)\*\*", r"<strong>\1</strong>", escaped))
+    return "".join(out)
+
+
+def _paragraphs(text: str | None) -> str:
+    blocks = [b.strip() for b in (text or "").split("\n\n") if b.strip()]
+    return "".join(f"<p>{_inline(b)}</p>" for b in blocks)
+
+
+def _items(items: list[str]) -> str:
+    """Bullets for text items and <pre> blocks for fenced code, like render_list."""
+    out, bullets = [], []
+
+    def flush():
+        if bullets:
+            out.append("<ul>" + "".join(f"<li>{b}</li>" for b in bullets) + "</ul>")
+            bullets.clear()
+
+    for item in items:
+        item = item.strip()
+        if item.startswith("```"):
+            flush()
+            lines = item.split("\n")
+            language = lines[0].strip("`").strip()
+            code = "\n".join(lines[1:-1])
+            cls = f' class="language-{html.escape(language)}"' if language else ""
+            out.append(f"<pre><code{cls}>{html.escape(code)}</code></pre>")
+        else:
+            bullets.append(_inline(item))
+    flush()
+    return "".join(out)
+
+
+def _link(from_path: str, to_path: str, label: str) -> str:
+    href = posixpath.relpath(to_path, posixpath.dirname(from_path))
+    return f'<a href="{html.escape(href)}">{html.escape(label)}</a>'
+
+
+def render_frayer(version: dict) -> str:
+    """One Frayer model as HTML, from a serialised word version."""
+    levels = ", ".join(version["levels"]) or "All levels"
+    return (
+        f'<p class="levels">{html.escape(levels)}</p>'
+        '<div class="frayer">'
+        f"<section><h3>Definition</h3>{_paragraphs(version['definition'])}</section>"
+        f"<section><h3>Characteristics</h3>{_items(version['characteristics'])}</section>"
+        f'<div class="frayer-word">{html.escape(version["word"])}</div>'
+        f"<section><h3>Examples</h3>{_items(version['examples'])}</section>"
+        f"<section><h3>Non-examples</h3>{_items(version['non_examples'])}</section>"
+        "</div>"
+    )
+
+
+def _document(path: str, title: str, body: str) -> str:
+    style = posixpath.relpath("style.css", posixpath.dirname(path))
+    home = _link(path, "index.html", "FrayerStore")
+    return (
+        "<!DOCTYPE html>\n"
+        '<html lang="en"><head><meta charset="utf-8">'
+        '<meta name="viewport" content="width=device-width, initial-scale=1">'
+        f"<title>{html.escape(title)} · FrayerStore</title>"
+        f'<link rel="stylesheet" href="{style}"></head>'
+        f"<body><nav>{home}</nav><h1>{html.escape(title)}</h1>{body}</body></html>\n"
+    )
+
+
+def render_index(path: str, courses: list[dict]) -> str:
+    items = "".join(
+        f"<li>{_link(path, course_path(c), c['name'])} "
+        f"<span class=\"levels\">{html.escape(c['subject']['name'])}"
+        f"{', ' + html.escape(c['level']['name']) if c['level'] else ''}</span></li>"
+        for c in courses
+    )
+    return _document(path, "Glossaries", f"<ul>{items}</ul>")
+
+
+def _word_list(path: str, words: list[dict]) -> str:
+    by_letter: dict[str, list[dict]] = {}
+    for v in words:
+        first = v["word"][:1].upper()
+        by_letter.setdefault(first if first.isalpha() else "#", []).append(v)
+
+    letters = sorted(by_letter, key=lambda l: (l == "#", l))
+    index = "".join(f'<a href="#letter-{l}">{l}</a>' for l in letters)
+    sections = []
+    for letter in letters:
+        entries = "".join(
+            f"<h3>{_link(path, word_path(v['subject'], v['word_slug']), v['word'])}</h3>"
+            f"{render_frayer(v)}"
+            for v in by_letter[letter]
+        )
+        sections.append(f'<h2 id="letter-{letter}">{letter}</h2>{entries}')
+    return f'<p class="letters">{index}</p>' + "".join(sections)
+
+
+def render_course(path: str, data: dict) -> str:
+    course = data["course"]
+    topics = "".join(
+        "<li>"
+        + _link(path, topic_path(course, t["code"]), f"{t['code']}: {t['name']}")
+        + "</li>"
+        for t in data["topics"]
+    )
+    body = f"<h2>Topics</h2><ul>{topics}</ul>" + _word_list(path, data["words"])
+    return _document(path, f"{course['name']} glossary", body)
+
+
+def render_topic(path: str, data: dict) -> str:
+    course, topic = data["course"], data["topic"]
+    body = (
+        f"<p>{_link(path, course_path(course), course['name'])}</p>"
+        + _word_list(path, data["words"])
+    )
+    return _document(path, f"{topic['code']}: {topic['name']}", body)
+
+
+def render_word(path: str, word: dict) -> str:
+    parts = [render_frayer(v) for v in word["versions"]]
+    if word["synonyms"]:
+        parts.append(
+            "<p><strong>Synonyms:</strong> "
+            + html.escape(", ".join(word["synonyms"]))
+            + "</p>"
+        )
+    if word["related_words"]:
+        links = ", ".join(
+            _link(path, word_path(r["subject"], r["slug"]), r["word"])
+            for r in word["related_words"]
+        )
+        parts.append(f"<p><strong>Related words:</strong> {links}</p>")
+    return _document(path, word["word"], "".join(parts))
+
+
+RENDERERS = {
+    "index": render_index,
+    "course": render_course,
+    "topic": render_topic,
+    "word": render_word,
+}
+
+
+def json_path(kind: str, path: str) -> str:
+    if kind == "course":
+        return posixpath.join(posixpath.dirname(path), "glossary.json")
+    return posixpath.splitext(path)[0] + ".json"
+
+
+def _write(path: str, text: str) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+def write_page(out_root: str, kind: str, path: str, payload) -> str:
+    """Render one page and write its HTML and JSON files."""
+    _write(os.path.join(out_root, path), RENDERERS[kind](path, payload))
+    _write(
+        os.path.join(out_root, json_path(kind, path)),
+        json.dumps(payload, ensure_ascii=False, indent=1),
+    )
+    return path
+
+
+# ================================================================
+# Export
+# ================================================================
+
+
+def _load_manifest(out_root: str) -> dict[str, dict]:
+    try:
+        with open(os.path.join(out_root, MANIFEST), encoding="utf-8") as f:
+            return json.load(f)["pages"]
+    except (OSError, ValueError, KeyError):
+        return {}
+
+
+def _save_manifest(out_root: str, pages: dict[str, dict]) -> None:
+    _write(
+        os.path.join(out_root, MANIFEST),
+        json.dumps({"render_version": RENDER_VERSION, "pages": pages}, indent=1),
+    )
+
+
+def _remove(out_root: str, relative: str) -> None:
+    try:
+        os.remove(os.path.join(out_root, relative))
+    except FileNotFoundError:
+        pass
+
+
+def export_site(db_path: str, out_root: str, workers: int | None = None) -> dict:
+    """Bring the static site under out_root up to date with the database.
+
+    Returns:
+        Counts of pages written, unchanged and removed.
+    """
+    use_database(db_path)
+    started = time.perf_counter()
+    os.makedirs(out_root, exist_ok=True)
+    _write(os.path.join(out_root, "style.css"), STYLE.lstrip())
+
+    previous = _load_manifest(out_root)
+    current: dict[str, dict] = {}
+    written = unchanged = 0
+    workers = workers or os.cpu_count() or 1
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        in_flight = {}
+
+        def collect(done):
+            nonlocal written
+            for future in done:
+                path = future.result()
+                current[path] = in_flight.pop(future)
+                written += 1
+                if written % MANIFEST_SAVE_EVERY == 0:
+                    _save_manifest(out_root, {**previous, **current})
+
+        for kind, path, payload in iter_pages():
+            entry = {"kind": kind, "hash": fingerprint(payload)}
+            old = previous.get(path)
+            if (
+                old == entry
+                and os.path.exists(os.path.join(out_root, path))
+                and os.path.exists(os.path.join(out_root, json_path(kind, path)))
+            ):
+                current[path] = entry
+                unchanged += 1
+                continue
+
+            future = pool.submit(write_page, out_root, kind, path, payload)
+            in_flight[future] = entry
+            if len(in_flight) >= workers * IN_FLIGHT_PER_WORKER:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                collect(done)
+
+        collect(wait(in_flight).done)
+
+    removed = 0
+    for path, entry in previous.items():
+        if path not in current:
+            _remove(out_root, path)
+            _remove(out_root, json_path(entry["kind"], path))
+            removed += 1
+    _save_manifest(out_root, current)
+
+    return {
+        "written": written,
+        "unchanged": unchanged,
+        "removed": removed,
+        "seconds": time.perf_counter() - started,
+    }
+
+
+def main(db_path: str, out_root: str, workers: int | None = None) -> None:
+    try:
+        result = export_site(db_path, out_root, workers)
+    except ExportError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    print(
+        f"✅ Exported site to {out_root} in {result['seconds']:.1f}s: "
+        f"{result['written']} pages written, {result['unchanged']} unchanged, "
+        f"{result['removed']} removed"
+    )
+
+
+if __name__ == "__main__":
+    from importer.config import CONFIG
+
+    main(CONFIG["database"], CONFIG["site_root"])
@@ -0,0 +1,173 @@
+"""Maintain CourseGraphLayouts: fixed Relationship Graph positions per course.
+
+The Relationship Graph is drawn with physics off, so every word needs an x/y
+position. Laying out a large course takes seconds, so it is done here, after
+an import, instead of on a page request. A course's layout covers the words
+the page shows for it: words of the course's subject, taught in one of its
+topics and with a version at its level (see graph_filters.filter_words), and
+the relationships between them.
+
+Anything that changes which words a course has, or their relationships, must
+call refresh_graph_layouts afterwards for the words it changed. Imports take
+a snapshot_course_words before they start and pass it to
+refresh_changed_layouts; a full build lays out every course once at the end.
+The page lays out what it draws itself when a course has no complete stored
+layout.
+"""
+
+import json
+import sqlite3
+
+import numpy as np
+
+from app.core.graph_layout import connected_components, edge_ordinals, layout_graph
+
+# (course, word) for every word shown on a course's graph
+COURSE_WORD_PAIRS_SQL = """
+SELECT DISTINCT c.id AS course_id, w.id AS word_id
+FROM Courses c
+JOIN Topics t ON t.course_id = c.id
+JOIN WordVersionContexts wvc ON wvc.topic_id = t.id
+JOIN WordVersions wv ON wv.id = wvc.word_version_id
+JOIN Words w ON w.id = wv.word_id AND w.subject_id = c.subject_id
+WHERE {where}
+  AND EXISTS (
+    SELECT 1
+    FROM WordVersions lv
+    JOIN WordVersionLevels wvl ON wvl.word_version_id = lv.id
+    WHERE lv.word_id = w.id AND wvl.level_id = c.level_id
+  )
+ORDER BY c.id, w.id
+"""
+
+COURSE_WORDS_SQL = COURSE_WORD_PAIRS_SQL.format(where="c.id = :course_id")
+ALL_COURSE_WORDS_SQL = COURSE_WORD_PAIRS_SQL.format(where="true")
+
+COURSE_RELS_SQL = """
+SELECT word_id1, word_id2
+FROM WordRelationships
+WHERE word_id1 IN (SELECT value FROM json_each(:word_ids))
+  AND word_id2 IN (SELECT value FROM json_each(:word_ids))
+"""
+
+# courses teaching any of the given words
+COURSES_FOR_WORDS_SQL = """
+SELECT DISTINCT t.course_id
+FROM WordVersions wv
+JOIN WordVersionContexts wvc ON wvc.word_version_id = wv.id
+JOIN Topics t ON t.id = wvc.topic_id
+WHERE wv.word_id IN (SELECT value FROM json_each(:word_ids))
+"""
+
+# courses never laid out, e.g. right after migration 0005
+UNLAID_COURSES_SQL = """
+SELECT c.id
+FROM Courses c
+WHERE NOT EXISTS (SELECT 1 FROM CourseGraphLayouts l WHERE l.course_id = c.id)
+"""
+
+PRUNE_SQL = """
+DELETE FROM CourseGraphLayouts
+WHERE course_id NOT IN (SELECT id FROM Courses)
+   OR word_id NOT IN (SELECT id FROM Words)
+"""
+
+
+def layout_course(conn: sqlite3.Connection, course_id: int) -> list[tuple]:
+    """Lay out one course's graph.
+
+    Returns:
+        (course_id, word_id, x, y) for every word shown for the course.
+    """
+    word_ids = np.array(
+        [r[1] for r in conn.execute(COURSE_WORDS_SQL, {"course_id": course_id})],
+        dtype=np.int64,
+    )
+    rels = np.array(
+        [
+            tuple(r)
+            for r in conn.execute(
+                COURSE_RELS_SQL, {"word_ids": json.dumps(word_ids.tolist())}
+            )
+        ],
+        dtype=np.int64,
+    ).reshape(-1, 2)
+
+    a_idx, b_idx = edge_ordinals(word_ids, rels[:, 0], rels[:, 1])
+    n = len(word_ids)
+    xs, ys = layout_graph(n, a_idx, b_idx, connected_components(n, a_idx, b_idx))
+    return [
+        (course_id, word_id, x, y)
+        for word_id, x, y in zip(word_ids.tolist(), xs.tolist(), ys.tolist())
+    ]
+
+
+def refresh_graph_layouts(
+    conn: sqlite3.Connection,
+    word_ids: list[int] | None = None,
+    course_ids: list[int] = (),
+) -> tuple[int, int]:
+    """Lay out the courses that teach the given words again.
+
+    Args:
+        conn: An open connection; the caller commits.
+        word_ids: Only courses teaching these words (e.g. both sides of a
+            new relationship). None lays out every course.
+        course_ids: Also lay out these courses, e.g. ones that no longer
+            teach a changed word.
+
+    Returns:
+        (courses laid out, stale positions removed)
+    """
+    if word_ids is None:
+        course_ids = [r[0] for r in conn.execute("SELECT id FROM Courses")]
+    else:
+        ids = json.dumps(sorted(set(word_ids)))
+        course_ids = sorted(
+            {r[0] for r in conn.execute(COURSES_FOR_WORDS_SQL, {"word_ids": ids})}
+            | set(course_ids)
+        )
+
+    for course_id in course_ids:
+        rows = layout_course(conn, course_id)
+        conn.execute("DELETE FROM CourseGraphLayouts WHERE course_id = ?", (course_id,))
+        conn.executemany(
+            "INSERT INTO CourseGraphLayouts (course_id, word_id, x, y) "
+            "VALUES (?, ?, ?, ?)",
+            rows,
+        )
+    removed = conn.execute(PRUNE_SQL).rowcount
+    return len(course_ids), removed
+
+
+def snapshot_course_words(conn: sqlite3.Connection) -> set[tuple[int, int]]:
+    """(course, word) for every word currently shown on a course's graph."""
+    return {(r[0], r[1]) for r in conn.execute(ALL_COURSE_WORDS_SQL)}
+
+
+def refresh_changed_layouts(
+    conn: sqlite3.Connection, before: set[tuple[int, int]]
+) -> None:
+    """Lay out only the courses whose words changed since the snapshot.
+
+    Relationships are not imported from YAML, so a course's graph only
+    changes when words join or leave it. Courses with no stored layout at
+    all are laid out too.
+    """
+    after = snapshot_course_words(conn)
+    changed = before ^ after
+    # courses a word left are no longer found through that word
+    course_ids = {course_id for course_id, _ in before - after}
+    course_ids.update(r[0] for r in conn.execute(UNLAID_COURSES_SQL))
+    courses, removed = refresh_graph_layouts(
+        conn,
+        word_ids=[word_id for _, word_id in changed],
+        course_ids=sorted(course_ids),
+    )
+    print(f"✓ Graph layouts: {courses} courses laid out, {removed} stale removed")
+
+
+def refresh_layouts_and_report(conn: sqlite3.Connection) -> None:
+    """Lay out every course again and print an importer status line."""
+    courses, removed = refresh_graph_layouts(conn)
+    print(f"✓ Graph layouts: {courses} courses laid out, {removed} stale removed")
@@ -1,5 +1,6 @@
 from importer.yaml_utils import load_yaml
 from importer.db_utils import db_connection, get_or_create_level
+from importer.word_documents import refresh_and_report
 
 
 def import_levels(levels_path, db_path):
@@ -16,5 +17,6 @@ def import_levels(levels_path, db_path):
             name = level["name"].strip()
             description = (level.get("description") or "").strip()
             get_or_create_level(conn, name, description)
-
-    print(f"✓ Imported {len(levels_data)} levels.")
+        print(f"✓ Imported {len(levels_data)} levels.")
+        # level names and descriptions appear in the documents
+        refresh_and_report(conn)
@@ -2,11 +2,15 @@ import os
 from importer.yaml_utils import load_yaml
 from importer.import_courses import import_course
 from importer.db_utils import db_connection, get_or_create_subject
+from importer.graph_layouts import refresh_changed_layouts, snapshot_course_words
+from importer.word_documents import refresh_and_report
 
 
-def import_subjects(subjects_yaml_path, subjects_root, db_path):
+def import_subjects(subjects_yaml_path, subjects_root, db_path, update_layouts=True):
     """
     Imports subjects and their courses (and topics) from YAML.
+
+    update_layouts=False leaves the course graph layouts to the caller.
     """
     data = load_yaml(subjects_yaml_path)
     subjects = data.get("subjects", [])
@@ -15,6 +19,8 @@ def import_subjects(subjects_yaml_path, subjects_root, db_path):
         return
 
     with db_connection(db_path) as conn:
+        layout_snapshot = snapshot_course_words(conn) if update_layouts else None
+
         for subj in subjects:
             subject_name = subj["name"].strip()
             subject_id = get_or_create_subject(conn, subject_name)
@@ -29,3 +35,9 @@ def import_subjects(subjects_yaml_path, subjects_root, db_path):
 
                 # ✅ pass the existing connection instead of db_path
                 import_course(conn, subject_id, course_path)
+
+        # course and topic names appear in the documents
+        refresh_and_report(conn)
+        # topics decide which words each course graph shows
+        if update_layouts:
+            refresh_changed_layouts(conn, layout_snapshot)
@@ -13,6 +13,8 @@ from importer.db_utils import (
 )
 from collections import defaultdict
 from importer.yaml_utils import load_word_file, clean_list
+from importer.graph_layouts import refresh_changed_layouts, snapshot_course_words
+from importer.word_documents import refresh_and_report
 
 
 def find_word_files(subjects_root):
@@ -31,9 +33,13 @@ def find_word_files(subjects_root):
     return word_files
 
 
-def import_words(subjects_root: str, db_path: str) -> None:
+def import_words(subjects_root: str, db_path: str, update_layouts: bool = True) -> None:
     """Recursively import all YAML word files under any 'words' directory and
-    show a detailed summary per word."""
+    show a detailed summary per word.
+
+    update_layouts=False leaves the course graph layouts to the caller (a
+    full build lays every course out once at the end).
+    """
 
     word_files = find_word_files(subjects_root)
     if not word_files:
@@ -65,6 +71,8 @@ def import_words(subjects_root: str, db_path: str) -> None:
     total_synonym_files = len(synonym_files)
 
     with db_connection(db_path) as conn:
+        layout_snapshot = snapshot_course_words(conn) if update_layouts else None
+
         # Group version files by (subject_id, word_name)
         groups: dict[tuple[int, str], list[str]] = group_word_files(conn, version_files)
         total_word_groups = len(groups)
@@ -107,6 +115,10 @@ def import_words(subjects_root: str, db_path: str) -> None:
                 }
             )
 
+        refresh_and_report(conn)
+        if update_layouts:
+            refresh_changed_layouts(conn, layout_snapshot)
+
     # --------------------------
     # Final summary
     # --------------------------
@@ -0,0 +1,145 @@
+"""Versioned schema migrations for Words.db.
+
+Migrations are SQL files in importer/migrations named NNNN_description.sql,
+applied in order of NNNN. schema.sql always describes the latest schema, so
+a migration should be written to be harmless on a database built from it
+(CREATE ... IF NOT EXISTS and the like); it exists to bring older databases
+forward without a rebuild.
+
+Each applied migration is recorded in schema_version, and the latest version
+is mirrored in PRAGMA user_version so an up-to-date database costs a single
+header read to check.
+"""
+
+import os
+import re
+import sqlite3
+from dataclasses import dataclass
+
+from importer.db_utils import db_connection
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "migrations")
+
+MIGRATION_FILE = re.compile(r"^(\d{4})_(\w+)\.sql$")
+
+SCHEMA_VERSION_TABLE = """
+CREATE TABLE IF NOT EXISTS schema_version (
+    version INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    applied_at DATETIME DEFAULT CURRENT_TIMESTAMP
+)
+"""
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    name: str
+    path: str
+
+    def statements(self) -> list[str]:
+        """Split the file into statements that can be run one at a time.
+
+        executescript() would commit the surrounding transaction, so the
+        runner executes each statement itself.
+        """
+        with open(self.path, encoding="utf-8") as f:
+            sql = f.read()
+
+        statements = []
+        current = ""
+        for line in sql.splitlines(keepends=True):
+            current += line
+            if sqlite3.complete_statement(current):
+                statements.append(current.strip())
+                current = ""
+        if current.strip() and not current.strip().startswith("--"):
+            raise ValueError(f"Incomplete statement at end of {self.path}")
+        return statements
+
+
+def discover_migrations(migrations_dir: str = MIGRATIONS_DIR) -> list[Migration]:
+    migrations = []
+    for filename in os.listdir(migrations_dir):
+        match = MIGRATION_FILE.match(filename)
+        if match:
+            migrations.append(
+                Migration(
+                    version=int(match.group(1)),
+                    name=match.group(2),
+                    path=os.path.join(migrations_dir, filename),
+                )
+            )
+    migrations.sort(key=lambda m: m.version)
+
+    versions = [m.version for m in migrations]
+    if len(versions) != len(set(versions)):
+        raise ValueError(f"Duplicate migration versions in {migrations_dir}")
+    return migrations
+
+
+def get_schema_version(conn: sqlite3.Connection) -> int:
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def pending_migrations(
+    conn: sqlite3.Connection, migrations: list[Migration]
+) -> list[Migration]:
+    current = get_schema_version(conn)
+    return [m for m in migrations if m.version > current]
+
+
+def apply_migrations(
+    conn: sqlite3.Connection, migrations: list[Migration] | None = None
+) -> list[Migration]:
+    """Apply every pending migration in a single transaction.
+
+    Either all pending migrations are applied or, on any error, none are.
+    Takes the write lock before re-checking the version, so concurrent
+    callers (e.g. two app processes starting at once) apply them only once.
+
+    Returns:
+        The migrations that were applied, oldest first.
+    """
+    if migrations is None:
+        migrations = discover_migrations()
+    if not migrations or not pending_migrations(conn, migrations):
+        return []
+
+    if conn.in_transaction:
+        conn.commit()
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        pending = pending_migrations(conn, migrations)
+        conn.execute(SCHEMA_VERSION_TABLE)
+        for migration in pending:
+            for statement in migration.statements():
+                conn.execute(statement)
+            conn.execute(
+                "INSERT OR REPLACE INTO schema_version (version, name) VALUES (?, ?)",
+                (migration.version, migration.name),
+            )
+        if pending:
+            # PRAGMA does not accept bound parameters
+            conn.execute(f"PRAGMA user_version = {int(pending[-1].version)}")
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+    return pending
+
+
+def migrate(db_path: str) -> list[Migration]:
+    """Bring the database at db_path up to date, printing what was applied."""
+    with db_connection(db_path) as conn:
+        before = get_schema_version(conn)
+        applied = apply_migrations(conn)
+        after = get_schema_version(conn)
+
+    if not applied:
+        print(f"✓ Schema is up to date (version {after})")
+    for migration in applied:
+        print(f"✓ Applied {migration.version:04d}_{migration.name}")
+    if applied:
+        print(f"✅ Migrated schema from version {before} to {after}")
+    return applied
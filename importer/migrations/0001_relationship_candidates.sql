@@ -0,0 +1,15 @@
+-- Review queue for detected relationship candidates
+CREATE TABLE IF NOT EXISTS RelationshipCandidates (
+    id INTEGER PRIMARY KEY,
+    word_id1 INTEGER NOT NULL REFERENCES Words(id) ON DELETE CASCADE,
+    word_id2 INTEGER NOT NULL REFERENCES Words(id) ON DELETE CASCADE,
+    status TEXT NOT NULL DEFAULT 'pending'
+        CHECK (status IN ('pending', 'approved', 'ignored')),
+    detected_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    reviewed_at DATETIME,
+    CHECK (word_id1 < word_id2),
+    UNIQUE (word_id1, word_id2)
+);
+
+CREATE INDEX IF NOT EXISTS idx_RelationshipCandidates_status
+    ON RelationshipCandidates (status, id);
@@ -0,0 +1,14 @@
+-- Indexes for the lookups the app makes by foreign key
+CREATE INDEX IF NOT EXISTS idx_WordVersions_word_id
+    ON WordVersions (word_id);
+
+CREATE INDEX IF NOT EXISTS idx_WordVersionContexts_topic_id
+    ON WordVersionContexts (topic_id, word_version_id);
+
+CREATE INDEX IF NOT EXISTS idx_WordRelationships_word_id2
+    ON WordRelationships (word_id2, word_id1);
+
+CREATE INDEX IF NOT EXISTS idx_Courses_subject_id
+    ON Courses (subject_id, level_id);
+
+ANALYZE;
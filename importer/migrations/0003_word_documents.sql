@@ -0,0 +1,7 @@
+-- One denormalised JSON document per word, so the app can load a word with
+-- a single primary-key read. Filled by importer.word_documents.
+CREATE TABLE IF NOT EXISTS WordDocuments (
+    word_id INTEGER PRIMARY KEY REFERENCES Words(id) ON DELETE CASCADE,
+    document TEXT NOT NULL,
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
@@ -0,0 +1,11 @@
+-- Glossary A–Z navigation: index each word under its upper-cased first
+-- letter, or '#' for anything else. The expression must stay identical to
+-- words_repo.WORD_INITIAL_SQL for the planner to use the index.
+CREATE INDEX IF NOT EXISTS idx_Words_initial
+    ON Words (
+        (CASE WHEN upper(substr(word, 1, 1)) BETWEEN 'A' AND 'Z'
+            THEN upper(substr(word, 1, 1)) ELSE '#' END),
+        word COLLATE NOCASE
+    );
+
+ANALYZE;
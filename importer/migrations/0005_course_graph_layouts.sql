@@ -0,0 +1,9 @@
+-- Precomputed Relationship Graph positions per course, so the page draws a
+-- course without laying it out. Filled by importer.graph_layouts.
+CREATE TABLE IF NOT EXISTS CourseGraphLayouts (
+    course_id INTEGER NOT NULL REFERENCES Courses(id) ON DELETE CASCADE,
+    word_id INTEGER NOT NULL REFERENCES Words(id) ON DELETE CASCADE,
+    x INTEGER NOT NULL,
+    y INTEGER NOT NULL,
+    PRIMARY KEY (course_id, word_id)
+) WITHOUT ROWID;
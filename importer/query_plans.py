@@ -0,0 +1,181 @@
+import re
+import sqlite3
+from dataclasses import dataclass
+
+# ================================================================
+# Configuration
+# ================================================================
+
+# Repository functions whose job is to read a whole table, so a full scan is
+# the right plan rather than a missing index.
+FULL_SCAN_ALLOWED = {
+    "get_all_levels",
+    "get_all_subjects",
+    "get_courses",
+    "load_words_and_rels",
+    "load_word_levels",
+    "load_word_courses",
+    # LIKE '%q%' cannot use an index
+    "search_raw",
+}
+
+SCAN_PATTERN = re.compile(r"^SCAN (\w+)")
+ALIAS_PATTERN = re.compile(
+    r"\b(?:FROM|JOIN)\s+(\w+)(?:\s+(?:AS\s+)?(?!ON\b|WHERE\b|JOIN\b|LEFT\b)(\w+))?",
+    re.IGNORECASE,
+)
+
+
+@dataclass
+class FullScan:
+    function: str
+    table: str
+    detail: str
+    sql: str
+
+
+# ================================================================
+# Capture
+# ================================================================
+
+
+def capture_repository_queries() -> list[tuple[str, str]]:
+    """Run every repository function once and record the SQL it executes.
+
+    Returns:
+        (module.function, expanded SQL) for each distinct statement.
+    """
+    from app.core.db import get_db
+    from app.core.sql_stats import repository_caller
+    from app.core.repositories import (
+        courses_repo,
+        levels_repo,
+        search_repo,
+        subjects_repo,
+        topics_repo,
+        word_graph_repo,
+        words_repo,
+    )
+    from app.services.search.search_models import SearchFilters
+
+    captured: dict[str, str] = {}
+
+    def trace(sql: str) -> None:
+        caller = repository_caller()
+        if caller is not None:
+            captured.setdefault(sql, caller)
+
+    conn = get_db()
+    conn.set_trace_callback(trace)
+    try:
+        subjects = subjects_repo.get_all_subjects()
+        levels_repo.get_all_levels()
+        courses = courses_repo.get_courses()
+        for subject in subjects[:1]:
+            levels_repo.get_levels_for_subject(subject.pk)
+            for slug, _ in word_graph_repo.load_subject_words(subject.pk)[:1]:
+                word_id = word_graph_repo.get_word_id(subject.slug, slug)
+                words_repo.get_word_by_word_slug_and_subject_slug.__wrapped__(
+                    slug, subject.slug
+                )
+                words_repo.get_word_full.__wrapped__(word_id)
+                words_repo.assemble_word_full(word_id)
+                words_repo.get_words_full_bulk([(subject.slug, slug)])
+                word_graph_repo.load_ego_network(word_id, 2)
+
+        for course in courses[:1]:
+            word_graph_repo.load_course_layout(course.pk)
+            topics = topics_repo.get_topics_for_course.__wrapped__(course, True)
+            words_repo.get_word_versions_for_course(course)
+            list(words_repo.iter_course_glossary(course))
+            words_repo.get_course_letter_counts(course)
+            for letter in ("A", "#"):
+                list(words_repo.iter_course_glossary(course, letter))
+                words_repo.get_word_versions_for_course(course, letter, 0, 50)
+            for topic in topics[:1]:
+                for version in words_repo.get_word_versions_for_topic(topic)[:1]:
+                    words_repo.get_word_version_by_id(version.pk)
+
+        word_graph_repo.load_words_and_rels()
+        word_graph_repo.load_word_levels()
+        word_graph_repo.load_word_courses()
+        search_repo.search_raw("a", SearchFilters())
+    finally:
+        conn.set_trace_callback(None)
+
+    return [(function, sql) for sql, function in captured.items()]
+
+
+# ================================================================
+# Plans
+# ================================================================
+
+
+def _aliases(sql: str) -> dict[str, str]:
+    return {
+        (alias or table).lower(): table
+        for table, alias in ALIAS_PATTERN.findall(sql)
+    }
+
+
+def find_full_scans(
+    schema_path: str, queries: list[tuple[str, str]]
+) -> list[FullScan]:
+    """EXPLAIN each query against an empty database built from schema_path.
+
+    The scratch database has no sqlite_stat1, so the planner assumes every
+    table is large: a SCAN in the plan means no index can serve the query,
+    whatever the size of the live data.
+    """
+    conn = sqlite3.connect(":memory:")
+    with open(schema_path, encoding="utf-8") as f:
+        conn.executescript(f.read())
+
+    tables = {
+        r[0].lower()
+        for r in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+    }
+    # views are expanded by the planner, so their aliases appear in plans too
+    view_aliases: dict[str, str] = {}
+    for (view_sql,) in conn.execute(
+        "SELECT sql FROM sqlite_master WHERE type = 'view'"
+    ):
+        view_aliases.update(_aliases(view_sql))
+
+    scans = []
+    for function, sql in queries:
+        if function.rsplit(".", 1)[-1] in FULL_SCAN_ALLOWED:
+            continue
+        aliases = {**view_aliases, **_aliases(sql)}
+        for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}"):
+            detail = row[3]
+            match = SCAN_PATTERN.match(detail)
+            if not match:
+                continue
+            table = aliases.get(match.group(1).lower(), match.group(1))
+            if table.lower() in tables:
+                scans.append(FullScan(function, table, detail, sql))
+
+    conn.close()
+    return scans
+
+
+def check_query_plans(schema_path: str) -> bool:
+    """Print any repository query that falls back to a full table scan.
+
+    Returns:
+        True if every query is served by an index.
+    """
+    queries = capture_repository_queries()
+    scans = find_full_scans(schema_path, queries)
+
+    print(f"✓ Checked {len(queries)} repository queries")
+    if not scans:
+        print("✅ No full table scans")
+        return True
+
+    for scan in scans:
+        sql = " ".join(scan.sql.split())
+        print(f"❌ {scan.function}: {scan.detail} ({scan.table})")
+        print(f"     {sql[:160]}")
+    return False
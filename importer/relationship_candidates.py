@@ -0,0 +1,263 @@
+import os
+import sqlite3
+from collections import defaultdict
+
+from importer.graph_layouts import refresh_graph_layouts
+from importer.word_documents import refresh_word_documents
+
+# ================================================================
+# Queue table
+# ================================================================
+
+# RelationshipCandidates arrived in a migration; callers migrate the database
+# once before using these helpers (see cli.py and word_relationships.py).
+STATUS_PENDING = "pending"
+STATUS_APPROVED = "approved"
+STATUS_IGNORED = "ignored"
+
+
+# ================================================================
+# Ignore file
+# ================================================================
+
+
+def load_ignore_list(ignore_file: str) -> set[tuple[int, int]]:
+    """
+    Load ignored relationships from file.
+    Only returns ID pairs, but the file contains word + subject info too.
+    """
+    ignored = set()
+
+    if os.path.exists(ignore_file):
+        with open(ignore_file, "r", encoding="utf-8") as f:
+            for line in f:
+                parts = line.strip().split(",")
+                # Expected format:
+                # id1,word1,subject1,id2,word2,subject2
+                if len(parts) == 6:
+                    id1, _, _, id2, _, _ = parts
+                    a, b = sorted((int(id1), int(id2)))
+                    ignored.add((a, b))
+
+    return ignored
+
+
+def save_ignored_pairs(
+    conn: sqlite3.Connection, ignore_file: str, pairs: list[tuple[int, int]]
+) -> None:
+    """
+    Append ignored pairs to the ignore file including:
+    id1,word1,subject_slug1,id2,word2,subject_slug2
+
+    The file outlives database rebuilds, so it stays the durable record of
+    rejected pairs; the queue status is only a working copy.
+    """
+    if not pairs:
+        return
+
+    with open(ignore_file, "a", encoding="utf-8") as f:
+        for id1, id2 in pairs:
+            a, b = sorted((id1, id2))
+            rows = {
+                r["id"]: r
+                for r in conn.execute(
+                    """
+                    SELECT w.id, w.word, s.slug AS subject_slug
+                    FROM Words w
+                    JOIN Subjects s ON s.id = w.subject_id
+                    WHERE w.id IN (?, ?)
+                    """,
+                    (a, b),
+                ).fetchall()
+            }
+            if a not in rows or b not in rows:
+                continue
+
+            row_a, row_b = rows[a], rows[b]
+            f.write(
+                f"{a},{row_a['word']},{row_a['subject_slug']},"
+                f"{b},{row_b['word']},{row_b['subject_slug']}\n"
+            )
+
+
+# ================================================================
+# Detection
+# ================================================================
+
+
+def load_word_texts(conn: sqlite3.Connection) -> list[dict]:
+    """
+    Load each word with its lowercased WordVersion text and synonyms.
+
+    Returns a list of dicts with keys: word_id, word, synonyms, all_text.
+    """
+    rows = conn.execute(
+        """
+        SELECT
+            w.id AS word_id,
+            LOWER(w.word) AS word,
+            LOWER(GROUP_CONCAT(COALESCE(wv.definition, ''), ' ')) AS definition,
+            LOWER(GROUP_CONCAT(COALESCE(wv.characteristics, ''), ' ')) AS characteristics,
+            LOWER(GROUP_CONCAT(COALESCE(wv.examples, ''), ' ')) AS examples,
+            LOWER(GROUP_CONCAT(COALESCE(wv.non_examples, ''), ' ')) AS non_examples
+        FROM Words w
+        LEFT JOIN WordVersions wv ON w.id = wv.word_id
+        GROUP BY w.id
+        """
+    ).fetchall()
+
+    synonyms: dict[int, list[str]] = defaultdict(list)
+    for r in conn.execute("SELECT word_id, LOWER(synonym) AS synonym FROM Synonyms"):
+        synonyms[r[0]].append(r[1])
+
+    words = []
+    for r in rows:
+        word_id = r[0]
+        syns = synonyms.get(word_id, [])
+        # Combine all text (and synonyms) into a single searchable block
+        all_text = " ".join(
+            [(r[2] or ""), (r[3] or ""), (r[4] or ""), (r[5] or "")] + syns
+        )
+        words.append(
+            {"word_id": word_id, "word": r[1], "synonyms": syns, "all_text": all_text}
+        )
+
+    return words
+
+
+def find_candidate_pairs(words: list[dict]) -> set[tuple[int, int]]:
+    """Find relationships based on text and synonyms.
+
+    A pair (i, j) is a candidate when word i, or one of its synonyms, appears
+    anywhere in word j's text. This is O(n²) in the number of words, which is
+    why it runs as a separate detection step rather than on every review rerun.
+    """
+    relationships = set()
+
+    for row_i in words:
+        id_i = row_i["word_id"]
+        word_i = row_i["word"]
+        synonyms_i = row_i["synonyms"]
+
+        for row_j in words:
+            id_j = row_j["word_id"]
+            if id_i == id_j:
+                continue
+
+            combined = row_j["all_text"]
+            if not combined:
+                continue
+
+            direct_match = word_i in combined
+            synonym_match = any(s in combined for s in synonyms_i)
+
+            if direct_match or synonym_match:
+                relationships.add(tuple(sorted((id_i, id_j))))
+
+    return relationships
+
+
+def detect_candidates(conn: sqlite3.Connection, ignore_file: str) -> int:
+    """
+    Run candidate detection and queue any new pairs as pending.
+
+    Pairs that already exist as relationships, are listed in the ignore file,
+    or are already queued (in any status) are left alone.
+
+    Returns:
+        int: the number of newly queued candidates.
+    """
+    existing = {
+        (r[0], r[1])
+        for r in conn.execute("SELECT word_id1, word_id2 FROM WordRelationships")
+    }
+    ignored = load_ignore_list(ignore_file)
+
+    pairs = find_candidate_pairs(load_word_texts(conn))
+    new_pairs = sorted(p for p in pairs if p not in existing and p not in ignored)
+
+    before = conn.total_changes
+    conn.executemany(
+        """
+        INSERT OR IGNORE INTO RelationshipCandidates (word_id1, word_id2)
+        VALUES (?, ?)
+        """,
+        new_pairs,
+    )
+    conn.commit()
+    return conn.total_changes - before
+
+
+# ================================================================
+# Review
+# ================================================================
+
+
+def count_candidates(conn: sqlite3.Connection, status: str = STATUS_PENDING) -> int:
+    row = conn.execute(
+        "SELECT COUNT(*) FROM RelationshipCandidates WHERE status = ?", (status,)
+    ).fetchone()
+    return row[0]
+
+
+def get_candidate_page(
+    conn: sqlite3.Connection,
+    offset: int,
+    limit: int,
+    status: str = STATUS_PENDING,
+) -> list[dict]:
+    """Return one page of queued candidates with their word labels."""
+    rows = conn.execute(
+        """
+        SELECT
+            rc.id,
+            rc.word_id1 AS id1,
+            w1.word AS word1,
+            rc.word_id2 AS id2,
+            w2.word AS word2
+        FROM RelationshipCandidates rc
+        JOIN Words w1 ON w1.id = rc.word_id1
+        JOIN Words w2 ON w2.id = rc.word_id2
+        WHERE rc.status = ?
+        ORDER BY rc.id
+        LIMIT ? OFFSET ?
+        """,
+        (status, limit, offset),
+    ).fetchall()
+    return [
+        {"id": r[0], "id1": r[1], "word1": r[2], "id2": r[3], "word2": r[4]}
+        for r in rows
+    ]
+
+
+def apply_reviews(
+    conn: sqlite3.Connection,
+    approved: list[tuple[int, int]],
+    ignored: list[tuple[int, int]],
+) -> None:
+    """
+    Record review decisions: approved pairs become WordRelationships and
+    both approved and ignored pairs leave the pending queue.
+    """
+    approved = [tuple(sorted(p)) for p in approved]
+    ignored = [tuple(sorted(p)) for p in ignored]
+
+    with conn:
+        conn.executemany(
+            """
+            INSERT OR IGNORE INTO WordRelationships (word_id1, word_id2)
+            VALUES (?, ?)
+            """,
+            approved,
+        )
+        conn.executemany(
+            """
+            UPDATE RelationshipCandidates
+            SET status = ?, reviewed_at = CURRENT_TIMESTAMP
+            WHERE word_id1 = ? AND word_id2 = ?
+            """,
+            [(STATUS_APPROVED, a, b) for a, b in approved]
+            + [(STATUS_IGNORED, a, b) for a, b in ignored],
+        )
+        refresh_word_documents(conn, [i for pair in approved for i in pair])
+        refresh_graph_layouts(conn, [i for pair in approved for i in pair])
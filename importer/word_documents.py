@@ -0,0 +1,156 @@
+"""Maintain WordDocuments: one denormalised JSON document per word.
+
+Each document holds everything the Model Viewer shows for a word (subject,
+versions with their levels and topics, synonyms and related words), so the
+app can load a word with one primary-key read and one json.loads instead of
+reassembling it from six tables.
+
+Documents are built entirely in SQL and only written when they differ from
+the stored one, so refreshing after an import touches only the words the
+import changed. Anything that changes a word, its topics or courses, its
+levels or its relationships must call refresh_word_documents afterwards.
+The format is read back by words_repo.word_from_document.
+"""
+
+import json
+import sqlite3
+
+# Bump with words_repo.WORD_DOCUMENT_VERSION when the format changes
+DOCUMENT_VERSION = 1
+
+# SQLite 3.40 has no ORDER BY inside aggregates, so each list is aggregated
+# from an ordered subquery. JSON built in a subquery loses its JSON subtype,
+# hence the json() around each element.
+WORD_DOCUMENT_SQL = f"""
+SELECT
+    w.id AS word_id,
+    json_object(
+        'v', {DOCUMENT_VERSION},
+        'id', w.id,
+        'word', w.word,
+        'slug', w.slug,
+        'subject', json_object('id', s.id, 'name', s.name, 'slug', s.slug),
+        'synonyms', (
+            SELECT json_group_array(synonym)
+            FROM (SELECT synonym FROM Synonyms WHERE word_id = w.id ORDER BY synonym)
+        ),
+        'related_words', (
+            SELECT json_group_array(json(doc))
+            FROM (
+                SELECT json_object(
+                    'id', o.id, 'word', o.word, 'slug', o.slug, 'subject_slug', os.slug
+                ) AS doc
+                FROM (
+                    SELECT word_id2 AS other_id FROM WordRelationships
+                    WHERE word_id1 = w.id
+                    UNION ALL
+                    SELECT word_id1 AS other_id FROM WordRelationships
+                    WHERE word_id2 = w.id
+                ) r
+                JOIN Words o ON o.id = r.other_id
+                JOIN Subjects os ON os.id = o.subject_id
+                ORDER BY o.word
+            )
+        ),
+        'versions', (
+            SELECT json_group_array(json(doc))
+            FROM (
+                SELECT json_object(
+                    'id', wv.id,
+                    'definition', wv.definition,
+                    'characteristics', CASE WHEN json_valid(wv.characteristics)
+                        THEN json(wv.characteristics) ELSE json_array() END,
+                    'examples', CASE WHEN json_valid(wv.examples)
+                        THEN json(wv.examples) ELSE json_array() END,
+                    'non_examples', CASE WHEN json_valid(wv.non_examples)
+                        THEN json(wv.non_examples) ELSE json_array() END,
+                    'levels', (
+                        SELECT json_group_array(json(doc))
+                        FROM (
+                            SELECT json_object(
+                                'id', l.id, 'name', l.name, 'description', l.description
+                            ) AS doc
+                            FROM WordVersionLevels wvl
+                            JOIN Levels l ON l.id = wvl.level_id
+                            WHERE wvl.word_version_id = wv.id
+                            ORDER BY l.id
+                        )
+                    ),
+                    'topics', (
+                        SELECT json_group_array(json(doc))
+                        FROM (
+                            SELECT json_object(
+                                'id', t.id,
+                                'code', t.code,
+                                'name', t.name,
+                                'course', json_object(
+                                    'id', c.id,
+                                    'name', c.name,
+                                    'slug', c.slug,
+                                    'level', CASE WHEN cl.id IS NULL THEN NULL
+                                        ELSE json_object(
+                                            'id', cl.id,
+                                            'name', cl.name,
+                                            'description', cl.description
+                                        ) END
+                                )
+                            ) AS doc
+                            FROM WordVersionContexts wvc
+                            JOIN Topics t ON t.id = wvc.topic_id
+                            JOIN Courses c ON c.id = t.course_id
+                            LEFT JOIN Levels cl ON cl.id = c.level_id
+                            WHERE wvc.word_version_id = wv.id
+                            ORDER BY t.code
+                        )
+                    )
+                ) AS doc
+                FROM WordVersions wv
+                WHERE wv.word_id = w.id
+                ORDER BY wv.created_at DESC
+            )
+        )
+    ) AS document
+FROM Words w
+JOIN Subjects s ON s.id = w.subject_id
+WHERE :word_ids IS NULL OR w.id IN (SELECT value FROM json_each(:word_ids))
+"""
+
+UPSERT_SQL = f"""
+INSERT INTO WordDocuments (word_id, document)
+SELECT word_id, document FROM ({WORD_DOCUMENT_SQL})
+WHERE true
+ON CONFLICT (word_id) DO UPDATE SET
+    document = excluded.document,
+    updated_at = CURRENT_TIMESTAMP
+WHERE document IS NOT excluded.document
+"""
+
+PRUNE_SQL = """
+DELETE FROM WordDocuments
+WHERE word_id NOT IN (SELECT id FROM Words)
+"""
+
+
+def refresh_word_documents(
+    conn: sqlite3.Connection, word_ids: list[int] | None = None
+) -> tuple[int, int]:
+    """Rebuild the documents of changed words and drop those of deleted ones.
+
+    Args:
+        conn: An open connection; the caller commits.
+        word_ids: Only consider these words (e.g. both sides of a new
+            relationship). None considers every word.
+
+    Returns:
+        (documents written, documents removed)
+    """
+    ids = None if word_ids is None else json.dumps(sorted(set(word_ids)))
+    written = conn.execute(UPSERT_SQL, {"word_ids": ids}).rowcount
+    removed = conn.execute(PRUNE_SQL).rowcount
+    return written, removed
+
+
+def refresh_and_report(conn: sqlite3.Connection) -> None:
+    """Refresh every word's document and print an importer status line."""
+    written, removed = refresh_word_documents(conn)
+    print(f"✓ Word documents: {written} rebuilt, {removed} removed")
@@ -1,210 +1,94 @@
 import sqlite3
-import pandas as pd
 import streamlit as st
+import math
 import os
+import sys
+
+# Allow `streamlit run importer/word_relationships.py` to import the package
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from importer.migrate import apply_migrations
+from importer.relationship_candidates import (
+    apply_reviews,
+    count_candidates,
+    detect_candidates,
+    get_candidate_page,
+    save_ignored_pairs,
+)
 
 # ================================================================
 # Configuration
 # ================================================================
 
-BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 DB_FILE = os.path.join(BASE_DIR, "db", "Words.db")
 IGNORE_FILE = os.path.join(BASE_DIR, "ignored_relationships.txt")
 
-conn = sqlite3.connect(DB_FILE)
+PAGE_SIZES = (10, 25, 50, 100)
 
 
-# ================================================================
-# Helpers
-# ================================================================
+@st.cache_resource(max_entries=1)
+def open_db(db_inode: int) -> sqlite3.Connection:
+    """Connect and bring an older database up to date, once per file.
 
-
-def load_ignore_list():
-    """
-    Load ignored relationships from file.
-    Only returns ID pairs, but the file contains word + subject info too.
+    Migrating takes a write lock, so it must not run on every rerun. Keyed on
+    the inode so the file `importer build` swaps in gets its own connection.
     """
-    ignored = set()
-
-    if os.path.exists(IGNORE_FILE):
-        with open(IGNORE_FILE, "r", encoding="utf-8") as f:
-            for line in f:
-                parts = line.strip().split(",")
-                # Expected format:
-                # id1,word1,subject1,id2,word2,subject2
-                if len(parts) == 6:
-                    id1, _, _, id2, _, _ = parts
-                    a, b = sorted((int(id1), int(id2)))
-                    ignored.add((a, b))
-
-    return ignored
-
-
-def save_ignored_pairs(pairs, df_words):
-    """
-    Write ignored pairs to file including:
-    id1,word1,subject_slug1,id2,word2,subject_slug2
-    """
-    if not pairs:
-        return
+    conn = sqlite3.connect(DB_FILE, check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    apply_migrations(conn)
+    return conn
 
-    with open(IGNORE_FILE, "a", encoding="utf-8") as f:
-        for id1, id2 in pairs:
-            a, b = sorted((id1, id2))
 
-            row_a = df_words.loc[df_words["word_id"] == a].iloc[0]
-            row_b = df_words.loc[df_words["word_id"] == b].iloc[0]
-
-            subj1 = row_a["subject_slug"]
-            subj2 = row_b["subject_slug"]
-
-            f.write(f"{a},{row_a['word']},{subj1},{b},{row_b['word']},{subj2}\n")
+conn = open_db(os.stat(DB_FILE).st_ino)
 
 
 # ================================================================
-# Load DB Data
+# Streamlit UI
 # ================================================================
 
 
-@st.cache_data(show_spinner=False)
-def load_word_data():
-    """
-    Load words, WordVersions text, synonyms, and subject slug.
-    """
-    df_words = pd.read_sql_query(
-        """
-        SELECT 
-            w.id AS word_id,
-            w.word AS word,
-            s.slug AS subject_slug,
-            LOWER(GROUP_CONCAT(COALESCE(wv.definition, ''), ' ')) AS definition,
-            LOWER(GROUP_CONCAT(COALESCE(wv.characteristics, ''), ' ')) AS characteristics,
-            LOWER(GROUP_CONCAT(COALESCE(wv.examples, ''), ' ')) AS examples,
-            LOWER(GROUP_CONCAT(COALESCE(wv.non_examples, ''), ' ')) AS non_examples
-        FROM Words w
-        JOIN Subjects s ON s.id = w.subject_id
-        LEFT JOIN WordVersions wv ON w.id = wv.word_id
-        GROUP BY w.id
-        """,
-        conn,
-    )
-
-    # Combine all text into a single field
-    df_words["all_text"] = (
-        df_words["definition"].fillna("")
-        + " "
-        + df_words["characteristics"].fillna("")
-        + " "
-        + df_words["examples"].fillna("")
-        + " "
-        + df_words["non_examples"].fillna("")
-    ).astype(str)
-
-    # Load synonyms
-    df_syns = pd.read_sql_query(
-        "SELECT word_id, LOWER(synonym) AS synonym FROM Synonyms",
-        conn,
-    )
-
-    synmap = df_syns.groupby("word_id")["synonym"].apply(list).to_dict()
-
-    df_words["synonyms"] = (
-        df_words["word_id"]
-        .map(synmap)
-        .fillna("")
-        .apply(lambda x: x if isinstance(x, list) else [])
-    )
-
-    # Add synonyms to searchable block
-    df_words["all_text"] += " " + df_words["synonyms"].apply(lambda s: " ".join(s))
-
-    return df_words
+def render_detection_controls():
+    """Detection is O(n²), so it only runs when explicitly requested."""
+    st.markdown("**Detection**")
+    if st.button("Detect new candidates"):
+        with st.spinner("Scanning words for candidate relationships..."):
+            added = detect_candidates(conn, IGNORE_FILE)
+        st.success(f"Queued {added} new candidate relationships.")
 
 
-def load_existing_relationships():
-    rel = pd.read_sql_query(
-        "SELECT word_id1, word_id2 FROM WordRelationships",
-        conn,
+def select_page(total: int) -> tuple[int, int]:
+    """Return (offset, limit) for the page of candidates to review."""
+    page_size = st.selectbox("Candidates per page", PAGE_SIZES, index=1)
+    page_count = max(1, math.ceil(total / page_size))
+    page = st.number_input(
+        "Page", min_value=1, max_value=page_count, value=1, step=1
     )
-
-    return {
-        tuple(sorted((row["word_id1"], row["word_id2"]))) for _, row in rel.iterrows()
-    }
-
-
-# ================================================================
-# Relationship Detection
-# ================================================================
-
-
-def find_candidate_relationships(df_words, existing_pairs, ignored_pairs):
-    """Find relationships based on text and synonyms."""
-    relationships = set()
-
-    for i, row_i in df_words.iterrows():
-        id_i = row_i["word_id"]
-        word_i = row_i["word"].lower()
-        synonyms_i = row_i["synonyms"]
-
-        for j, row_j in df_words.iterrows():
-            if i == j:
-                continue
-
-            id_j = row_j["word_id"]
-            combined = row_j["all_text"]
-
-            if not combined:
-                continue
-
-            direct_match = word_i in combined
-            synonym_match = any(s in combined for s in synonyms_i)
-
-            if direct_match or synonym_match:
-                pair = tuple(sorted((id_i, id_j)))
-                relationships.add(pair)
-
-    # Exclude already-existing + ignored
-    new_pairs = [
-        (a, b)
-        for (a, b) in relationships
-        if (a, b) not in existing_pairs and (a, b) not in ignored_pairs
-    ]
-
-    rows = []
-    for a, b in new_pairs:
-        w1 = df_words.loc[df_words["word_id"] == a, "word"].iloc[0]
-        w2 = df_words.loc[df_words["word_id"] == b, "word"].iloc[0]
-        rows.append((a, w1, b, w2))
-
-    return pd.DataFrame(rows, columns=["id1", "word1", "id2", "word2"])
-
-
-# ================================================================
-# Streamlit UI
-# ================================================================
+    st.caption(f"Page {page} of {page_count}")
+    return (page - 1) * page_size, page_size
 
 
 def main():
     st.title("Approve Word Relationships")
 
-    df_words = load_word_data()
-    existing_pairs = load_existing_relationships()
-    ignored_pairs = load_ignore_list()
-
-    candidates_df = find_candidate_relationships(
-        df_words, existing_pairs, ignored_pairs
-    )
+    with st.sidebar:
+        render_detection_controls()
+        st.divider()
+        total = count_candidates(conn)
+        offset, limit = select_page(total)
 
-    if candidates_df.empty:
-        st.info("No new candidate relationships found.")
+    if total == 0:
+        st.info("No pending candidate relationships. Run detection to look for more.")
         return
 
+    candidates = get_candidate_page(conn, offset, limit)
+
     approved = []
     ignored = []
 
-    st.write("Review each proposed relationship:")
+    st.write(f"Review each proposed relationship ({total} pending):")
 
-    for _, row in candidates_df.iterrows():
+    for row in candidates:
         st.markdown(f"### **{row['word1']} ↔ {row['word2']}**")
 
         choice = st.radio(
@@ -225,27 +109,16 @@ def main():
     # -------------------------------------------------------------------
 
     if st.button("Apply changes"):
-        # Save approved relationships
-        with conn:
-            for id1, id2 in approved:
-                a, b = sorted((id1, id2))
-                try:
-                    conn.execute(
-                        """
-                        INSERT INTO WordRelationships (word_id1, word_id2)
-                        VALUES (?, ?)
-                        """,
-                        (a, b),
-                    )
-                except sqlite3.IntegrityError:
-                    pass
+        apply_reviews(conn, approved, ignored)
 
         # Save ignored pairs (with word + subject metadata)
-        save_ignored_pairs(ignored, df_words)
+        save_ignored_pairs(conn, IGNORE_FILE, ignored)
 
-        st.success(
+        st.toast(
             f"Saved {len(approved)} approved and {len(ignored)} ignored relationships."
         )
+        # Reviewed candidates have left the queue, so reload the page
+        st.rerun()
 
 
 # ================================================================